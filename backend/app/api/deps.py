@@ -1,6 +1,6 @@
 from functools import lru_cache
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,7 +11,7 @@ from app.collector.prometheus import PrometheusCollector
 from app.core.config import get_settings
 from app.core.security import decode_token
 from app.db.models import ManagedCluster, User
-from app.db.session import get_db
+from app.db.session import AsyncSessionLocal, get_db
 from app.repository.ai_task import AITaskRepository
 from app.repository.audit import AuditRepository
 from app.repository.cluster import ClusterRepository
@@ -20,11 +20,17 @@ from app.service.ai import AIService
 from app.service.alerts import AlertService
 from app.service.audit import AuditService
 from app.service.cluster import ClusterService
+from app.service.fleet import FleetOverviewService
+from app.service.log_follow import LogFollowService
 from app.service.metrics import MetricsService
 from app.service.overview import OverviewService
+from app.service.overview_stream import OverviewBroadcaster
 from app.service.resources import ResourceService
+from app.service.scheduler import CollectionScheduler
+from app.service.snapshots import SnapshotStore
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
 
 
 @lru_cache
@@ -57,14 +63,64 @@ def get_k8s_collector() -> KubernetesCollector:
     return KubernetesCollector(get_settings())
 
 
+@lru_cache
+def get_snapshot_store() -> SnapshotStore:
+    return SnapshotStore()
+
+
+@lru_cache
+def get_collection_scheduler() -> CollectionScheduler:
+    settings = get_settings()
+    return CollectionScheduler(
+        get_k8s_collector(),
+        get_prometheus_collector(),
+        get_snapshot_store(),
+        get_cluster_repository(),
+        AsyncSessionLocal,
+        intervals=settings.scheduler_intervals,
+        include_default=settings.use_mock_data or bool(settings.k8s_api_url),
+        jitter_ratio=settings.scheduler_jitter_ratio,
+        max_backoff_seconds=settings.scheduler_max_backoff_seconds,
+        staleness_factor=settings.scheduler_staleness_factor,
+        cluster_refresh_seconds=settings.scheduler_cluster_refresh_seconds,
+    )
+
+
 @lru_cache
 def get_alert_service() -> AlertService:
-    return AlertService(get_k8s_collector(), get_prometheus_collector())
+    return AlertService(get_k8s_collector(), get_prometheus_collector(), get_snapshot_store())
 
 
 @lru_cache
 def get_overview_service() -> OverviewService:
-    return OverviewService(get_k8s_collector(), get_prometheus_collector(), get_alert_service())
+    return OverviewService(
+        get_k8s_collector(),
+        get_prometheus_collector(),
+        get_alert_service(),
+        source_timeout_seconds=get_settings().overview_source_timeout_seconds,
+        snapshots=get_snapshot_store(),
+    )
+
+
+@lru_cache
+def get_overview_broadcaster() -> OverviewBroadcaster:
+    return OverviewBroadcaster(
+        get_overview_service(),
+        interval_seconds=get_settings().overview_stream_interval_seconds,
+    )
+
+
+@lru_cache
+def get_fleet_overview_service() -> FleetOverviewService:
+    settings = get_settings()
+    return FleetOverviewService(
+        get_overview_service(),
+        get_cluster_repository(),
+        AsyncSessionLocal,
+        refresh_interval_seconds=settings.fleet_refresh_interval_seconds,
+        max_concurrency=settings.fleet_max_concurrency,
+        cluster_timeout_seconds=settings.fleet_cluster_timeout_seconds,
+    )
 
 
 @lru_cache
@@ -74,7 +130,23 @@ def get_metrics_service() -> MetricsService:
 
 @lru_cache
 def get_resource_service() -> ResourceService:
-    return ResourceService(get_k8s_collector(), get_prometheus_collector(), get_audit_repository())
+    return ResourceService(
+        get_k8s_collector(),
+        get_prometheus_collector(),
+        get_audit_repository(),
+        snapshots=get_snapshot_store(),
+    )
+
+
+@lru_cache
+def get_log_follow_service() -> LogFollowService:
+    settings = get_settings()
+    return LogFollowService(
+        get_k8s_collector(),
+        max_follows_per_user=settings.log_follow_max_per_user,
+        batch_interval_seconds=settings.log_follow_batch_interval_seconds,
+        batch_max_bytes=settings.log_follow_batch_max_bytes,
+    )
 
 
 @lru_cache
@@ -89,6 +161,10 @@ def get_cluster_service() -> ClusterService:
         k8s_collector=get_k8s_collector(),
         prometheus_collector=get_prometheus_collector(),
         settings=get_settings(),
+        alert_service=get_alert_service(),
+        snapshots=get_snapshot_store(),
+        scheduler=get_collection_scheduler(),
+        broadcaster=get_overview_broadcaster(),
     )
 
 
@@ -126,6 +202,16 @@ async def get_current_user(
     return user
 
 
+async def get_streaming_user(
+    header_token: str | None = Depends(optional_oauth2_scheme),
+    token: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    # EventSource cannot set headers, so streams also take the token as a query parameter,
+    # like /ws/overview does.
+    return await get_current_user(token=header_token or token or "", db=db)
+
+
 async def resolve_cluster_by_id(
     *,
     db: AsyncSession,
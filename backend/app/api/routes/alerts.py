@@ -1,3 +1,5 @@
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,6 +19,7 @@ router = APIRouter(prefix="/alerts", tags=["alerts"])
 async def alerts(
     namespace: str | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=200),
+    order: Literal["time", "severity"] = Query(default="time"),
     cluster_id: str | None = Query(default=None),
     db: AsyncSession = Depends(get_db),
     _user=Depends(get_current_user),
@@ -33,4 +36,4 @@ async def alerts(
         code = status.HTTP_404_NOT_FOUND if "not found" in str(exc).lower() else status.HTTP_400_BAD_REQUEST
         raise HTTPException(status_code=code, detail=str(exc)) from exc
 
-    return await service.get_alerts(namespace=namespace, limit=limit, cluster=cluster)
+    return await service.get_alerts(namespace=namespace, limit=limit, cluster=cluster, order=order)
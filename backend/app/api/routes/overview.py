@@ -4,11 +4,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import (
     get_cluster_repository,
     get_current_user,
+    get_fleet_overview_service,
     get_overview_service,
     resolve_cluster_by_id,
 )
 from app.db.session import get_db
-from app.schemas.overview import ClusterSummary
+from app.schemas.overview import ClusterSummary, FleetOverview
 
 router = APIRouter(prefix="/overview", tags=["overview"])
 
@@ -32,3 +33,11 @@ async def summary(
         raise HTTPException(status_code=code, detail=str(exc)) from exc
 
     return await service.get_cluster_summary(cluster=cluster)
+
+
+@router.get("/fleet", response_model=FleetOverview)
+async def fleet(
+    _user=Depends(get_current_user),
+    service=Depends(get_fleet_overview_service),
+) -> FleetOverview:
+    return await service.get_fleet()
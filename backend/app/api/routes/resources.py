@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
     get_cluster_repository,
     get_current_user,
+    get_log_follow_service,
     get_resource_service,
+    get_streaming_user,
     resolve_cluster_by_id,
 )
 from app.db.models import User
@@ -18,6 +21,7 @@ from app.schemas.resource import (
     ScaleRequest,
     WorkloadListResponse,
 )
+from app.service.log_follow import LogFollowLimitError
 
 router = APIRouter(prefix="/resources", tags=["resources"])
 
@@ -28,6 +32,9 @@ async def list_resources(
     namespace: str | None = Query(default=None),
     label_selector: str | None = Query(default=None),
     status_filter: str | None = Query(default=None, alias="status"),
+    node: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    cursor: str | None = Query(default=None),
     cluster_id: str | None = Query(default=None),
     db: AsyncSession = Depends(get_db),
     _user=Depends(get_current_user),
@@ -45,6 +52,9 @@ async def list_resources(
             namespace=namespace,
             label_selector=label_selector,
             status=status_filter,
+            node=node,
+            limit=limit,
+            cursor=cursor,
             cluster=cluster,
         )
     except ValueError as exc:
@@ -90,6 +100,7 @@ async def get_resource_logs(
     name: str,
     namespace: str = Query(...),
     log_lines: int = Query(default=120, ge=10, le=2000),
+    all_pods: bool = Query(default=False),
     cluster_id: str | None = Query(default=None),
     db: AsyncSession = Depends(get_db),
     _user=Depends(get_current_user),
@@ -108,12 +119,56 @@ async def get_resource_logs(
             namespace=namespace,
             log_lines=log_lines,
             cluster=cluster,
+            all_pods=all_pods,
         )
     except ValueError as exc:
         code = status.HTTP_404_NOT_FOUND if "not found" in str(exc).lower() else status.HTTP_400_BAD_REQUEST
         raise HTTPException(status_code=code, detail=str(exc)) from exc
 
 
+@router.get("/{kind}/{name}/logs/follow")
+async def follow_resource_logs(
+    kind: ResourceKind,
+    name: str,
+    namespace: str = Query(...),
+    log_lines: int = Query(default=120, ge=0, le=2000),
+    cluster_id: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_streaming_user),
+    service=Depends(get_log_follow_service),
+    cluster_repo=Depends(get_cluster_repository),
+) -> StreamingResponse:
+    try:
+        cluster = await resolve_cluster_by_id(
+            db=db,
+            cluster_id=cluster_id,
+            cluster_repo=cluster_repo,
+        )
+        events = await service.follow(
+            username=user.username,
+            kind=kind,
+            name=name,
+            namespace=namespace,
+            tail_lines=log_lines,
+            cluster=cluster,
+        )
+    except LogFollowLimitError as exc:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)) from exc
+    except ValueError as exc:
+        code = status.HTTP_404_NOT_FOUND if "not found" in str(exc).lower() else status.HTTP_400_BAD_REQUEST
+        raise HTTPException(status_code=code, detail=str(exc)) from exc
+    finally:
+        # get_db only closes after the response ends; a follow can run for hours, so hand the
+        # pooled connection back before streaming starts.
+        await db.close()
+
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/{kind}/{name}/scale", response_model=ResourceActionResponse)
 async def scale_resource(
     kind: ResourceKind,
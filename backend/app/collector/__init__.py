@@ -1,4 +1,4 @@
-from app.collector.kubernetes import KubernetesCollector
+from app.collector.kubernetes import KubernetesCollector, ResourcePage
 from app.collector.prometheus import PrometheusCollector
 
-__all__ = ["KubernetesCollector", "PrometheusCollector"]
+__all__ = ["KubernetesCollector", "PrometheusCollector", "ResourcePage"]
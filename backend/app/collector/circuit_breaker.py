@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+# Trips keep counting through long outages; the doubling stops well before floats overflow.
+_MAX_BACKOFF_EXPONENT = 16
+
+
+class CircuitOpenError(httpx.TransportError):
+    def __init__(
+        self,
+        upstream: str,
+        retry_in: float,
+        request: httpx.Request | None = None,
+    ) -> None:
+        super().__init__(
+            f"Circuit for {upstream} is open; next probe in {retry_in:.0f}s",
+            request=request,
+        )
+        self.upstream = upstream
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class BreakerConfig:
+    failure_rate_threshold: float = 0.5
+    minimum_calls: int = 5
+    window_seconds: float = 30
+    open_seconds: float = 5
+    max_open_seconds: float = 300
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        config: BreakerConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.config = config
+        self.clock = clock
+        self.state: CircuitState = "closed"
+        self.trips = 0
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures = 0
+        self._open_until = 0.0
+        self._probing = False
+
+    @property
+    def retry_in(self) -> float:
+        return max(self._open_until - self.clock(), 0.0)
+
+    def before_call(self, request: httpx.Request | None = None) -> bool:
+        if self.state == "closed":
+            return False
+        if self.state == "open" and self.clock() >= self._open_until:
+            self.state = "half_open"
+        # Half-open lets exactly one probe through; everyone else keeps failing fast.
+        if self.state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        raise CircuitOpenError(self.name, self.retry_in, request=request)
+
+    def record_success(self) -> None:
+        # Calls that were already in flight when the breaker opened do not decide anything.
+        if self.state == "open":
+            return
+        if self.state == "half_open":
+            logger.info("circuit %s closed after a successful probe", self.name)
+            self.state = "closed"
+            self.trips = 0
+            self._probing = False
+            self._reset_window()
+            return
+        self._record(failed=False)
+
+    def record_failure(self) -> None:
+        if self.state == "open":
+            return
+        if self.state == "half_open":
+            self._probing = False
+            self._open()
+            return
+        self._record(failed=True)
+        calls = len(self._outcomes)
+        if (
+            calls >= self.config.minimum_calls
+            and self._failures / calls >= self.config.failure_rate_threshold
+        ):
+            self._open()
+
+    def release(self) -> None:
+        # A cancelled probe says nothing about the upstream; let the next caller probe instead.
+        self._probing = False
+
+    def stats(self) -> dict[str, Any]:
+        self._prune(self.clock())
+        calls = len(self._outcomes)
+        return {
+            "state": self.state,
+            "failure_rate": round(self._failures / calls, 3) if calls else 0.0,
+            "calls": calls,
+            "trips": self.trips,
+            "retry_in_seconds": round(self.retry_in, 1),
+        }
+
+    def _open(self) -> None:
+        self.trips += 1
+        backoff = 2 ** min(self.trips - 1, _MAX_BACKOFF_EXPONENT)
+        delay = min(self.config.open_seconds * backoff, self.config.max_open_seconds)
+        self.state = "open"
+        self._open_until = self.clock() + delay
+        self._reset_window()
+        logger.warning("circuit %s opened; next probe in %.0fs", self.name, delay)
+
+    def _record(self, failed: bool) -> None:
+        now = self.clock()
+        self._prune(now)
+        self._outcomes.append((now, failed))
+        self._failures += failed
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.config.window_seconds
+        while self._outcomes and self._outcomes[0][0] < horizon:
+            _, failed = self._outcomes.popleft()
+            self._failures -= failed
+
+    def _reset_window(self) -> None:
+        self._outcomes.clear()
+        self._failures = 0
+
+
+class CircuitBreakerRegistry:
+    def __init__(self, config: BreakerConfig, clock: Callable[[], float] = time.monotonic) -> None:
+        self.config = config
+        self.clock = clock
+        self._breakers: dict[tuple[str, str], CircuitBreaker] = {}
+
+    def get(self, pool_key: str, origin: str) -> CircuitBreaker:
+        breaker = self._breakers.get((pool_key, origin))
+        if breaker is None:
+            breaker = CircuitBreaker(f"{pool_key}:{origin}", self.config, self.clock)
+            self._breakers[(pool_key, origin)] = breaker
+        return breaker
+
+    def discard(self, pool_key: Hashable) -> None:
+        for key in [key for key in self._breakers if key[0] == pool_key]:
+            del self._breakers[key]
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {breaker.name: breaker.stats() for breaker in self._breakers.values()}
+
+
+class CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        breakers: CircuitBreakerRegistry,
+        pool_key: str,
+    ) -> None:
+        self.transport = transport
+        self.breakers = breakers
+        self.pool_key = pool_key
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # Breakers are per origin so connection probes against other hosts cannot trip this one.
+        origin = f"{request.url.scheme}://{request.url.netloc.decode()}"
+        breaker = self.breakers.get(self.pool_key, origin)
+        probe = breaker.before_call(request)
+        try:
+            response = await self.transport.handle_async_request(request)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            if probe:
+                breaker.release()
+            raise
+        # Client errors and throttling are answers from a healthy server.
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
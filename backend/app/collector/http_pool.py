@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, replace
+from typing import Any
+
+import httpx
+
+from app.collector.circuit_breaker import CircuitBreakerRegistry, CircuitBreakerTransport
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_ALLOWED_OVERRIDES = {
+    "verify",
+    "http2",
+    "max_connections",
+    "max_keepalive_connections",
+    "keepalive_expiry_seconds",
+}
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    timeout: float = 15
+    verify: bool = True
+    http2: bool = True
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 30.0
+
+
+@dataclass
+class _PoolEntry:
+    client: httpx.AsyncClient
+    config: PoolConfig
+    last_used: float
+    tracker: _TrackingTransport
+
+
+class _TrackingTransport(httpx.AsyncBaseTransport):
+    # Counts responses whose body is still open, so the reaper never closes a client under
+    # a log follow or an informer watch that has been streaming longer than the idle window.
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+        self.open_responses = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        # Responses built from in-memory content arrive already read and closed.
+        if response.is_closed:
+            return response
+        self.open_responses += 1
+        response.stream = _ReleasingStream(response.stream, self._release)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def _release(self) -> None:
+        self.open_responses -= 1
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self.stream = stream
+        self.release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            if self.release is not None:
+                self.release()
+                self.release = None
+
+
+class HttpClientPool:
+    def __init__(
+        self,
+        defaults: PoolConfig,
+        overrides: dict[str, dict[str, Any]] | None = None,
+        idle_seconds: float = 600,
+        transport: httpx.AsyncBaseTransport | None = None,
+        breakers: CircuitBreakerRegistry | None = None,
+    ) -> None:
+        self.defaults = defaults
+        self.overrides = overrides or {}
+        self.idle_seconds = idle_seconds
+        self.transport = transport
+        self.breakers = breakers
+        self._pools: dict[str, _PoolEntry] = {}
+        self._last_reap = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    def config_for(self, pool_key: str) -> PoolConfig:
+        override = {
+            key: value
+            for key, value in (self.overrides.get(pool_key) or {}).items()
+            if key in _ALLOWED_OVERRIDES
+        }
+        if not override:
+            return self.defaults
+        return replace(self.defaults, **override)
+
+    async def get(self, pool_key: str) -> httpx.AsyncClient:
+        now = time.monotonic()
+        if now - self._last_reap >= min(self.idle_seconds, 60):
+            await self.reap_idle(now)
+
+        entry = self._pools.get(pool_key)
+        if entry is None or entry.client.is_closed:
+            config = self.config_for(pool_key)
+            tracker = self._build_transport(pool_key, config)
+            entry = _PoolEntry(
+                client=self._build_client(config, tracker),
+                config=config,
+                last_used=now,
+                tracker=tracker,
+            )
+            self._pools[pool_key] = entry
+        entry.last_used = now
+        return entry.client
+
+    async def reap_idle(self, now: float | None = None) -> int:
+        now = time.monotonic() if now is None else now
+        self._last_reap = now
+        idle = [
+            key
+            for key, entry in self._pools.items()
+            if now - entry.last_used >= self.idle_seconds and not entry.tracker.open_responses
+        ]
+        for key in idle:
+            await self.close(key)
+        return len(idle)
+
+    async def close(self, pool_key: str) -> None:
+        entry = self._pools.pop(pool_key, None)
+        if entry is not None:
+            await entry.client.aclose()
+
+    async def close_all(self) -> None:
+        entries = list(self._pools.values())
+        self._pools.clear()
+        for entry in entries:
+            await entry.client.aclose()
+
+    def _build_transport(self, pool_key: str, config: PoolConfig) -> _TrackingTransport:
+        http2 = config.http2 and HTTP2_AVAILABLE
+        if config.http2 and not HTTP2_AVAILABLE:
+            logger.debug("h2 is not installed; falling back to HTTP/1.1 connection pools")
+        transport = self.transport or httpx.AsyncHTTPTransport(
+            verify=config.verify,
+            http2=http2,
+            limits=_limits(config),
+        )
+        if self.breakers is not None:
+            transport = CircuitBreakerTransport(transport, self.breakers, pool_key)
+        return _TrackingTransport(transport)
+
+    @staticmethod
+    def _build_client(config: PoolConfig, transport: httpx.AsyncBaseTransport) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=config.timeout,
+            verify=config.verify,
+            http2=config.http2 and HTTP2_AVAILABLE,
+            transport=transport,
+            limits=_limits(config),
+        )
+
+
+def _limits(config: PoolConfig) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry_seconds,
+    )
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable
+from typing import Any
+
+import httpx
+
+from app.collector.selectors import LabelIndex, LabelSelector
+
+logger = logging.getLogger(__name__)
+
+ListFn = Callable[[dict[str, Any]], AsyncIterator[dict[str, Any]]]
+WatchFn = Callable[[str], AsyncIterator[dict[str, Any]]]
+RecordFactory = Callable[[dict[str, Any]], Any]
+IndexFn = Callable[[dict[str, Any]], Iterable[Hashable]]
+
+
+class WatchExpiredError(Exception):
+    pass
+
+
+class ResourceStore:
+    # Holds one value per object: the compact record when the store is built record-only,
+    # otherwise the (stripped) object itself, with records derived from it on demand.
+
+    def __init__(
+        self,
+        record_factory: RecordFactory | None = None,
+        indexers: dict[str, IndexFn] | None = None,
+        keep_objects: bool = True,
+    ) -> None:
+        self._by_namespace: dict[str, dict[str, Any]] = {}
+        self._labels = LabelIndex()
+        self._record_factory = record_factory
+        self._keep_objects = keep_objects or record_factory is None
+        self._indexers = indexers or {}
+        self._indices: dict[str, dict[Hashable, set[tuple[str, str]]]] = {
+            name: {} for name in self._indexers
+        }
+        self._indexed: dict[tuple[str, str], dict[str, tuple[Hashable, ...]]] = {}
+        self.resource_version = ""
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._by_namespace.values())
+
+    def replace(self, items: Iterable[dict[str, Any]], resource_version: str) -> None:
+        staged = self.empty()
+        for item in items:
+            staged.upsert(item)
+        self.adopt(staged, resource_version)
+
+    def empty(self) -> ResourceStore:
+        return ResourceStore(self._record_factory, self._indexers, self._keep_objects)
+
+    def adopt(self, staged: ResourceStore, resource_version: str) -> None:
+        self._by_namespace = staged._by_namespace
+        self._labels = staged._labels
+        self._indices = staged._indices
+        self._indexed = staged._indexed
+        self.resource_version = resource_version
+
+    def upsert(self, item: dict[str, Any]) -> None:
+        namespace, name = self._key(item)
+        if self._record_factory is not None and not self._keep_objects:
+            self._by_namespace.setdefault(namespace, {})[name] = self._record_factory(item)
+        else:
+            self._by_namespace.setdefault(namespace, {})[name] = item
+        self._labels.add((namespace, name), item.get("metadata", {}).get("labels"))
+        self._unindex((namespace, name))
+        self._index((namespace, name), item)
+
+    def delete(self, item: dict[str, Any]) -> None:
+        namespace, name = self._key(item)
+        self._labels.remove((namespace, name))
+        self._unindex((namespace, name))
+        bucket = self._by_namespace.get(namespace)
+        if bucket is None:
+            return
+        bucket.pop(name, None)
+        if not bucket:
+            del self._by_namespace[namespace]
+
+    def get(self, namespace: str, name: str) -> Any | None:
+        return self._by_namespace.get(namespace, {}).get(name)
+
+    def list(self, namespace: str | None = None) -> list[Any]:
+        if namespace is not None:
+            return list(self._by_namespace.get(namespace, {}).values())
+        return [item for bucket in self._by_namespace.values() for item in bucket.values()]
+
+    def records(self, namespace: str | None = None) -> list[Any]:
+        return self._as_records(self.list(namespace))
+
+    def select(self, selector: LabelSelector, namespace: str | None = None) -> list[Any]:
+        if selector.empty:
+            return self.list(namespace)
+        keys = sorted(
+            key for key in self._labels.select(selector) if namespace is None or key[0] == namespace
+        )
+        return [self._by_namespace[key[0]][key[1]] for key in keys]
+
+    def by_index(self, index_name: str, value: Hashable) -> list[Any]:
+        keys = sorted(self._indices[index_name].get(value, ()))
+        return self._as_records([self._by_namespace[key[0]][key[1]] for key in keys])
+
+    def _as_records(self, values: list[Any]) -> list[Any]:
+        if self._record_factory is None or not self._keep_objects:
+            return values
+        return [self._record_factory(value) for value in values]
+
+    def _index(self, key: tuple[str, str], item: dict[str, Any]) -> None:
+        if not self._indexers:
+            return
+        indexed: dict[str, tuple[Hashable, ...]] = {}
+        for index_name, index_fn in self._indexers.items():
+            values = tuple(set(index_fn(item)))
+            index = self._indices[index_name]
+            for value in values:
+                index.setdefault(value, set()).add(key)
+            indexed[index_name] = values
+        self._indexed[key] = indexed
+
+    def _unindex(self, key: tuple[str, str]) -> None:
+        for index_name, values in self._indexed.pop(key, {}).items():
+            index = self._indices[index_name]
+            for value in values:
+                keys = index.get(value)
+                if keys is None:
+                    continue
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+
+    @staticmethod
+    def _key(item: dict[str, Any]) -> tuple[str, str]:
+        metadata = item.get("metadata", {})
+        return metadata.get("namespace") or "", metadata.get("name", "")
+
+
+class Informer:
+    def __init__(
+        self,
+        *,
+        name: str,
+        lister: ListFn,
+        watcher: WatchFn,
+        idle_seconds: float = 600,
+        max_backoff_seconds: float = 30,
+        record_factory: RecordFactory | None = None,
+        indexers: dict[str, IndexFn] | None = None,
+        keep_objects: bool = True,
+    ) -> None:
+        self.name = name
+        self.store = ResourceStore(record_factory, indexers, keep_objects)
+        self._lister = lister
+        self._watcher = watcher
+        self._idle_seconds = idle_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._synced = asyncio.Event()
+        self._list_attempted = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._watching = False
+        self._last_sync = 0.0
+        self._last_read = time.monotonic()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def staleness(self) -> float:
+        if not self._synced.is_set():
+            return float("inf")
+        if self._watching:
+            return 0.0
+        return time.monotonic() - self._last_sync
+
+    def is_fresh(self, max_staleness_seconds: float) -> bool:
+        return self.running and self.staleness() <= max_staleness_seconds
+
+    def touch(self) -> None:
+        self._last_read = time.monotonic()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._last_read = time.monotonic()
+        self._synced.clear()
+        self._list_attempted.clear()
+        self._task = asyncio.create_task(self._run(), name=f"informer:{self.name}")
+
+    async def wait_synced(self, timeout: float) -> bool:
+        self.start()
+        try:
+            await asyncio.wait_for(self._list_attempted.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return self._synced.is_set()
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        self._watching = False
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self) -> None:
+        backoff = 1.0
+        needs_list = True
+        while time.monotonic() - self._last_read < self._idle_seconds:
+            try:
+                if needs_list:
+                    await self._list()
+                    needs_list = False
+                await self._watch()
+                backoff = 1.0
+            except WatchExpiredError:
+                logger.info("informer %s: resourceVersion expired, relisting", self.name)
+                needs_list = True
+            except (httpx.HTTPError, ValueError) as exc:
+                self._watching = False
+                if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 410:
+                    needs_list = True
+                    continue
+                logger.warning("informer %s: %s, retrying in %.0fs", self.name, exc, backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self._max_backoff_seconds)
+        self._watching = False
+
+    async def _list(self) -> None:
+        # Items go straight into a staged store as they stream in; readers keep seeing the
+        # previous contents until the relist completes.
+        metadata: dict[str, Any] = {}
+        staged = self.store.empty()
+        try:
+            async for item in self._lister(metadata):
+                staged.upsert(item)
+        finally:
+            self._list_attempted.set()
+        self.store.adopt(staged, metadata.get("resourceVersion", ""))
+        self._last_sync = time.monotonic()
+        self._synced.set()
+
+    async def _watch(self) -> None:
+        self._watching = True
+        try:
+            async for event in self._watcher(self.store.resource_version):
+                self._apply(event)
+                self._last_sync = time.monotonic()
+        finally:
+            self._watching = False
+            self._last_sync = time.monotonic()
+
+    def _apply(self, event: dict[str, Any]) -> None:
+        event_type = event.get("type")
+        obj = event.get("object") or {}
+        if event_type == "ERROR":
+            if obj.get("code") == 410:
+                raise WatchExpiredError(obj.get("message", "resourceVersion too old"))
+            raise ValueError(obj.get("message") or "watch error event")
+
+        resource_version = obj.get("metadata", {}).get("resourceVersion")
+        if event_type in {"ADDED", "MODIFIED"}:
+            self.store.upsert(obj)
+        elif event_type == "DELETED":
+            self.store.delete(obj)
+        if resource_version:
+            self.store.resource_version = resource_version
+
+
+class InformerRegistry:
+    def __init__(self) -> None:
+        self._informers: dict[tuple[str, str], Informer] = {}
+        self._connections: dict[tuple[str, str], Hashable] = {}
+
+    def get(self, cluster_key: str, resource_path: str) -> Informer | None:
+        return self._informers.get((cluster_key, resource_path))
+
+    async def get_or_create(
+        self,
+        cluster_key: str,
+        resource_path: str,
+        factory: Callable[[], Informer],
+        connection: Hashable = None,
+    ) -> Informer:
+        key = (cluster_key, resource_path)
+        informer = self._informers.get(key)
+        # Listers and watchers are bound to the connection they were built with, so an edited
+        # URL or token replaces the informer instead of reusing the old one.
+        if informer is not None and self._connections.get(key) != connection:
+            await self._informers.pop(key).stop()
+            informer = None
+        if informer is None:
+            informer = factory()
+            self._informers[key] = informer
+            self._connections[key] = connection
+        return informer
+
+    async def stop_cluster(self, cluster_key: str) -> None:
+        keys = [key for key in self._informers if key[0] == cluster_key]
+        for key in keys:
+            self._connections.pop(key, None)
+            await self._informers.pop(key).stop()
+
+    async def stop_all(self) -> None:
+        informers = list(self._informers.values())
+        self._informers.clear()
+        self._connections.clear()
+        for informer in informers:
+            await informer.stop()
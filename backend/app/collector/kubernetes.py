@@ -1,16 +1,50 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import bisect
+import functools
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 import httpx
+import orjson
 
+from app.collector import protobuf
+from app.collector.circuit_breaker import BreakerConfig, CircuitBreakerRegistry
+from app.collector.http_pool import HttpClientPool, PoolConfig
+from app.collector.informer import Informer, InformerRegistry
+from app.collector.list_stream import ItemProjection, iter_list_items, project_item, strip_item
+from app.collector.logs import merge_log_streams
+from app.collector.records import EventRecord, NodeRecord, PodRecord, event_object_keys
+from app.collector.selectors import parse_label_selector
+from app.collector.singleflight import SingleFlight
+from app.collector.ttl_cache import TTLCache, cached
 from app.core.config import Settings
 
 if TYPE_CHECKING:
     from app.db.models import ManagedCluster
 
 
+@dataclass
+class ResourcePage:
+    items: list[dict[str, Any]] = field(default_factory=list)
+    cursor: str | None = None
+    total_estimate: int | None = None
+
+
+@dataclass
+class ListQueryPlan:
+    label_selector: str | None = None
+    field_selector: str | None = None
+    local_status: str | None = None
+    server_filters: list[str] = field(default_factory=list)
+    local_filters: list[str] = field(default_factory=list)
+
+
 class KubernetesCollector:
     kind_to_resource = {
         "deployment": ("apps/v1", "deployments"),
@@ -23,28 +57,89 @@ class KubernetesCollector:
 
     scalable_kinds = {"deployment", "statefulset", "daemonset"}
 
+    pod_phases = {"pending", "running", "succeeded", "failed", "unknown"}
+
+    accept_headers = {
+        "object": "application/json",
+        "table": "application/json;as=Table;v=v1;g=meta.k8s.io,application/json",
+        "metadata": "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json",
+    }
+
+    record_factories = {
+        "/api/v1/nodes": NodeRecord.from_object,
+        "/api/v1/pods": PodRecord.from_object,
+        "/api/v1/events": EventRecord.from_object,
+    }
+
+    # Nodes and events are never served as manifests, so their informers keep only records.
+    record_only_stores = {"/api/v1/nodes", "/api/v1/events"}
+
+    store_indexers = {
+        "/api/v1/events": {"involved": event_object_keys},
+    }
+
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self._client: httpx.AsyncClient | None = None
+        self._breakers = CircuitBreakerRegistry(
+            BreakerConfig(
+                failure_rate_threshold=settings.circuit_breaker_failure_rate,
+                minimum_calls=settings.circuit_breaker_minimum_calls,
+                window_seconds=settings.circuit_breaker_window_seconds,
+                open_seconds=settings.circuit_breaker_open_seconds,
+                max_open_seconds=settings.circuit_breaker_max_open_seconds,
+            )
+        )
+        self._pools = HttpClientPool(
+            PoolConfig(
+                timeout=15,
+                verify=settings.k8s_verify_ssl,
+                http2=settings.http_pool_http2,
+                max_connections=settings.http_pool_max_connections,
+                max_keepalive_connections=settings.http_pool_max_keepalive_connections,
+                keepalive_expiry_seconds=settings.http_pool_keepalive_expiry_seconds,
+            ),
+            overrides=settings.http_pool_overrides,
+            idle_seconds=settings.http_pool_idle_seconds,
+            breakers=self._breakers if settings.circuit_breaker_enabled else None,
+        )
+        self._informers = InformerRegistry()
+        self._single_flight = SingleFlight()
+        self._cache = TTLCache(
+            max_bytes=settings.collector_cache_max_bytes,
+            stale_seconds=settings.collector_cache_stale_seconds,
+        )
         self._mock_state = self._build_mock_state()
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=15, verify=self.settings.k8s_verify_ssl)
-        return self._client
+    async def _get_client(self, cluster: ManagedCluster | None = None) -> httpx.AsyncClient:
+        return await self._pools.get(self._cluster_key(cluster))
 
     async def close(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        await self._informers.stop_all()
+        await self._pools.close_all()
+
+    async def forget_cluster(self, cluster_id: str) -> None:
+        await self._informers.stop_cluster(cluster_id)
+        await self._pools.close(cluster_id)
+        self._breakers.discard(cluster_id)
+        self._cache.discard_where(lambda key: key[1] == cluster_id)
 
+    def stats(self) -> dict[str, Any]:
+        return {
+            "single_flight": self._single_flight.stats(),
+            "cache": self._cache.stats(),
+            "pools": len(self._pools),
+            "breakers": self._breakers.stats(),
+        }
+
+    @cached("nodes")
     async def list_nodes(self, cluster: ManagedCluster | None = None) -> list[dict[str, Any]]:
         if self._should_use_mock(cluster):
             return self._mock_state["nodes"]
 
-        payload = await self._request("GET", "/api/v1/nodes", cluster=cluster)
+        payload = await self._list("/api/v1/nodes", cluster=cluster)
         return payload.get("items", [])
 
+    @cached("pods")
     async def list_pods(
         self,
         namespace: str | None = None,
@@ -56,12 +151,17 @@ class KubernetesCollector:
                 return [pod for pod in pods if pod.get("metadata", {}).get("namespace") == namespace]
             return pods
 
+        informer = await self._get_informer("/api/v1/pods", cluster=cluster)
+        if informer:
+            return informer.store.list(namespace)
+
         if namespace:
-            payload = await self._request("GET", f"/api/v1/namespaces/{namespace}/pods", cluster=cluster)
+            payload = await self._list(f"/api/v1/namespaces/{namespace}/pods", cluster=cluster)
         else:
-            payload = await self._request("GET", "/api/v1/pods", cluster=cluster)
+            payload = await self._list("/api/v1/pods", cluster=cluster)
         return payload.get("items", [])
 
+    @cached("events")
     async def list_events(
         self,
         namespace: str | None = None,
@@ -78,40 +178,182 @@ class KubernetesCollector:
             return events
 
         if namespace:
-            payload = await self._request("GET", f"/api/v1/namespaces/{namespace}/events", cluster=cluster)
+            payload = await self._list(f"/api/v1/namespaces/{namespace}/events", cluster=cluster)
         else:
-            payload = await self._request("GET", "/api/v1/events", cluster=cluster)
+            payload = await self._list("/api/v1/events", cluster=cluster)
         return payload.get("items", [])
 
+    async def list_node_records(self, cluster: ManagedCluster | None = None) -> list[NodeRecord]:
+        informer = await self._get_record_informer("/api/v1/nodes", cluster)
+        if informer:
+            return informer.store.records()
+        return [NodeRecord.from_object(node) for node in await self.list_nodes(cluster=cluster)]
+
+    async def list_pod_records(
+        self,
+        namespace: str | None = None,
+        cluster: ManagedCluster | None = None,
+    ) -> list[PodRecord]:
+        informer = await self._get_record_informer("/api/v1/pods", cluster)
+        if informer:
+            return informer.store.records(namespace)
+        pods = await self.list_pods(namespace=namespace, cluster=cluster)
+        return [PodRecord.from_object(pod) for pod in pods]
+
+    async def list_event_records(
+        self,
+        namespace: str | None = None,
+        cluster: ManagedCluster | None = None,
+    ) -> list[EventRecord]:
+        informer = await self._get_record_informer("/api/v1/events", cluster)
+        if informer:
+            return informer.store.records(namespace)
+        events = await self.list_events(namespace=namespace, cluster=cluster)
+        return [EventRecord.from_object(event) for event in events]
+
+    @cached("resources")
     async def list_resources(
         self,
         kind: str,
         namespace: str | None = None,
         label_selector: str | None = None,
         cluster: ManagedCluster | None = None,
+        field_selector: str | None = None,
+        representation: str = "object",
     ) -> list[dict[str, Any]]:
         if kind not in self.kind_to_resource:
             raise ValueError(f"Unsupported kind: {kind}")
 
-        if self._should_use_mock(cluster):
-            items = self._mock_state.get(kind, [])
-            if namespace:
-                items = [item for item in items if item.get("metadata", {}).get("namespace") == namespace]
-            if label_selector:
-                key, _, expected = label_selector.partition("=")
-                if key and expected:
-                    items = [
-                        item
-                        for item in items
-                        if item.get("metadata", {}).get("labels", {}).get(key) == expected
-                    ]
-            return items
+        cached = await self._list_cached_resources(
+            kind=kind,
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            cluster=cluster,
+        )
+        if cached is not None:
+            return cached
 
         path = self._list_path(kind=kind, namespace=namespace)
-        params = {"labelSelector": label_selector} if label_selector else None
-        payload = await self._request("GET", path, params=params, cluster=cluster)
+        params = self._selector_params(label_selector, field_selector)
+        payload = await self._list_as(kind, path, representation, params=params, cluster=cluster)
         return payload.get("items", [])
 
+    async def list_resources_page(
+        self,
+        kind: str,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+        cluster: ManagedCluster | None = None,
+        field_selector: str | None = None,
+        representation: str = "object",
+    ) -> ResourcePage:
+        if kind not in self.kind_to_resource:
+            raise ValueError(f"Unsupported kind: {kind}")
+
+        token = self._decode_cursor(cursor) if cursor else {}
+        offset = int(token.get("offset", 0))
+
+        if "continue" not in token:
+            after = self._after_key(token)
+            items = await self._list_cached_resources(
+                kind=kind,
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                cluster=cluster,
+            )
+            if items is None and after is not None:
+                # The cursor was issued from a local store that is no longer fresh.
+                items = await self.list_resources(
+                    kind=kind,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    field_selector=field_selector,
+                    cluster=cluster,
+                    representation=representation,
+                )
+            if items is not None:
+                # Resume after the last key served rather than at an offset, so objects deleted
+                # or added between pages cannot shift the window and skip or repeat items.
+                items = sorted(items, key=self._item_key)
+                start = 0
+                if after is not None:
+                    start = bisect.bisect_right(items, after, key=self._item_key)
+                page = items[start : start + limit]
+                return ResourcePage(
+                    items=page,
+                    cursor=(
+                        self._encode_cursor({"after": list(self._item_key(page[-1]))})
+                        if start + len(page) < len(items)
+                        else None
+                    ),
+                    total_estimate=len(items),
+                )
+
+        params = {"limit": str(limit), **(self._selector_params(label_selector, field_selector) or {})}
+        if "continue" in token:
+            params["continue"] = str(token["continue"])
+
+        path = self._list_path(kind=kind, namespace=namespace)
+        try:
+            payload = await self._list_as(kind, path, representation, params=params, cluster=cluster)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 410:
+                raise ValueError("Cursor has expired; restart the listing") from exc
+            raise
+
+        items = payload.get("items", [])
+        metadata = payload.get("metadata", {})
+        next_offset = offset + len(items)
+        continue_token = metadata.get("continue")
+        remaining = metadata.get("remainingItemCount")
+        return ResourcePage(
+            items=items,
+            cursor=(
+                self._encode_cursor({"continue": continue_token, "offset": next_offset})
+                if continue_token
+                else None
+            ),
+            total_estimate=next_offset + int(remaining) if remaining is not None else None,
+        )
+
+    def plan_list_query(
+        self,
+        kind: str,
+        label_selector: str | None = None,
+        status: str | None = None,
+        node_name: str | None = None,
+    ) -> ListQueryPlan:
+        if kind not in self.kind_to_resource:
+            raise ValueError(f"Unsupported kind: {kind}")
+
+        parse_label_selector(label_selector)
+        plan = ListQueryPlan(label_selector=label_selector or None)
+        if plan.label_selector:
+            plan.server_filters.append("label_selector")
+
+        field_terms: list[str] = []
+        if node_name:
+            if kind != "pod":
+                raise ValueError("node filter is only supported for pods")
+            field_terms.append(f"spec.nodeName={node_name}")
+            plan.server_filters.append("node")
+
+        if status:
+            # Only pod phase is a real field; workload status is computed locally.
+            if kind == "pod" and status.lower() in self.pod_phases:
+                field_terms.append(f"status.phase={status.lower().capitalize()}")
+                plan.server_filters.append("status")
+            else:
+                plan.local_status = status
+                plan.local_filters.append("status")
+
+        plan.field_selector = ",".join(field_terms) or None
+        return plan
+
     async def get_resource(
         self,
         kind: str,
@@ -129,17 +371,17 @@ class KubernetesCollector:
                     return item
             raise ValueError("Resource not found")
 
+        informer = await self._get_informer(self._list_path(kind=kind, namespace=None), cluster=cluster)
+        if informer:
+            cached = informer.store.get(namespace, name)
+            if cached is not None:
+                return cached
+
         path = self._item_path(kind=kind, name=name, namespace=namespace)
         return await self._request("GET", path, cluster=cluster)
 
-    async def get_related_events(
-        self,
-        kind: str,
-        name: str,
-        namespace: str,
-        cluster: ManagedCluster | None = None,
-    ) -> list[dict[str, Any]]:
-        events = await self.list_events(namespace=namespace, cluster=cluster)
+    @staticmethod
+    def related_event_key(kind: str, name: str, namespace: str) -> tuple[str, str, str]:
         expected_kind = {
             "deployment": "Deployment",
             "statefulset": "StatefulSet",
@@ -148,25 +390,22 @@ class KubernetesCollector:
             "service": "Service",
             "ingress": "Ingress",
         }.get(kind, kind)
+        return (namespace, expected_kind, name)
 
-        related: list[dict[str, Any]] = []
-        for event in events:
-            involved = event.get("involvedObject", {})
-            if (
-                involved.get("name") == name
-                and involved.get("namespace") == namespace
-                and involved.get("kind") == expected_kind
-            ):
-                related.append(event)
-                continue
-
-            # Fallback for incomplete event payloads.
-            message = event.get("message", "")
-            event_ns = event.get("metadata", {}).get("namespace")
-            if event_ns == namespace and name in message:
-                related.append(event)
-
-        return related
+    async def get_related_events(
+        self,
+        kind: str,
+        name: str,
+        namespace: str,
+        cluster: ManagedCluster | None = None,
+    ) -> list[EventRecord]:
+        key = self.related_event_key(kind=kind, name=name, namespace=namespace)
+        informer = await self._get_record_informer("/api/v1/events", cluster)
+        if informer:
+            return informer.store.by_index("involved", key)
+        events = await self.list_events(namespace=namespace, cluster=cluster)
+        records = (EventRecord.from_object(event) for event in events)
+        return [record for record in records if key in record.object_keys]
 
     async def get_resource_logs(
         self,
@@ -175,6 +414,7 @@ class KubernetesCollector:
         namespace: str,
         tail_lines: int = 120,
         cluster: ManagedCluster | None = None,
+        all_pods: bool = False,
     ) -> list[str]:
         if kind == "pod":
             return await self.get_pod_logs(
@@ -184,22 +424,53 @@ class KubernetesCollector:
                 cluster=cluster,
             )
 
+        pods = await self._log_target_pods(kind=kind, name=name, namespace=namespace, cluster=cluster)
+        if not pods:
+            if self._should_use_mock(cluster):
+                return [f"No pod logs available for {kind}/{name} in namespace {namespace}."]
+            return []
+        if all_pods:
+            return await self._get_fanned_out_logs(namespace, pods, tail_lines, cluster)
+
+        pod_name = pods[0].get("metadata", {}).get("name")
+        if not pod_name:
+            return []
+        return await self.get_pod_logs(
+            namespace=namespace,
+            pod_name=pod_name,
+            tail_lines=tail_lines,
+            cluster=cluster,
+        )
+
+    async def resolve_log_pod(
+        self,
+        kind: str,
+        name: str,
+        namespace: str,
+        cluster: ManagedCluster | None = None,
+    ) -> str:
+        if kind == "pod":
+            return name
+        pods = await self._log_target_pods(kind=kind, name=name, namespace=namespace, cluster=cluster)
+        pod_name = pods[0].get("metadata", {}).get("name") if pods else None
+        if not pod_name:
+            raise ValueError(f"Pod not found for {kind}/{name} in namespace {namespace}")
+        return pod_name
+
+    async def _log_target_pods(
+        self,
+        kind: str,
+        name: str,
+        namespace: str,
+        cluster: ManagedCluster | None,
+    ) -> list[dict[str, Any]]:
         if self._should_use_mock(cluster):
             pods = await self.list_pods(namespace=namespace, cluster=cluster)
-            candidates = [
+            return [
                 pod
                 for pod in pods
                 if pod.get("metadata", {}).get("labels", {}).get("app") in {name, name.split("-")[0]}
             ]
-            if not candidates:
-                return [f"No pod logs available for {kind}/{name} in namespace {namespace}."]
-            pod_name = candidates[0].get("metadata", {}).get("name", "")
-            return await self.get_pod_logs(
-                namespace=namespace,
-                pod_name=pod_name,
-                tail_lines=tail_lines,
-                cluster=cluster,
-            )
 
         try:
             resource = await self.get_resource(kind=kind, name=name, namespace=namespace, cluster=cluster)
@@ -215,24 +486,12 @@ class KubernetesCollector:
             return []
 
         selector = self._build_label_selector(match_labels)
-        pods = await self.list_resources(
+        return await self.list_resources(
             kind="pod",
             namespace=namespace,
             label_selector=selector,
             cluster=cluster,
         )
-        if not pods:
-            return []
-
-        pod_name = pods[0].get("metadata", {}).get("name")
-        if not pod_name:
-            return []
-        return await self.get_pod_logs(
-            namespace=namespace,
-            pod_name=pod_name,
-            tail_lines=tail_lines,
-            cluster=cluster,
-        )
 
     async def get_pod_logs(
         self,
@@ -240,6 +499,8 @@ class KubernetesCollector:
         pod_name: str,
         tail_lines: int = 120,
         cluster: ManagedCluster | None = None,
+        container: str | None = None,
+        timestamps: bool = False,
     ) -> list[str]:
         if self._should_use_mock(cluster):
             key = f"{namespace}/{pod_name}"
@@ -258,8 +519,12 @@ class KubernetesCollector:
             headers["Authorization"] = f"Bearer {k8s_bearer_token}"
 
         endpoint = f"{k8s_api_url.rstrip('/')}/api/v1/namespaces/{namespace}/pods/{pod_name}/log"
-        params = {"tailLines": tail_lines}
-        client = await self._get_client()
+        params: dict[str, Any] = {"tailLines": tail_lines}
+        if container:
+            params["container"] = container
+        if timestamps:
+            params["timestamps"] = "true"
+        client = await self._get_client(cluster)
         try:
             response = await client.get(endpoint, params=params, headers=headers)
         except httpx.RequestError as exc:
@@ -281,6 +546,82 @@ class KubernetesCollector:
         suffix = f" {message}" if message else ""
         return [f"Unable to fetch pod logs (HTTP {response.status_code}).{suffix}"]
 
+    async def follow_pod_logs(
+        self,
+        namespace: str,
+        pod_name: str,
+        tail_lines: int = 120,
+        cluster: ManagedCluster | None = None,
+    ) -> AsyncIterator[str]:
+        if self._should_use_mock(cluster):
+            for line in await self.get_pod_logs(namespace, pod_name, tail_lines, cluster):
+                yield line
+            return
+
+        k8s_api_url = self._resolve_k8s_api_url(cluster)
+        if not k8s_api_url:
+            raise ValueError("k8s_api_url is required for real cluster mode")
+
+        headers = {"Accept": "*/*"}
+        k8s_bearer_token = self._resolve_k8s_bearer_token(cluster)
+        if k8s_bearer_token:
+            headers["Authorization"] = f"Bearer {k8s_bearer_token}"
+
+        endpoint = f"{k8s_api_url.rstrip('/')}/api/v1/namespaces/{namespace}/pods/{pod_name}/log"
+        params = {"follow": "true", "tailLines": tail_lines}
+        client = await self._get_client(cluster)
+        # The follow stream stays open until the pod exits or the caller goes away.
+        timeout = httpx.Timeout(client.timeout.connect, read=None)
+        async with client.stream("GET", endpoint, params=params, headers=headers, timeout=timeout) as response:
+            if response.is_error:
+                await response.aread()
+                message = self._extract_error_message(response)
+                suffix = f" {message}" if message else ""
+                raise ValueError(f"Unable to follow pod logs (HTTP {response.status_code}).{suffix}")
+            async for line in response.aiter_lines():
+                if line:
+                    yield line
+
+    async def _get_fanned_out_logs(
+        self,
+        namespace: str,
+        pods: list[dict[str, Any]],
+        tail_lines: int,
+        cluster: ManagedCluster | None,
+    ) -> list[str]:
+        targets = [
+            (pod_name, container)
+            for pod in pods[: self.settings.k8s_log_fanout_max_pods]
+            if (pod_name := pod.get("metadata", {}).get("name"))
+            for container in self._container_names(pod)
+        ]
+        semaphore = asyncio.Semaphore(self.settings.k8s_log_fanout_concurrency)
+
+        async def fetch(pod_name: str, container: str | None) -> tuple[str, list[str]]:
+            async with semaphore:
+                lines = await self.get_pod_logs(
+                    namespace=namespace,
+                    pod_name=pod_name,
+                    tail_lines=tail_lines,
+                    cluster=cluster,
+                    container=container,
+                    timestamps=True,
+                )
+            return (f"{pod_name}/{container}" if container else pod_name), lines
+
+        streams = await asyncio.gather(*(fetch(pod_name, container) for pod_name, container in targets))
+        return merge_log_streams(streams, self.settings.k8s_log_fanout_max_bytes)
+
+    @staticmethod
+    def _container_names(pod: dict[str, Any]) -> list[str | None]:
+        # List projections drop spec.containers; the status carries one entry per container.
+        names = [
+            status["name"]
+            for status in pod.get("status", {}).get("containerStatuses") or ()
+            if status.get("name")
+        ]
+        return names or [None]
+
     async def scale_workload(
         self,
         kind: str,
@@ -292,6 +633,7 @@ class KubernetesCollector:
         if kind not in self.scalable_kinds:
             raise ValueError(f"Kind '{kind}' does not support scale")
 
+        self._cache.discard_where(lambda key: key[1] == self._cluster_key(cluster))
         if self._should_use_mock(cluster):
             for item in self._mock_state[kind]:
                 md = item.get("metadata", {})
@@ -323,6 +665,7 @@ class KubernetesCollector:
         if kind not in self.scalable_kinds:
             raise ValueError(f"Kind '{kind}' does not support rollout restart")
 
+        self._cache.discard_where(lambda key: key[1] == self._cluster_key(cluster))
         if self._should_use_mock(cluster):
             now = datetime.now(UTC).isoformat()
             for item in self._mock_state[kind]:
@@ -371,6 +714,275 @@ class KubernetesCollector:
     def _should_use_mock(self, cluster: ManagedCluster | None) -> bool:
         return self.settings.use_mock_data or not self._resolve_k8s_api_url(cluster)
 
+    async def _list_cached_resources(
+        self,
+        kind: str,
+        namespace: str | None,
+        label_selector: str | None,
+        cluster: ManagedCluster | None,
+        field_selector: str | None = None,
+    ) -> list[dict[str, Any]] | None:
+        selector = parse_label_selector(label_selector)
+        if self._should_use_mock(cluster):
+            items = self._mock_state.get(kind, [])
+            if namespace:
+                items = [item for item in items if item.get("metadata", {}).get("namespace") == namespace]
+            if not selector.empty:
+                items = [item for item in items if selector.matches(item.get("metadata", {}).get("labels"))]
+        else:
+            informer = await self._get_informer(self._list_path(kind=kind, namespace=None), cluster=cluster)
+            if informer is None:
+                return None
+            items = informer.store.select(selector, namespace)
+
+        if field_selector:
+            items = [item for item in items if self._fields_match(item, field_selector)]
+        return items
+
+    async def _get_record_informer(
+        self,
+        resource_path: str,
+        cluster: ManagedCluster | None,
+    ) -> Informer | None:
+        if self._should_use_mock(cluster):
+            return None
+        return await self._get_informer(resource_path, cluster=cluster)
+
+    async def _get_informer(
+        self,
+        resource_path: str,
+        cluster: ManagedCluster | None,
+    ) -> Informer | None:
+        if not self.settings.k8s_informer_enabled:
+            return None
+
+        # Draft connection probes carry no cluster_id and must not leave watches behind.
+        cluster_key = "default" if cluster is None else getattr(cluster, "cluster_id", None)
+        if not cluster_key:
+            return None
+
+        # Record-only stores never serve manifests, so their relists can use the projected
+        # (and protobuf-capable) encoding.
+        project = project_item if resource_path in self.record_only_stores else strip_item
+        informer = await self._informers.get_or_create(
+            cluster_key,
+            resource_path,
+            lambda: Informer(
+                name=f"{cluster_key}:{resource_path}",
+                lister=lambda metadata: self._stream_list(
+                    resource_path, metadata, cluster=cluster, project=project
+                ),
+                watcher=lambda resource_version: self._watch(
+                    resource_path,
+                    resource_version=resource_version,
+                    cluster=cluster,
+                ),
+                idle_seconds=self.settings.k8s_informer_idle_seconds,
+                record_factory=self.record_factories.get(resource_path),
+                indexers=self.store_indexers.get(resource_path),
+                keep_objects=resource_path not in self.record_only_stores,
+            ),
+            connection=(
+                self._resolve_k8s_api_url(cluster),
+                self._resolve_k8s_bearer_token(cluster),
+            ),
+        )
+        informer.touch()
+        if informer.is_fresh(self.settings.k8s_informer_max_staleness_seconds):
+            return informer
+        if informer.running:
+            return None
+
+        synced = await informer.wait_synced(timeout=self.settings.k8s_informer_sync_timeout_seconds)
+        return informer if synced else None
+
+    async def _watch(
+        self,
+        path: str,
+        resource_version: str,
+        cluster: ManagedCluster | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        k8s_api_url = self._resolve_k8s_api_url(cluster)
+        if not k8s_api_url:
+            raise ValueError("k8s_api_url is required for real cluster mode")
+
+        headers = {"Accept": "application/json"}
+        k8s_bearer_token = self._resolve_k8s_bearer_token(cluster)
+        if k8s_bearer_token:
+            headers["Authorization"] = f"Bearer {k8s_bearer_token}"
+
+        watch_timeout = self.settings.k8s_watch_timeout_seconds
+        params = {
+            "watch": "1",
+            "allowWatchBookmarks": "true",
+            "timeoutSeconds": str(watch_timeout),
+        }
+        if resource_version:
+            params["resourceVersion"] = resource_version
+
+        client = await self._get_client(cluster)
+        async with client.stream(
+            "GET",
+            f"{k8s_api_url.rstrip('/')}{path}",
+            params=params,
+            headers=headers,
+            timeout=httpx.Timeout(15, read=watch_timeout + 30),
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line:
+                    event = orjson.loads(line)
+                    if isinstance(event.get("object"), dict):
+                        strip_item(event["object"])
+                    yield event
+
+    async def _list(
+        self,
+        path: str,
+        params: dict[str, str] | None = None,
+        cluster: ManagedCluster | None = None,
+        project: ItemProjection = project_item,
+        representation: str = "object",
+    ) -> dict[str, Any]:
+        headers = self._list_headers(path, cluster, project, representation)
+
+        async def collect() -> dict[str, Any]:
+            metadata: dict[str, Any] = {}
+            items = [
+                item
+                async for item in self._iter_list(path, params, cluster, headers, project, metadata)
+            ]
+            return {"metadata": metadata, "items": items}
+
+        key = (
+            self._cluster_key(cluster),
+            self._resolve_k8s_api_url(cluster),
+            path,
+            tuple(sorted((params or {}).items())),
+            headers.get("Authorization"),
+            headers["Accept"],
+            project,
+        )
+        return await self._single_flight.do(key, collect)
+
+    async def _stream_list(
+        self,
+        path: str,
+        metadata: dict[str, Any],
+        cluster: ManagedCluster | None = None,
+        project: ItemProjection = project_item,
+    ) -> AsyncIterator[dict[str, Any]]:
+        headers = self._list_headers(path, cluster, project, "object")
+        async for item in self._iter_list(path, None, cluster, headers, project, metadata):
+            yield item
+
+    def _list_headers(
+        self,
+        path: str,
+        cluster: ManagedCluster | None,
+        project: ItemProjection,
+        representation: str,
+    ) -> dict[str, str]:
+        headers = {"Accept": self.accept_headers[representation]}
+        if (
+            representation == "object"
+            and project is project_item
+            and path.rsplit("/", 1)[-1] in protobuf.SUPPORTED_RESOURCES
+            and self._use_protobuf(cluster)
+        ):
+            # The API server answers in JSON for types that have no protobuf encoding.
+            headers["Accept"] = f"{protobuf.CONTENT_TYPE},application/json"
+        k8s_bearer_token = self._resolve_k8s_bearer_token(cluster)
+        if k8s_bearer_token:
+            headers["Authorization"] = f"Bearer {k8s_bearer_token}"
+        return headers
+
+    async def _iter_list(
+        self,
+        path: str,
+        params: dict[str, str] | None,
+        cluster: ManagedCluster | None,
+        headers: dict[str, str],
+        project: ItemProjection,
+        metadata: dict[str, Any],
+    ) -> AsyncIterator[dict[str, Any]]:
+        k8s_api_url = self._resolve_k8s_api_url(cluster)
+        if not k8s_api_url:
+            raise ValueError("k8s_api_url is required for real cluster mode")
+
+        client = await self._get_client(cluster)
+        async with client.stream(
+            "GET",
+            f"{k8s_api_url.rstrip('/')}{path}",
+            params=params,
+            headers=headers,
+        ) as response:
+            if response.is_error:
+                await response.aread()
+            response.raise_for_status()
+            if response.headers.get("content-type", "").startswith(protobuf.CONTENT_TYPE):
+                payload = protobuf.decode_list(await response.aread(), path.rsplit("/", 1)[-1])
+                metadata.update(payload["metadata"])
+                for item in payload["items"]:
+                    yield item
+                return
+            async for item in iter_list_items(response.aiter_bytes(), metadata, project):
+                yield item
+
+    async def _list_as(
+        self,
+        kind: str,
+        path: str,
+        representation: str,
+        params: dict[str, str] | None = None,
+        cluster: ManagedCluster | None = None,
+    ) -> dict[str, Any]:
+        if representation not in self.accept_headers:
+            raise ValueError(f"Unsupported list representation: {representation}")
+        if representation == "object":
+            return await self._list(path, params=params, cluster=cluster)
+        if representation == "table":
+            params = {**(params or {}), "includeObject": "Metadata"}
+        return await self._list(
+            path,
+            params=params,
+            cluster=cluster,
+            project=self._summary_projection(kind),
+            representation=representation,
+        )
+
+    @staticmethod
+    @functools.cache
+    def _summary_projection(kind: str) -> ItemProjection:
+        def project(item: dict[str, Any]) -> dict[str, Any]:
+            # Servers that ignore the as=Table/PartialObjectMetadataList hint send full objects.
+            if "cells" not in item:
+                return project_item(item)
+            return KubernetesCollector._table_cells_to_item(kind, item["metadata"], item["cells"])
+
+        return project
+
+    @staticmethod
+    def _table_cells_to_item(kind: str, metadata: dict[str, Any], cells: dict[str, Any]) -> dict[str, Any]:
+        item: dict[str, Any] = {"metadata": strip_item({"metadata": metadata})["metadata"]}
+        if kind in {"deployment", "statefulset"}:
+            ready, _, desired = str(cells.get("ready", "")).partition("/")
+            if desired.isdigit():
+                item["spec"] = {"replicas": int(desired)}
+                item["status"] = {"readyReplicas": int(ready)} if ready.isdigit() and int(ready) else {}
+        elif kind == "pod":
+            # The Status column is kubectl's display reason (CrashLoopBackOff, Completed, ...),
+            # not the pod phase, which Table rows do not carry.
+            restarts = str(cells.get("restarts", "0")).split(" ", 1)[0]
+            item["status"] = {
+                "reason": str(cells.get("status") or "Unknown"),
+                "containerStatuses": [{"restartCount": int(restarts) if restarts.isdigit() else 0}],
+            }
+            node = cells.get("node")
+            if node and node != "<none>":
+                item["spec"] = {"nodeName": node}
+        return item
+
     def _list_path(self, kind: str, namespace: str | None) -> str:
         api_version, resource = self.kind_to_resource[kind]
         if api_version == "v1":
@@ -411,19 +1023,31 @@ class KubernetesCollector:
         if k8s_bearer_token:
             headers["Authorization"] = f"Bearer {k8s_bearer_token}"
 
-        client = await self._get_client()
-        response = await client.request(
-            method,
-            f"{k8s_api_url.rstrip('/')}{path}",
-            params=params,
-            json=json,
-            headers=headers,
-        )
+        async def send() -> dict[str, Any]:
+            client = await self._get_client(cluster)
+            response = await client.request(
+                method,
+                f"{k8s_api_url.rstrip('/')}{path}",
+                params=params,
+                json=json,
+                headers=headers,
+            )
 
-        response.raise_for_status()
-        if response.content:
-            return response.json()
-        return {"status": "success"}
+            response.raise_for_status()
+            if response.content:
+                return response.json()
+            return {"status": "success"}
+
+        if method != "GET":
+            return await send()
+        key = (
+            self._cluster_key(cluster),
+            k8s_api_url,
+            path,
+            tuple(sorted((params or {}).items())),
+            headers.get("Authorization"),
+        )
+        return await self._single_flight.do(key, send)
 
     def _build_mock_state(self) -> dict[str, Any]:
         now = datetime.now(UTC).isoformat()
@@ -523,10 +1147,73 @@ class KubernetesCollector:
             },
         }
 
+    @staticmethod
+    def _encode_cursor(token: dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(orjson.dumps(token)).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> dict[str, Any]:
+        try:
+            token = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        except (ValueError, binascii.Error) as exc:
+            raise ValueError("Invalid cursor") from exc
+        if not isinstance(token, dict):
+            raise ValueError("Invalid cursor")
+        return token
+
+    @staticmethod
+    def _after_key(token: dict[str, Any]) -> tuple[str, str] | None:
+        after = token.get("after")
+        if after is None:
+            return None
+        if (
+            not isinstance(after, list)
+            or len(after) != 2
+            or not all(isinstance(part, str) for part in after)
+        ):
+            raise ValueError("Invalid cursor")
+        return after[0], after[1]
+
+    @staticmethod
+    def _item_key(item: dict[str, Any]) -> tuple[str, str]:
+        metadata = item.get("metadata", {})
+        return metadata.get("namespace") or "", metadata.get("name", "")
+
     @staticmethod
     def _build_label_selector(labels: dict[str, str]) -> str:
         return ",".join(f"{key}={value}" for key, value in labels.items())
 
+    def _use_protobuf(self, cluster: ManagedCluster | None) -> bool:
+        return self.settings.k8s_protobuf_enabled or (
+            self._cluster_key(cluster) in self.settings.k8s_protobuf_clusters
+        )
+
+    @staticmethod
+    def _cluster_key(cluster: ManagedCluster | None) -> str:
+        return getattr(cluster, "cluster_id", None) or "default"
+
+    @staticmethod
+    def _selector_params(label_selector: str | None, field_selector: str | None) -> dict[str, str] | None:
+        params: dict[str, str] = {}
+        if label_selector:
+            params["labelSelector"] = label_selector
+        if field_selector:
+            params["fieldSelector"] = field_selector
+        return params or None
+
+    @staticmethod
+    def _fields_match(item: dict[str, Any], field_selector: str) -> bool:
+        for term in field_selector.split(","):
+            negate = "!=" in term
+            path, _, expected = term.replace("!=", "=").replace("==", "=").partition("=")
+            value: Any = item
+            for part in path.strip().split("."):
+                value = value.get(part) if isinstance(value, dict) else None
+            actual = "" if value is None else str(value)
+            if (actual == expected.strip()) == negate:
+                return False
+        return True
+
     @staticmethod
     def _extract_error_message(response: httpx.Response) -> str:
         content_type = response.headers.get("content-type", "").lower()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+ItemProjection = Callable[[dict[str, Any]], dict[str, Any]]
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_DROPPED_ANNOTATIONS = ("kubectl.kubernetes.io/last-applied-configuration",)
+_METADATA_FIELDS = (
+    "name",
+    "namespace",
+    "uid",
+    "labels",
+    "resourceVersion",
+    "creationTimestamp",
+    "deletionTimestamp",
+    "ownerReferences",
+)
+_SPEC_FIELDS = ("replicas", "selector", "nodeName", "unschedulable")
+_EVENT_FIELDS = (
+    "involvedObject",
+    "reason",
+    "message",
+    "type",
+    "count",
+    "firstTimestamp",
+    "lastTimestamp",
+    "eventTime",
+    "source",
+    "related",
+)
+
+
+def strip_item(item: dict[str, Any]) -> dict[str, Any]:
+    metadata = item.get("metadata")
+    if isinstance(metadata, dict):
+        metadata.pop("managedFields", None)
+        annotations = metadata.get("annotations")
+        if annotations:
+            for key in _DROPPED_ANNOTATIONS:
+                annotations.pop(key, None)
+    return item
+
+
+def project_item(item: dict[str, Any]) -> dict[str, Any]:
+    metadata = item.get("metadata") or {}
+    projected: dict[str, Any] = {
+        "metadata": {key: metadata[key] for key in _METADATA_FIELDS if key in metadata},
+    }
+    spec = item.get("spec")
+    if isinstance(spec, dict):
+        projected["spec"] = {key: spec[key] for key in _SPEC_FIELDS if key in spec}
+    if "status" in item:
+        projected["status"] = item["status"]
+    for key in _EVENT_FIELDS:
+        if key in item:
+            projected[key] = item[key]
+    return projected
+
+
+async def iter_list_items(
+    chunks: AsyncIterator[bytes],
+    metadata: dict[str, Any] | None = None,
+    project: ItemProjection = strip_item,
+) -> AsyncIterator[dict[str, Any]]:
+    reader = _ListReader()
+    async for chunk in chunks:
+        for item in reader.feed(chunk):
+            yield project(item)
+    for item in reader.feed(b"", final=True):
+        yield project(item)
+    if metadata is not None:
+        metadata.update(reader.document.get("metadata") or {})
+
+
+def table_row_to_item(columns: list[dict[str, Any]], row: dict[str, Any]) -> dict[str, Any]:
+    names = [str(column.get("name", "")).lower() for column in columns]
+    return {
+        "metadata": (row.get("object") or {}).get("metadata") or {},
+        "cells": dict(zip(names, row.get("cells") or [], strict=False)),
+    }
+
+
+class _ListReader:
+    # Walks the top-level list object by hand and hands each element of "items" (or a Table's
+    # "rows") to the C JSON scanner on its own, so only the current element and the unread
+    # tail of the last chunk are ever buffered, never the whole LIST body.
+
+    def __init__(self) -> None:
+        self.document: dict[str, Any] = {}
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._state = "start"
+        self._key = ""
+
+    def feed(self, chunk: bytes, final: bool = False) -> list[dict[str, Any]]:
+        self._buffer = self._buffer[self._position :] + self._text.decode(chunk, final)
+        self._position = 0
+        items = self._parse(final)
+        if final and self._state != "done":
+            raise ValueError("Malformed list response: truncated body")
+        return items
+
+    def _parse(self, final: bool) -> list[dict[str, Any]]:
+        buffer = self._buffer
+        items: list[dict[str, Any]] = []
+        while self._state != "done":
+            position = _WHITESPACE.match(buffer, self._position).end()
+            if position >= len(buffer):
+                break
+            char = buffer[position]
+
+            if self._state == "start":
+                if char != "{":
+                    raise ValueError("Malformed list response: expected an object")
+                self._state = "key"
+                self._position = position + 1
+            elif self._state in {"key", "items"} and char in ",}]":
+                if char == "}" and self._state == "key":
+                    self._state = "done"
+                elif char == "]":
+                    self._state = "key"
+                self._position = position + 1
+            elif self._state == "key":
+                decoded = self._decode(buffer, position, final)
+                if decoded is None:
+                    break
+                key, end = decoded
+                colon = _WHITESPACE.match(buffer, end).end()
+                if colon >= len(buffer):
+                    break
+                if buffer[colon] != ":":
+                    raise ValueError("Malformed list response: expected ':'")
+                self._key = key
+                self._state = "value"
+                self._position = colon + 1
+            elif self._state == "value":
+                if char == "[" and self._key in {"items", "rows"}:
+                    self._state = "items"
+                    self._position = position + 1
+                    continue
+                decoded = self._decode(buffer, position, final)
+                if decoded is None:
+                    break
+                self.document[self._key], self._position = decoded
+                self._state = "key"
+            else:
+                decoded = self._decode(buffer, position, final)
+                if decoded is None:
+                    break
+                item, self._position = decoded
+                if self._key == "rows":
+                    item = table_row_to_item(self.document.get("columnDefinitions") or [], item)
+                items.append(item)
+        return items
+
+    @staticmethod
+    def _decode(buffer: str, position: int, final: bool) -> tuple[Any, int] | None:
+        try:
+            value, end = _DECODER.raw_decode(buffer, position)
+        except json.JSONDecodeError as exc:
+            if final:
+                raise ValueError(f"Malformed list response: {exc}") from exc
+            return None
+        # A value that runs to the end of the buffer may continue in the next chunk.
+        if end >= len(buffer) and not final:
+            return None
+        return value, end
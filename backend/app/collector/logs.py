@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+from collections.abc import AsyncIterator, Iterator
+from operator import itemgetter
+
+
+def split_timestamp(line: str) -> tuple[str, str]:
+    # Lines fetched with timestamps=true are prefixed with an RFC3339Nano time and a space.
+    stamp, separator, text = line.partition(" ")
+    if separator and len(stamp) >= 20 and stamp[4] == "-" and stamp[10] == "T" and stamp.endswith("Z"):
+        return stamp, text
+    return "", line
+
+
+def merge_log_streams(streams: list[tuple[str, list[str]]], max_bytes: int) -> list[str]:
+    keyed = [_keyed(tag, lines) for tag, lines in streams]
+    return cap_log_bytes([line for _, line in heapq.merge(*keyed, key=itemgetter(0))], max_bytes)
+
+
+def cap_log_bytes(lines: list[str], max_bytes: int) -> list[str]:
+    total = 0
+    start = len(lines)
+    while start > 0:
+        size = len(lines[start - 1].encode()) + 1
+        if total + size > max_bytes:
+            break
+        total += size
+        start -= 1
+    if start == 0:
+        return lines
+    return [f"... {start} earlier lines omitted (log output is capped at {max_bytes} bytes)", *lines[start:]]
+
+
+async def batch_lines(
+    lines: AsyncIterator[str],
+    interval_seconds: float = 0.05,
+    max_bytes: int = 64 * 1024,
+) -> AsyncIterator[list[str]]:
+    # A reader task keeps pulling from the upstream stream while a batch is being sent; the
+    # bounded queue pushes back on the upstream read when the consumer falls behind.
+    queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=1024)
+    failure: list[BaseException] = []
+
+    async def pump() -> None:
+        try:
+            async for line in lines:
+                await queue.put(line)
+        except Exception as exc:  # noqa: BLE001 - re-raised to the consumer after the sentinel
+            failure.append(exc)
+        await queue.put(None)
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.create_task(pump())
+    try:
+        finished = False
+        while not finished:
+            line = await queue.get()
+            if line is None:
+                break
+            batch, size = [line], len(line)
+            deadline = loop.time() + interval_seconds
+            while size < max_bytes:
+                try:
+                    line = await asyncio.wait_for(queue.get(), deadline - loop.time())
+                except TimeoutError:
+                    break
+                if line is None:
+                    finished = True
+                    break
+                batch.append(line)
+                size += len(line)
+            yield batch
+        if failure:
+            raise failure[0]
+    finally:
+        reader.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reader
+
+
+def _keyed(tag: str, lines: list[str]) -> Iterator[tuple[str, str]]:
+    # RFC3339Nano trims trailing zeros, so pad the fraction before comparing stamps as strings.
+    # Lines without a stamp (fetch errors) keep the position of the line before them.
+    key = ""
+    for line in lines:
+        stamp, text = split_timestamp(line)
+        if stamp:
+            seconds, _, fraction = stamp[:-1].partition(".")
+            key = f"{seconds}.{fraction.ljust(9, '0')}"
+            yield key, f"{stamp} [{tag}] {text}"
+        else:
+            yield key, f"[{tag}] {text}"
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+import json
 import math
 from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from app.collector.circuit_breaker import BreakerConfig, CircuitBreakerRegistry
+from app.collector.http_pool import HttpClientPool, PoolConfig
+from app.collector.range_cache import RangeQueryCache
+from app.collector.singleflight import SingleFlight
+from app.collector.ttl_cache import TTLCache, cached
 from app.core.config import Settings
 
 if TYPE_CHECKING:
     from app.db.models import ManagedCluster
 
 
+_FNV64_OFFSET = 0xCBF29CE484222325
+_FNV64_PRIME = 0x100000001B3
+_ALERT_STATE_LABELS = frozenset({"__name__", "alertstate"})
+
+
+def alert_fingerprint(labels: dict[str, str]) -> str:
+    # FNV-1a over the sorted label set, as Alertmanager fingerprints alerts, so ids line up
+    # with what Alertmanager shows for the same alert.
+    value = _FNV64_OFFSET
+    for name in sorted(labels):
+        if name in _ALERT_STATE_LABELS:
+            continue
+        for part in (name, labels[name]):
+            for byte in part.encode() + b"\xff":
+                value = ((value ^ byte) * _FNV64_PRIME) & 0xFFFFFFFFFFFFFFFF
+    return f"{value:016x}"
+
+
 @dataclass
 class NamespaceUsageData:
     namespace: str
@@ -22,21 +47,60 @@ class NamespaceUsageData:
 
 
 class PrometheusCollector:
+    batch_query_label = "kubeaico_query"
+
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self._client: httpx.AsyncClient | None = None
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.settings.prometheus_timeout_seconds,
+        self._breakers = CircuitBreakerRegistry(
+            BreakerConfig(
+                failure_rate_threshold=settings.circuit_breaker_failure_rate,
+                minimum_calls=settings.circuit_breaker_minimum_calls,
+                window_seconds=settings.circuit_breaker_window_seconds,
+                open_seconds=settings.circuit_breaker_open_seconds,
+                max_open_seconds=settings.circuit_breaker_max_open_seconds,
             )
-        return self._client
+        )
+        self._pools = HttpClientPool(
+            PoolConfig(
+                timeout=settings.prometheus_timeout_seconds,
+                http2=settings.http_pool_http2,
+                max_connections=settings.http_pool_max_connections,
+                max_keepalive_connections=settings.http_pool_max_keepalive_connections,
+                keepalive_expiry_seconds=settings.http_pool_keepalive_expiry_seconds,
+            ),
+            overrides=settings.http_pool_overrides,
+            idle_seconds=settings.http_pool_idle_seconds,
+            breakers=self._breakers if settings.circuit_breaker_enabled else None,
+        )
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._single_flight = SingleFlight()
+        self._cache = TTLCache(
+            max_bytes=settings.collector_cache_max_bytes,
+            stale_seconds=settings.collector_cache_stale_seconds,
+        )
+        self._range_cache = RangeQueryCache(
+            max_points=settings.prometheus_range_cache_max_points,
+            overlap_steps=settings.prometheus_range_cache_overlap_steps,
+        )
+
+    async def _get_client(self, cluster: ManagedCluster | None = None) -> httpx.AsyncClient:
+        return await self._pools.get(getattr(cluster, "cluster_id", None) or "default")
 
     async def close(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        await self._pools.close_all()
+
+    async def forget_cluster(self, cluster_id: str) -> None:
+        await self._pools.close(cluster_id)
+        self._breakers.discard(cluster_id)
+        self._cache.discard_where(lambda key: key[1] == cluster_id)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "single_flight": self._single_flight.stats(),
+            "cache": self._cache.stats(),
+            "pools": len(self._pools),
+            "breakers": self._breakers.stats(),
+        }
 
     async def query_instant(
         self,
@@ -47,16 +111,7 @@ class PrometheusCollector:
         if self._should_use_mock(prometheus_url):
             return []
 
-        client = await self._get_client()
-        resp = await client.get(
-            f"{prometheus_url.rstrip('/')}/api/v1/query",
-            params={"query": promql},
-        )
-        resp.raise_for_status()
-        payload = resp.json()
-        if payload.get("status") != "success":
-            return []
-        return payload.get("data", {}).get("result", [])
+        return await self._get_result(prometheus_url, "/api/v1/query", {"query": promql}, cluster)
 
     async def query_range(
         self,
@@ -70,22 +125,64 @@ class PrometheusCollector:
         if self._should_use_mock(prometheus_url):
             return []
 
-        client = await self._get_client()
-        resp = await client.get(
-            f"{prometheus_url.rstrip('/')}/api/v1/query_range",
-            params={
-                "query": promql,
-                "start": int(start.timestamp()),
-                "end": int(end.timestamp()),
-                "step": step_seconds,
-            },
+        params = {
+            "query": promql,
+            "start": int(start.timestamp()),
+            "end": int(end.timestamp()),
+            "step": step_seconds,
+        }
+        return await self._get_result(prometheus_url, "/api/v1/query_range", params, cluster)
+
+    async def _get_result(
+        self,
+        prometheus_url: str,
+        path: str,
+        params: dict[str, Any],
+        cluster: ManagedCluster | None,
+    ) -> list[dict[str, Any]]:
+        async def fetch() -> list[dict[str, Any]]:
+            client = await self._get_client(cluster)
+            async with self._semaphore(prometheus_url):
+                resp = await client.get(f"{prometheus_url.rstrip('/')}{path}", params=params)
+            resp.raise_for_status()
+            payload = resp.json()
+            if payload.get("status") != "success":
+                return []
+            return payload.get("data", {}).get("result", [])
+
+        key = (prometheus_url, path, tuple(sorted(params.items())))
+        return await self._single_flight.do(key, fetch)
+
+    async def query_instant_batch(
+        self,
+        queries: dict[str, str],
+        cluster: ManagedCluster | None = None,
+        merge: bool | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        prometheus_url = self._resolve_prometheus_url(cluster)
+        if self._should_use_mock(prometheus_url):
+            return {name: [] for name in queries}
+
+        if merge is None:
+            merge = self.settings.prometheus_merge_instant_queries
+        if merge and len(queries) > 1 and all(self._is_mergeable(q) for q in queries.values()):
+            try:
+                merged = await self.query_instant(self._merge_queries(queries), cluster=cluster)
+            except httpx.HTTPStatusError as exc:
+                # Prometheus rejects merged expressions it cannot evaluate with 400/422;
+                # fall back to one request per query in that case.
+                if exc.response.status_code not in {400, 422}:
+                    raise
+            else:
+                return self._split_merged_result(queries, merged)
+
+        names = list(queries)
+        results = await asyncio.gather(
+            *(self.query_instant(queries[name], cluster=cluster) for name in names)
         )
-        resp.raise_for_status()
-        payload = resp.json()
-        if payload.get("status") != "success":
-            return []
-        return payload.get("data", {}).get("result", [])
+        return dict(zip(names, results, strict=True))
 
+    @cached("usage")
     async def get_cluster_usage(self, cluster: ManagedCluster | None = None) -> dict[str, float]:
         prometheus_url = self._resolve_prometheus_url(cluster)
         if self._should_use_mock(prometheus_url):
@@ -96,24 +193,18 @@ class PrometheusCollector:
                 "memory_capacity_bytes": 48 * 1024**3,
             }
 
-        cpu_usage_res = await self.query_instant(
-            'sum(rate(container_cpu_usage_seconds_total{container!=""}[5m]))',
-            cluster=cluster,
-        )
-        cpu_capacity_res = await self.query_instant("sum(machine_cpu_cores)", cluster=cluster)
-        mem_usage_res = await self.query_instant(
-            'sum(container_memory_working_set_bytes{container!=""})',
+        results = await self.query_instant_batch(
+            {
+                "cpu_usage_cores": 'sum(rate(container_cpu_usage_seconds_total{container!=""}[5m]))',
+                "cpu_capacity_cores": "sum(machine_cpu_cores)",
+                "memory_usage_bytes": 'sum(container_memory_working_set_bytes{container!=""})',
+                "memory_capacity_bytes": "sum(machine_memory_bytes)",
+            },
             cluster=cluster,
         )
-        mem_capacity_res = await self.query_instant("sum(machine_memory_bytes)", cluster=cluster)
-
-        return {
-            "cpu_usage_cores": self._extract_scalar(cpu_usage_res),
-            "cpu_capacity_cores": self._extract_scalar(cpu_capacity_res),
-            "memory_usage_bytes": self._extract_scalar(mem_usage_res),
-            "memory_capacity_bytes": self._extract_scalar(mem_capacity_res),
-        }
+        return {name: self._extract_scalar(result) for name, result in results.items()}
 
+    @cached("usage")
     async def get_namespace_usage(
         self,
         limit: int = 5,
@@ -129,22 +220,18 @@ class PrometheusCollector:
                 NamespaceUsageData("dev", 600, 2.2 * 1024**3, 16),
             ][:limit]
 
-        cpu_result = await self.query_instant(
-            f'topk({limit}, sum(rate(container_cpu_usage_seconds_total{{container!=""}}[5m])) by (namespace))',
-            cluster=cluster,
-        )
-        mem_result = await self.query_instant(
-            f'topk({limit}, sum(container_memory_working_set_bytes{{container!=""}}) by (namespace))',
-            cluster=cluster,
-        )
-        pod_result = await self.query_instant(
-            f"topk({limit}, count(kube_pod_info) by (namespace))",
+        results = await self.query_instant_batch(
+            {
+                "cpu": f'topk({limit}, sum(rate(container_cpu_usage_seconds_total{{container!=""}}[5m])) by (namespace))',
+                "memory": f'topk({limit}, sum(container_memory_working_set_bytes{{container!=""}}) by (namespace))',
+                "pods": f"topk({limit}, count(kube_pod_info) by (namespace))",
+            },
             cluster=cluster,
         )
 
-        cpu_map = self._extract_vector_by_namespace(cpu_result, multiply=1000)
-        mem_map = self._extract_vector_by_namespace(mem_result)
-        pod_map = self._extract_vector_by_namespace(pod_result)
+        cpu_map = self._extract_vector_by_namespace(results["cpu"], multiply=1000)
+        mem_map = self._extract_vector_by_namespace(results["memory"])
+        pod_map = self._extract_vector_by_namespace(results["pods"])
 
         namespaces = sorted(set(cpu_map) | set(mem_map) | set(pod_map))
         output = [
@@ -159,28 +246,49 @@ class PrometheusCollector:
         output.sort(key=lambda item: item.memory_bytes, reverse=True)
         return output[:limit]
 
-    async def get_firing_alerts(self, cluster: ManagedCluster | None = None) -> list[dict[str, str]]:
+    @cached("alerts")
+    async def get_firing_alerts(self, cluster: ManagedCluster | None = None) -> list[dict[str, Any]]:
         prometheus_url = self._resolve_prometheus_url(cluster)
         if self._should_use_mock(prometheus_url):
+            labels = {"alertname": "NodeMemoryPressure", "severity": "warning", "namespace": "kube-system"}
             return [
                 {
                     "name": "NodeMemoryPressure",
                     "severity": "warning",
                     "summary": "Node worker-1 memory usage is above 85%",
                     "namespace": "kube-system",
+                    "fingerprint": alert_fingerprint(labels),
+                    "active_at": None,
                 }
             ]
 
-        alert_result = await self.query_instant('ALERTS{alertstate="firing"}', cluster=cluster)
-        firing: list[dict[str, str]] = []
-        for item in alert_result:
+        results = await self.query_instant_batch(
+            {
+                "firing": 'ALERTS{alertstate="firing"}',
+                # Rules with a `for` clause export the time they became active as the sample value.
+                "active_at": "ALERTS_FOR_STATE",
+            },
+            cluster=cluster,
+        )
+        active_at: dict[str, float] = {}
+        for item in results["active_at"]:
+            try:
+                active_at[alert_fingerprint(item.get("metric", {}))] = float(item["value"][1])
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+
+        firing: list[dict[str, Any]] = []
+        for item in results["firing"]:
             metric = item.get("metric", {})
+            fingerprint = alert_fingerprint(metric)
             firing.append(
                 {
                     "name": metric.get("alertname", "UnknownAlert"),
                     "severity": metric.get("severity", "warning"),
                     "summary": metric.get("summary", "Prometheus firing alert"),
                     "namespace": metric.get("namespace", "default"),
+                    "fingerprint": fingerprint,
+                    "active_at": active_at.get(fingerprint),
                 }
             )
         return firing
@@ -198,16 +306,26 @@ class PrometheusCollector:
         if self._should_use_mock(prometheus_url):
             return self._mock_timeseries(metric=metric, range_minutes=range_minutes, step_seconds=step_seconds)
 
-        end = datetime.now(UTC)
-        start = end - timedelta(minutes=range_minutes)
+        end_ts = int(datetime.now(UTC).timestamp())
+        start_ts = end_ts - range_minutes * 60
 
         promql = self._to_promql(metric=metric, namespace=namespace, workload=workload)
-        return await self.query_range(
-            promql=promql,
-            start=start,
-            end=end,
-            step_seconds=step_seconds,
-            cluster=cluster,
+
+        async def fetch(fetch_start: int, fetch_end: int) -> list[dict[str, Any]]:
+            return await self.query_range(
+                promql=promql,
+                start=datetime.fromtimestamp(fetch_start, UTC),
+                end=datetime.fromtimestamp(fetch_end, UTC),
+                step_seconds=step_seconds,
+                cluster=cluster,
+            )
+
+        return await self._range_cache.query(
+            (prometheus_url, promql, step_seconds),
+            start_ts,
+            end_ts,
+            step_seconds,
+            fetch,
         )
 
     def _resolve_prometheus_url(self, cluster: ManagedCluster | None) -> str | None:
@@ -218,6 +336,45 @@ class PrometheusCollector:
     def _should_use_mock(self, prometheus_url: str | None) -> bool:
         return self.settings.use_mock_data or not prometheus_url
 
+    def _semaphore(self, prometheus_url: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(prometheus_url)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, self.settings.prometheus_max_concurrency))
+            self._semaphores[prometheus_url] = semaphore
+        return semaphore
+
+    @staticmethod
+    def _is_mergeable(promql: str) -> bool:
+        # label_replace needs an instant vector; scalars and literals are queried on their own.
+        expr = promql.strip()
+        if expr.startswith(("scalar(", "time(", "pi(")):
+            return False
+        try:
+            float(expr)
+        except ValueError:
+            return True
+        return False
+
+    def _merge_queries(self, queries: dict[str, str]) -> str:
+        label = json.dumps(self.batch_query_label)
+        return " or ".join(
+            f'label_replace({promql}, {label}, {json.dumps(name)}, "", "")'
+            for name, promql in queries.items()
+        )
+
+    def _split_merged_result(
+        self,
+        queries: dict[str, str],
+        result: list[dict[str, Any]],
+    ) -> dict[str, list[dict[str, Any]]]:
+        output: dict[str, list[dict[str, Any]]] = {name: [] for name in queries}
+        for item in result:
+            metric = dict(item.get("metric", {}))
+            name = metric.pop(self.batch_query_label, None)
+            if name in output:
+                output[name].append({**item, "metric": metric})
+        return output
+
     def _to_promql(self, metric: str, namespace: str | None, workload: str | None) -> str:
         selector_parts: list[str] = ['container!=""']
         if namespace:
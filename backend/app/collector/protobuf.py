@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+# Minimal decoder for the Kubernetes protobuf wire format. Only the fields that the list
+# projections keep are decoded; every other field (pod specs, managedFields, ...) is skipped
+# by length without being parsed.
+
+CONTENT_TYPE = "application/vnd.kubernetes.protobuf"
+MAGIC = b"k8s\x00"
+
+_STR = "str"
+_INT = "int"
+_BOOL = "bool"
+_TIME = "time"
+_MICROTIME = "microtime"
+_MAP = "map"
+
+_TIME_SPEC = {1: ("seconds", _INT), 2: ("nanos", _INT)}
+_OWNER_REFERENCE = {
+    1: ("kind", _STR),
+    3: ("name", _STR),
+    4: ("uid", _STR),
+    5: ("apiVersion", _STR),
+    6: ("controller", _BOOL),
+}
+_OBJECT_META = {
+    1: ("name", _STR),
+    3: ("namespace", _STR),
+    5: ("uid", _STR),
+    6: ("resourceVersion", _STR),
+    8: ("creationTimestamp", _TIME),
+    9: ("deletionTimestamp", _TIME),
+    11: ("labels", _MAP),
+    13: ("ownerReferences", _OWNER_REFERENCE, True),
+}
+_OBJECT_REFERENCE = {
+    1: ("kind", _STR),
+    2: ("namespace", _STR),
+    3: ("name", _STR),
+    4: ("uid", _STR),
+    7: ("fieldPath", _STR),
+}
+_LIST_META = {2: ("resourceVersion", _STR), 3: ("continue", _STR), 4: ("remainingItemCount", _INT)}
+_LABEL_SELECTOR = {1: ("matchLabels", _MAP)}
+_CONDITION = {1: ("type", _STR), 2: ("status", _STR), 5: ("reason", _STR), 6: ("message", _STR)}
+_CONTAINER_STATE = {
+    1: ("waiting", {1: ("reason", _STR), 2: ("message", _STR)}),
+    2: ("running", {1: ("startedAt", _TIME)}),
+    3: ("terminated", {1: ("exitCode", _INT), 3: ("reason", _STR), 4: ("message", _STR)}),
+}
+_CONTAINER_STATUS = {
+    1: ("name", _STR),
+    2: ("state", _CONTAINER_STATE),
+    3: ("lastState", _CONTAINER_STATE),
+    4: ("ready", _BOOL),
+    5: ("restartCount", _INT),
+}
+
+_RESOURCE_SPECS: dict[str, dict[int, tuple[Any, ...]]] = {
+    "pods": {
+        1: ("metadata", _OBJECT_META),
+        2: ("spec", {10: ("nodeName", _STR)}),
+        3: (
+            "status",
+            {
+                1: ("phase", _STR),
+                2: ("conditions", _CONDITION, True),
+                3: ("message", _STR),
+                4: ("reason", _STR),
+                5: ("hostIP", _STR),
+                6: ("podIP", _STR),
+                7: ("startTime", _TIME),
+                8: ("containerStatuses", _CONTAINER_STATUS, True),
+            },
+        ),
+    },
+    "nodes": {
+        1: ("metadata", _OBJECT_META),
+        2: ("spec", {4: ("unschedulable", _BOOL)}),
+        3: ("status", {4: ("conditions", _CONDITION, True)}),
+    },
+    "events": {
+        1: ("metadata", _OBJECT_META),
+        2: ("involvedObject", _OBJECT_REFERENCE),
+        3: ("reason", _STR),
+        4: ("message", _STR),
+        5: ("source", {1: ("component", _STR), 2: ("host", _STR)}),
+        6: ("firstTimestamp", _TIME),
+        7: ("lastTimestamp", _TIME),
+        8: ("count", _INT),
+        9: ("type", _STR),
+        10: ("eventTime", _MICROTIME),
+        13: ("related", _OBJECT_REFERENCE),
+    },
+    "deployments": {
+        1: ("metadata", _OBJECT_META),
+        2: ("spec", {1: ("replicas", _INT), 2: ("selector", _LABEL_SELECTOR)}),
+        3: (
+            "status",
+            {
+                1: ("observedGeneration", _INT),
+                2: ("replicas", _INT),
+                3: ("updatedReplicas", _INT),
+                4: ("availableReplicas", _INT),
+                7: ("readyReplicas", _INT),
+            },
+        ),
+    },
+    "statefulsets": {
+        1: ("metadata", _OBJECT_META),
+        2: ("spec", {1: ("replicas", _INT), 2: ("selector", _LABEL_SELECTOR)}),
+        3: (
+            "status",
+            {
+                1: ("observedGeneration", _INT),
+                2: ("replicas", _INT),
+                3: ("readyReplicas", _INT),
+                4: ("currentReplicas", _INT),
+                5: ("updatedReplicas", _INT),
+            },
+        ),
+    },
+    "daemonsets": {
+        1: ("metadata", _OBJECT_META),
+        2: ("spec", {1: ("selector", _LABEL_SELECTOR)}),
+        3: (
+            "status",
+            {
+                1: ("currentNumberScheduled", _INT),
+                2: ("numberMisscheduled", _INT),
+                3: ("desiredNumberScheduled", _INT),
+                4: ("numberReady", _INT),
+            },
+        ),
+    },
+}
+
+SUPPORTED_RESOURCES = frozenset(_RESOURCE_SPECS)
+
+
+def decode_list(body: bytes, resource: str) -> dict[str, Any]:
+    if not body.startswith(MAGIC):
+        raise ValueError("Missing Kubernetes protobuf envelope")
+    item_spec = _RESOURCE_SPECS[resource]
+
+    raw: memoryview | None = None
+    for number, wire_type, value in _iter_fields(memoryview(body)[len(MAGIC) :]):
+        if number == 2 and wire_type == 2:
+            raw = value
+    if raw is None:
+        raise ValueError("Kubernetes protobuf envelope has no payload")
+
+    metadata: dict[str, Any] = {}
+    items: list[dict[str, Any]] = []
+    for number, wire_type, value in _iter_fields(raw):
+        if wire_type != 2:
+            continue
+        if number == 1:
+            metadata = _decode_message(value, _LIST_META)
+        elif number == 2:
+            items.append(_decode_message(value, item_spec))
+    return {"metadata": metadata, "items": items}
+
+
+def _decode_message(data: memoryview, spec: dict[int, tuple[Any, ...]]) -> dict[str, Any]:
+    output: dict[str, Any] = {}
+    for number, wire_type, value in _iter_fields(data):
+        field = spec.get(number)
+        if field is None:
+            continue
+        name, field_type = field[0], field[1]
+        if field_type == _MAP:
+            key, item = _decode_map_entry(value)
+            output.setdefault(name, {})[key] = item
+            continue
+
+        decoded = _decode_value(value, wire_type, field_type)
+        if len(field) > 2:
+            output.setdefault(name, []).append(decoded)
+        else:
+            output[name] = decoded
+    return output
+
+
+def _decode_value(value: Any, wire_type: int, field_type: Any) -> Any:
+    if field_type in (_INT, _BOOL):
+        if wire_type != 0:
+            raise ValueError("Unexpected protobuf wire type for scalar field")
+        if field_type == _BOOL:
+            return bool(value)
+        # int32/int64 are encoded as two's complement varints.
+        return value - (1 << 64) if value >= 1 << 63 else value
+    if wire_type != 2:
+        raise ValueError("Unexpected protobuf wire type for length-delimited field")
+    if field_type == _STR:
+        return str(value, "utf-8")
+    if field_type in (_TIME, _MICROTIME):
+        timestamp = _decode_message(value, _TIME_SPEC)
+        moment = datetime.fromtimestamp(timestamp.get("seconds", 0), tz=UTC)
+        if field_type == _MICROTIME:
+            moment = moment.replace(microsecond=timestamp.get("nanos", 0) // 1000)
+            return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _decode_message(value, field_type)
+
+
+def _decode_map_entry(data: memoryview) -> tuple[str, str]:
+    key = value = ""
+    for number, wire_type, item in _iter_fields(data):
+        if wire_type != 2:
+            continue
+        if number == 1:
+            key = str(item, "utf-8")
+        elif number == 2:
+            value = str(item, "utf-8")
+    return key, value
+
+
+def _iter_fields(data: memoryview) -> Iterator[tuple[int, int, Any]]:
+    position = 0
+    end = len(data)
+    while position < end:
+        key, position = _read_varint(data, position)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, position = _read_varint(data, position)
+        elif wire_type == 2:
+            length, position = _read_varint(data, position)
+            if position + length > end:
+                raise ValueError("Truncated protobuf field")
+            value = data[position : position + length]
+            position += length
+        elif wire_type == 1:
+            value, position = data[position : position + 8], position + 8
+        elif wire_type == 5:
+            value, position = data[position : position + 4], position + 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+        if position > end:
+            raise ValueError("Truncated protobuf field")
+        yield number, wire_type, value
+
+
+def _read_varint(data: memoryview, position: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Truncated protobuf varint")
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+        if shift >= 70:
+            raise ValueError("Protobuf varint is too long")
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+RangeFetchFn = Callable[[int, int], Awaitable[list[dict[str, Any]]]]
+SeriesKey = tuple[tuple[str, str], ...]
+
+
+@dataclass
+class _RangeEntry:
+    start: int
+    end: int
+    window: int
+    series: dict[SeriesKey, tuple[dict[str, str], dict[int, Any]]] = field(default_factory=dict)
+    points: int = 0
+
+
+class RangeQueryCache:
+    def __init__(self, max_points: int = 500_000, overlap_steps: int = 2) -> None:
+        self.max_points = max_points
+        self.overlap_steps = overlap_steps
+        self._entries: OrderedDict[Hashable, _RangeEntry] = OrderedDict()
+
+    @property
+    def total_points(self) -> int:
+        return sum(entry.points for entry in self._entries.values())
+
+    @staticmethod
+    def align(start_ts: int, end_ts: int, step_seconds: int) -> tuple[int, int]:
+        return start_ts // step_seconds * step_seconds, end_ts // step_seconds * step_seconds
+
+    async def query(
+        self,
+        key: Hashable,
+        start_ts: int,
+        end_ts: int,
+        step_seconds: int,
+        fetch: RangeFetchFn,
+    ) -> list[dict[str, Any]]:
+        start_ts, end_ts = self.align(start_ts, end_ts, step_seconds)
+        entry = self._entries.get(key)
+
+        if entry is None or start_ts > entry.end or end_ts < entry.start:
+            result = await fetch(start_ts, end_ts)
+            entry = _RangeEntry(start=start_ts, end=end_ts, window=end_ts - start_ts)
+            self._merge(entry, result)
+        else:
+            ranges: list[tuple[int, int]] = []
+            if start_ts < entry.start:
+                ranges.append((start_ts, entry.start - step_seconds))
+            # Re-fetch a few trailing steps so samples that arrived late are refreshed.
+            tail_start = max(start_ts, entry.end - self.overlap_steps * step_seconds)
+            if end_ts >= tail_start:
+                ranges.append((tail_start, end_ts))
+            results = await asyncio.gather(*(fetch(start, end) for start, end in ranges))
+
+            for result in results:
+                self._merge(entry, result)
+            entry.start = min(entry.start, start_ts)
+            entry.end = max(entry.end, end_ts)
+            entry.window = max(entry.window, end_ts - start_ts)
+
+        self._trim(entry)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._evict()
+        return self._slice(entry, start_ts, end_ts)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @staticmethod
+    def _merge(entry: _RangeEntry, result: list[dict[str, Any]]) -> None:
+        for row in result:
+            metric = row.get("metric", {})
+            series_key = tuple(sorted(metric.items()))
+            _, points = entry.series.setdefault(series_key, (metric, {}))
+            for pair in row.get("values", []):
+                points[int(pair[0])] = pair[1]
+
+    @staticmethod
+    def _trim(entry: _RangeEntry) -> None:
+        cutoff = entry.end - entry.window
+        entry.start = max(entry.start, cutoff)
+        total = 0
+        for series_key in list(entry.series):
+            _, points = entry.series[series_key]
+            for ts in [ts for ts in points if ts < cutoff]:
+                del points[ts]
+            if not points:
+                del entry.series[series_key]
+                continue
+            total += len(points)
+        entry.points = total
+
+    def _evict(self) -> None:
+        total = self.total_points
+        while total > self.max_points and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            total -= evicted.points
+
+    @staticmethod
+    def _slice(entry: _RangeEntry, start_ts: int, end_ts: int) -> list[dict[str, Any]]:
+        output: list[dict[str, Any]] = []
+        for metric, points in entry.series.values():
+            values = [[ts, points[ts]] for ts in sorted(points) if start_ts <= ts <= end_ts]
+            if values:
+                output.append({"metric": metric, "values": values})
+        return output
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from typing import Any
+
+_EMPTY_LABELS: dict[str, str] = {}
+
+
+def _intern(value: Any, default: str = "") -> str:
+    return sys.intern(value) if isinstance(value, str) else default
+
+
+def _intern_labels(labels: dict[str, str] | None) -> dict[str, str]:
+    if not labels:
+        return _EMPTY_LABELS
+    return {sys.intern(key): _intern(value) for key, value in labels.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class PodRecord:
+    name: str
+    namespace: str
+    phase: str
+    node_name: str
+    labels: dict[str, str] = field(default_factory=dict)
+    restarts: int = 0
+    ready: bool = False
+    is_crashloop: bool = False
+    is_oomkilled: bool = False
+
+    @classmethod
+    def from_object(cls, obj: dict[str, Any]) -> PodRecord:
+        metadata = obj.get("metadata") or {}
+        status = obj.get("status") or {}
+        restarts = 0
+        is_crashloop = False
+        is_oomkilled = False
+        for container in status.get("containerStatuses") or ():
+            restarts += int(container.get("restartCount", 0))
+            waiting = (container.get("state") or {}).get("waiting") or {}
+            terminated = (container.get("lastState") or {}).get("terminated") or {}
+            is_crashloop = is_crashloop or waiting.get("reason") == "CrashLoopBackOff"
+            is_oomkilled = is_oomkilled or terminated.get("reason") == "OOMKilled"
+        return cls(
+            name=metadata.get("name", ""),
+            namespace=_intern(metadata.get("namespace")),
+            phase=_intern(status.get("phase"), "Unknown"),
+            node_name=_intern((obj.get("spec") or {}).get("nodeName")),
+            labels=_intern_labels(metadata.get("labels")),
+            restarts=restarts,
+            ready=_condition_true(status, "Ready"),
+            is_crashloop=is_crashloop,
+            is_oomkilled=is_oomkilled,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class WorkloadRecord:
+    kind: str
+    name: str
+    namespace: str
+    labels: dict[str, str] = field(default_factory=dict)
+    replicas: int | None = None
+    ready_replicas: int | None = None
+    restarts: int = 0
+    phase: str = "Unknown"
+
+    @classmethod
+    def from_object(cls, kind: str, obj: dict[str, Any]) -> WorkloadRecord:
+        metadata = obj.get("metadata") or {}
+        status = obj.get("status") or {}
+        return cls(
+            kind=_intern(kind),
+            name=metadata.get("name", "unknown"),
+            namespace=_intern(metadata.get("namespace"), "default"),
+            labels=_intern_labels(metadata.get("labels")),
+            replicas=(obj.get("spec") or {}).get("replicas"),
+            ready_replicas=status.get("readyReplicas"),
+            restarts=sum(
+                int(container.get("restartCount", 0))
+                for container in status.get("containerStatuses") or ()
+            ),
+            phase=_intern(status.get("phase"), "Unknown"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class NodeRecord:
+    name: str
+    ready: bool
+    unschedulable: bool = False
+    labels: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_object(cls, obj: dict[str, Any]) -> NodeRecord:
+        metadata = obj.get("metadata") or {}
+        return cls(
+            name=_intern(metadata.get("name")),
+            ready=_condition_true(obj.get("status") or {}, "Ready"),
+            unschedulable=bool((obj.get("spec") or {}).get("unschedulable")),
+            labels=_intern_labels(metadata.get("labels")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EventRecord:
+    name: str
+    namespace: str
+    type: str
+    reason: str
+    message: str
+    timestamp: str
+    involved_kind: str = ""
+    involved_name: str = ""
+    involved_namespace: str = ""
+    count: int = 1
+    first_timestamp: str = ""
+    object_keys: tuple[tuple[str, str, str], ...] = ()
+
+    @classmethod
+    def from_object(cls, obj: dict[str, Any]) -> EventRecord:
+        metadata = obj.get("metadata") or {}
+        involved = obj.get("involvedObject") or {}
+        return cls(
+            name=metadata.get("name", "unknown"),
+            namespace=_intern(metadata.get("namespace")),
+            type=_intern(obj.get("type"), "Normal"),
+            reason=_intern(obj.get("reason"), "Unknown"),
+            message=obj.get("message") or "",
+            timestamp=obj.get("lastTimestamp") or obj.get("eventTime") or obj.get("firstTimestamp") or "",
+            involved_kind=_intern(involved.get("kind")),
+            involved_name=_intern(involved.get("name")),
+            involved_namespace=_intern(involved.get("namespace")),
+            count=int(obj.get("count") or 1),
+            first_timestamp=obj.get("firstTimestamp") or "",
+            object_keys=tuple(event_object_keys(obj)),
+        )
+
+
+def event_object_keys(obj: dict[str, Any]) -> list[tuple[str, str, str]]:
+    namespace = (obj.get("metadata") or {}).get("namespace") or ""
+    keys = []
+    for reference in (obj.get("involvedObject"), obj.get("related")):
+        if reference and reference.get("name"):
+            keys.append(
+                (
+                    _intern(reference.get("namespace") or namespace),
+                    _intern(reference.get("kind")),
+                    _intern(reference.get("name")),
+                )
+            )
+    return keys
+
+
+def _condition_true(status: dict[str, Any], condition_type: str) -> bool:
+    for condition in status.get("conditions") or ():
+        if condition.get("type") == condition_type:
+            return condition.get("status") == "True"
+    return False
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+
+_KEY_PATTERN = re.compile(r"^([A-Za-z0-9][-A-Za-z0-9_.]*/)?[A-Za-z0-9]([-A-Za-z0-9_.]*[A-Za-z0-9])?$")
+_VALUE_PATTERN = re.compile(r"^(([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9])?$")
+_SET_TERM = re.compile(r"^(?P<key>\S+)\s+(?P<op>in|notin)\s*\((?P<values>[^)]*)\)$")
+_BINARY_TERM = re.compile(r"^(?P<key>[^=!<>\s]+)\s*(?P<op>==|!=|=|<|>)\s*(?P<value>\S*)$")
+
+
+@dataclass(frozen=True, slots=True)
+class Requirement:
+    key: str
+    operator: str
+    values: frozenset[str] = frozenset()
+
+    def matches(self, labels: Mapping[str, str]) -> bool:
+        if self.operator == "exists":
+            return self.key in labels
+        if self.operator == "!":
+            return self.key not in labels
+        if self.operator in {"=", "in"}:
+            return labels.get(self.key) in self.values
+        if self.operator in {"!=", "notin"}:
+            return labels.get(self.key) not in self.values
+        return self._compare(labels.get(self.key))
+
+    def _compare(self, value: str | None) -> bool:
+        threshold = next(iter(self.values))
+        try:
+            actual, expected = int(value or ""), int(threshold)
+        except ValueError:
+            return False
+        return actual > expected if self.operator == ">" else actual < expected
+
+
+@dataclass(frozen=True, slots=True)
+class LabelSelector:
+    requirements: tuple[Requirement, ...]
+
+    @property
+    def empty(self) -> bool:
+        return not self.requirements
+
+    def matches(self, labels: Mapping[str, str] | None) -> bool:
+        labels = labels or {}
+        return all(requirement.matches(labels) for requirement in self.requirements)
+
+
+@lru_cache(maxsize=1024)
+def parse_label_selector(selector: str | None) -> LabelSelector:
+    if not selector or not selector.strip():
+        return LabelSelector(())
+    return LabelSelector(tuple(_parse_term(term) for term in _split_terms(selector)))
+
+
+def _split_terms(selector: str) -> list[str]:
+    terms: list[str] = []
+    depth = 0
+    current: list[str] = []
+    for char in selector:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                raise ValueError(f"Invalid label selector: {selector!r}")
+        if char == "," and depth == 0:
+            terms.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    if depth != 0:
+        raise ValueError(f"Invalid label selector: {selector!r}")
+    terms.append("".join(current).strip())
+    if any(not term for term in terms):
+        raise ValueError(f"Invalid label selector: {selector!r}")
+    return terms
+
+
+def _parse_term(term: str) -> Requirement:
+    set_match = _SET_TERM.match(term)
+    if set_match:
+        values = [value.strip() for value in set_match.group("values").split(",")]
+        return Requirement(
+            _valid_key(set_match.group("key"), term),
+            set_match.group("op"),
+            frozenset(_valid_value(value, term) for value in values),
+        )
+
+    binary_match = _BINARY_TERM.match(term)
+    if binary_match:
+        operator = binary_match.group("op")
+        value = binary_match.group("value")
+        if operator == "==":
+            operator = "="
+        if operator in {"<", ">"}:
+            if not value.lstrip("-").isdigit():
+                raise ValueError(f"Invalid label selector term: {term!r}")
+        else:
+            value = _valid_value(value, term)
+        return Requirement(_valid_key(binary_match.group("key"), term), operator, frozenset({value}))
+
+    if term.startswith("!"):
+        return Requirement(_valid_key(term[1:].strip(), term), "!")
+    return Requirement(_valid_key(term, term), "exists")
+
+
+def _valid_key(key: str, term: str) -> str:
+    if not _KEY_PATTERN.match(key):
+        raise ValueError(f"Invalid label selector term: {term!r}")
+    return key
+
+
+def _valid_value(value: str, term: str) -> str:
+    if len(value) > 63 or not _VALUE_PATTERN.match(value):
+        raise ValueError(f"Invalid label selector term: {term!r}")
+    return value
+
+
+class LabelIndex:
+    def __init__(self) -> None:
+        self._values: dict[str, dict[str, set[Hashable]]] = {}
+        self._labels: dict[Hashable, dict[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def add(self, key: Hashable, labels: Mapping[str, str] | None) -> None:
+        self.remove(key)
+        labels = dict(labels or {})
+        self._labels[key] = labels
+        for label_key, label_value in labels.items():
+            self._values.setdefault(label_key, {}).setdefault(label_value, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        labels = self._labels.pop(key, None)
+        if not labels:
+            return
+        for label_key, label_value in labels.items():
+            by_value = self._values.get(label_key)
+            if by_value is None:
+                continue
+            keys = by_value.get(label_value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del by_value[label_value]
+            if not by_value:
+                del self._values[label_key]
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._labels.clear()
+
+    def select(self, selector: LabelSelector) -> set[Hashable]:
+        if selector.empty:
+            return set(self._labels)
+
+        # Positive requirements narrow the candidates; negative ones are subtracted after.
+        positive: list[set[Hashable]] = []
+        negative: list[Requirement] = []
+        for requirement in selector.requirements:
+            if requirement.operator in {"=", "in"}:
+                positive.append(self._union(requirement.key, requirement.values))
+            elif requirement.operator == "exists":
+                positive.append(self._union(requirement.key, self._values.get(requirement.key, {})))
+            else:
+                negative.append(requirement)
+
+        if positive:
+            positive.sort(key=len)
+            candidates = set(positive[0])
+            for keys in positive[1:]:
+                candidates &= keys
+                if not candidates:
+                    return candidates
+        else:
+            candidates = set(self._labels)
+
+        for requirement in negative:
+            if requirement.operator in {"!=", "notin"}:
+                candidates -= self._union(requirement.key, requirement.values)
+            elif requirement.operator == "!":
+                candidates -= self._union(requirement.key, self._values.get(requirement.key, {}))
+            else:
+                candidates = {key for key in candidates if requirement.matches(self._labels[key])}
+        return candidates
+
+    def _union(self, label_key: str, values: Iterable[str]) -> set[Hashable]:
+        by_value = self._values.get(label_key)
+        if not by_value:
+            return set()
+        output: set[Hashable] = set()
+        for value in values:
+            output |= by_value.get(value, set())
+        return output
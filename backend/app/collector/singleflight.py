@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.hits += 1
+        # Shield the shared call so one cancelled caller does not cancel it for the others.
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "in_flight": len(self._in_flight)}
+
+    def _finish(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from contextvars import ContextVar
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, TypeVar
+
+import orjson
+
+from app.collector.circuit_breaker import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+cache_bypass: ContextVar[bool] = ContextVar("cache_bypass", default=False)
+# Ages of cached values served in place of an upstream whose circuit is open.
+stale_reads: ContextVar[list[float] | None] = ContextVar("stale_reads", default=None)
+
+T = TypeVar("T")
+
+_SIZE_SAMPLE = 16
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    size: int
+    stored_at: float
+
+
+class TTLCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, stale_seconds: float = 300) -> None:
+        self.max_bytes = max_bytes
+        self.stale_seconds = stale_seconds
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._refreshing: dict[Hashable, asyncio.Task[None]] = {}
+        self.size_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.fallbacks = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(self, key: Hashable, ttl: float, load: Callable[[], Awaitable[T]]) -> T:
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and not cache_bypass.get():
+            if now < entry.expires_at:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.expires_at + self.stale_seconds:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._refreshing:
+                    self._refreshing[key] = asyncio.create_task(self._refresh(key, ttl, load))
+                return entry.value
+
+        self.misses += 1
+        try:
+            value = await load()
+        except CircuitOpenError:
+            # Any earlier answer beats failing fast, unless the caller asked for fresh data.
+            if entry is None or cache_bypass.get():
+                raise
+            self.fallbacks += 1
+            reads = stale_reads.get()
+            if reads is not None:
+                reads.append(now - entry.stored_at)
+            return entry.value
+        self.set(key, value, ttl)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        self._pop_entry(key)
+        size = approximate_size(value)
+        if size > self.max_bytes:
+            return
+        now = time.monotonic()
+        self._entries[key] = _CacheEntry(value=value, expires_at=now + ttl, size=size, stored_at=now)
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= evicted.size
+
+    def discard(self, key: Hashable) -> None:
+        self._pop_entry(key)
+        refresh = self._refreshing.pop(key, None)
+        if refresh is not None:
+            refresh.cancel()
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        for key in [key for key in self._entries if predicate(key)]:
+            self.discard(key)
+
+    def clear(self) -> None:
+        for refresh in self._refreshing.values():
+            refresh.cancel()
+        self._refreshing.clear()
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "fallbacks": self.fallbacks,
+            "misses": self.misses,
+        }
+
+    async def _refresh(self, key: Hashable, ttl: float, load: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            self.set(key, await load(), ttl)
+        except Exception:  # noqa: BLE001 - keep serving the stale value until a refresh succeeds
+            logger.warning("cache refresh failed for %s", key[0] if isinstance(key, tuple) else key)
+        finally:
+            if self._refreshing.get(key) is asyncio.current_task():
+                del self._refreshing[key]
+
+    def _pop_entry(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry.size
+
+
+
+def approximate_size(value: Any) -> int:
+    # Rough JSON size. Long sequences are sized from an evenly spaced sample so a multi-MB pod
+    # list is never re-serialized on the event loop just to account for it.
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, (list, tuple)):
+        if len(value) <= _SIZE_SAMPLE:
+            return 2 + sum(approximate_size(item) + 1 for item in value)
+        sample = value[:: len(value) // _SIZE_SAMPLE][:_SIZE_SAMPLE]
+        return 2 + len(value) * (sum(approximate_size(item) + 1 for item in sample) // len(sample))
+    if is_dataclass(value) and not isinstance(value, type):
+        value = {field.name: getattr(value, field.name) for field in fields(value)}
+    if isinstance(value, dict):
+        return 2 + sum(len(str(key)) + 4 + approximate_size(item) for key, item in value.items())
+    try:
+        return len(orjson.dumps(value, default=str))
+    except TypeError:
+        return sys.getsizeof(value)
+
+
+def cached(ttl_name: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    def decorator(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+            ttl = self.settings.collector_cache_ttls.get(ttl_name, 0)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("self")
+            cluster = arguments.pop("cluster", None)
+            cluster_key = "default" if cluster is None else getattr(cluster, "cluster_id", None)
+            # Connection probes have no cluster_id and must always reach the upstream.
+            if not self.settings.collector_cache_enabled or ttl <= 0 or not cluster_key:
+                return await method(self, *args, **kwargs)
+
+            key = (method.__name__, cluster_key, tuple(sorted(arguments.items())))
+            return await self._cache.get_or_load(key, ttl, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
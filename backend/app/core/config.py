@@ -1,6 +1,6 @@
 import json
 from functools import lru_cache
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
@@ -25,12 +25,81 @@ class Settings(BaseSettings):
 
     prometheus_url: str | None = None
     prometheus_timeout_seconds: int = 10
+    prometheus_max_concurrency: int = 8
+    prometheus_merge_instant_queries: bool = True
+    prometheus_range_cache_max_points: int = 500_000
+    prometheus_range_cache_overlap_steps: int = 2
 
     k8s_api_url: str | None = None
     k8s_bearer_token: str | None = None
     k8s_verify_ssl: bool = False
+    k8s_informer_enabled: bool = True
+    k8s_informer_max_staleness_seconds: int = 30
+    k8s_informer_sync_timeout_seconds: int = 15
+    k8s_informer_idle_seconds: int = 600
+    k8s_watch_timeout_seconds: int = 300
+    # Protobuf covers projected LISTs and informer relists of nodes and events; informers that
+    # serve manifests (pods, workloads) and watches stay on JSON. Opt-in only: decoding is not
+    # reliably faster than streamed JSON (see benchmarks/list_decode.py), so measure per cluster.
+    k8s_protobuf_enabled: bool = False
+    k8s_protobuf_clusters: list[str] = Field(default_factory=list)
+    k8s_log_fanout_max_pods: int = 10
+    k8s_log_fanout_concurrency: int = 4
+    k8s_log_fanout_max_bytes: int = 1024 * 1024
+
+    log_follow_max_per_user: int = 3
+    log_follow_batch_interval_seconds: float = 0.05
+    log_follow_batch_max_bytes: int = 64 * 1024
+
+    http_pool_http2: bool = True
+    http_pool_max_connections: int = 20
+    http_pool_max_keepalive_connections: int = 10
+    http_pool_keepalive_expiry_seconds: float = 30.0
+    http_pool_idle_seconds: int = 600
+    http_pool_overrides: dict[str, dict[str, Any]] = Field(default_factory=dict)
+
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_minimum_calls: int = 5
+    circuit_breaker_window_seconds: float = 30
+    circuit_breaker_open_seconds: float = 5
+    circuit_breaker_max_open_seconds: float = 300
+
+    collector_cache_enabled: bool = True
+    collector_cache_max_bytes: int = 64 * 1024 * 1024
+    collector_cache_stale_seconds: float = 300
+    collector_cache_ttls: dict[str, float] = Field(
+        default_factory=lambda: {
+            "nodes": 30,
+            "pods": 10,
+            "events": 5,
+            "resources": 5,
+            "usage": 15,
+            "alerts": 10,
+        }
+    )
 
     overview_stream_interval_seconds: int = 8
+    overview_source_timeout_seconds: float = 5.0
+    fleet_refresh_interval_seconds: float = 30
+    fleet_max_concurrency: int = 4
+    fleet_cluster_timeout_seconds: float = 10.0
+
+    scheduler_enabled: bool = True
+    scheduler_intervals: dict[str, float] = Field(
+        default_factory=lambda: {
+            "nodes": 30,
+            "pods": 15,
+            "events": 15,
+            "usage": 30,
+            "namespaces": 60,
+            "alerts": 30,
+        }
+    )
+    scheduler_jitter_ratio: float = 0.2
+    scheduler_max_backoff_seconds: float = 300
+    scheduler_staleness_factor: float = 3
+    scheduler_cluster_refresh_seconds: float = 60
 
     enable_llm: bool = False
     llm_provider: str = "noop"
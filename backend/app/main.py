@@ -1,21 +1,29 @@
 import asyncio
+import contextlib
 from contextlib import asynccontextmanager
+from typing import Any
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.deps import (
     get_cluster_repository,
+    get_collection_scheduler,
+    get_current_user,
+    get_fleet_overview_service,
     get_k8s_collector,
-    get_overview_service,
+    get_overview_broadcaster,
     get_prometheus_collector,
+    get_snapshot_store,
     get_user_repository,
     resolve_cluster_by_id,
 )
 from app.api.router import api_router
+from app.collector.ttl_cache import cache_bypass, stale_reads
 from app.core.config import get_settings
 from app.core.security import decode_token
 from app.db.session import AsyncSessionLocal, init_db
+from app.service.overview_stream import OverviewDeltaEncoder, OverviewSubscription
 
 settings = get_settings()
 
@@ -32,8 +40,14 @@ async def lifespan(app: FastAPI):
             password=settings.default_admin_password,
         )
 
+    if settings.scheduler_enabled:
+        get_collection_scheduler().start()
+
     yield
 
+    await get_collection_scheduler().close()
+    await get_overview_broadcaster().close()
+    await get_fleet_overview_service().close()
     await get_prometheus_collector().close()
     await get_k8s_collector().close()
 
@@ -48,6 +62,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def honour_cache_control(request: Request, call_next):
+    bypass = "no-cache" in request.headers.get("cache-control", "").lower()
+    token = cache_bypass.set(bypass)
+    try:
+        return await call_next(request)
+    finally:
+        cache_bypass.reset(token)
+
+
+@app.middleware("http")
+async def flag_stale_responses(request: Request, call_next):
+    reads: list[float] = []
+    token = stale_reads.set(reads)
+    try:
+        response = await call_next(request)
+    finally:
+        stale_reads.reset(token)
+    if reads:
+        response.headers["Warning"] = '110 - "Response is Stale"'
+        response.headers["Age"] = str(int(max(reads)))
+    return response
+
+
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
 
@@ -56,10 +95,21 @@ async def healthz() -> dict[str, str]:
     return {"status": "ok"}
 
 
+# Reports cluster ids, API server origins and upstream error text, so it is not public.
+@app.get("/healthz/upstream")
+async def healthz_upstream(_user=Depends(get_current_user)) -> dict[str, Any]:
+    return {
+        "kubernetes": get_k8s_collector().stats(),
+        "prometheus": get_prometheus_collector().stats(),
+        "snapshots": get_snapshot_store().stats(),
+    }
+
+
 @app.websocket("/ws/overview")
 async def overview_ws(websocket: WebSocket) -> None:
     token = websocket.query_params.get("token")
     cluster_id = websocket.query_params.get("cluster_id")
+    mode = websocket.query_params.get("mode", "full")
     if not token:
         await websocket.close(code=4401, reason="Missing token")
         return
@@ -87,14 +137,59 @@ async def overview_ws(websocket: WebSocket) -> None:
             await websocket.close(code=4404, reason=str(exc))
             return
 
-    await websocket.accept()
+    if mode not in {"full", "delta"}:
+        await websocket.close(code=4400, reason=f"Unsupported mode: {mode}")
+        return
 
-    overview_service = get_overview_service()
+    await websocket.accept()
 
-    try:
-        while True:
-            payload = await overview_service.get_cluster_summary(cluster=cluster)
-            await websocket.send_json(payload.model_dump(mode="json"))
-            await asyncio.sleep(settings.overview_stream_interval_seconds)
-    except WebSocketDisconnect:
-        return
+    broadcaster = get_overview_broadcaster()
+    encoder = OverviewDeltaEncoder() if mode == "delta" else None
+
+    async with broadcaster.subscribe(cluster) as subscription:
+        sender = asyncio.create_task(_send_overview_frames(websocket, subscription, encoder))
+        receiver = asyncio.create_task(_receive_overview_commands(websocket, subscription, encoder))
+        done, pending = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, WebSocketDisconnect):
+                await task
+        for task in done:
+            with contextlib.suppress(WebSocketDisconnect):
+                task.result()
+
+
+async def _send_overview_frames(
+    websocket: WebSocket,
+    subscription: OverviewSubscription,
+    encoder: OverviewDeltaEncoder | None,
+) -> None:
+    while True:
+        frame = await subscription.next_frame()
+        if frame is None:
+            await websocket.close(code=4404, reason="Cluster is no longer available")
+            return
+        if encoder is None:
+            await websocket.send_json(frame)
+            continue
+        message = encoder.encode(frame)
+        if message is not None:
+            await websocket.send_json(message)
+
+
+async def _receive_overview_commands(
+    websocket: WebSocket,
+    subscription: OverviewSubscription,
+    encoder: OverviewDeltaEncoder | None,
+) -> None:
+    while True:
+        try:
+            command = await websocket.receive_json()
+        except ValueError:
+            continue
+        if encoder is None or not isinstance(command, dict):
+            continue
+        if command.get("type") == "resync":
+            encoder.request_resync()
+            if encoder.current is not None:
+                subscription.offer(encoder.current)
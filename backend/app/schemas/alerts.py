@@ -19,6 +19,8 @@ class AlertItem(BaseModel):
     namespace: str | None = None
     start_time: datetime
     recommendation: str
+    count: int = 1
+    last_seen: datetime | None = None
 
 
 class AlertListResponse(BaseModel):
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -10,6 +11,12 @@ class NamespaceUsage(BaseModel):
     pod_count: int
 
 
+class SummarySection(BaseModel):
+    status: Literal["ok", "stale", "error"] = "ok"
+    error: str | None = None
+    updated_at: datetime | None = None
+
+
 class ClusterSummary(BaseModel):
     cluster_id: str = "cluster-local"
     generated_at: datetime
@@ -31,3 +38,37 @@ class ClusterSummary(BaseModel):
     risk_score: float = Field(ge=0, le=100)
 
     top_namespaces: list[NamespaceUsage]
+
+    partial: bool = False
+    sections: dict[str, SummarySection] = Field(default_factory=dict)
+
+
+class FleetClusterSummary(BaseModel):
+    cluster_id: str
+    name: str
+    status: Literal["ok", "stale", "error"] = "ok"
+    error: str | None = None
+    summary: ClusterSummary | None = None
+
+
+class FleetTotals(BaseModel):
+    clusters_total: int = 0
+    clusters_ok: int = 0
+    nodes_total: int = 0
+    nodes_ready: int = 0
+    pods_total: int = 0
+    pods_pending: int = 0
+    pods_crashloop: int = 0
+    pods_oomkilled: int = 0
+    cpu_usage_cores: float = 0
+    cpu_capacity_cores: float = 0
+    memory_usage_bytes: float = 0
+    memory_capacity_bytes: float = 0
+    alerts_count: int = 0
+    max_risk_score: float = 0
+
+
+class FleetOverview(BaseModel):
+    generated_at: datetime
+    totals: FleetTotals
+    clusters: list[FleetClusterSummary] = Field(default_factory=list)
@@ -28,6 +28,10 @@ class WorkloadListResponse(BaseModel):
     kind: ResourceKind
     total: int
     items: list[WorkloadItem]
+    next_cursor: str | None = None
+    total_estimate: int | None = None
+    server_side_filters: list[str] = Field(default_factory=list)
+    local_filters: list[str] = Field(default_factory=list)
 
 
 class ScaleRequest(BaseModel):
@@ -64,6 +68,7 @@ class ResourceMetricSeries(BaseModel):
     label: str
     unit: str
     points: list[ResourceMetricPoint] = Field(default_factory=list)
+    error: str | None = None
 
 
 class ResourceMetricsPanel(BaseModel):
@@ -76,6 +81,7 @@ class ResourceDetailResponse(BaseModel):
     item: WorkloadItem
     manifest: dict[str, Any] = Field(default_factory=dict)
     events: list[ResourceEvent] = Field(default_factory=list)
+    events_error: str | None = None
     metrics: ResourceMetricsPanel | None = None
 
 
@@ -4,10 +4,13 @@ from app.service.audit import AuditService
 from app.service.cluster import ClusterService
 from app.service.metrics import MetricsService
 from app.service.overview import OverviewService
+from app.service.overview_stream import OverviewBroadcaster, OverviewDeltaEncoder
 from app.service.resources import ResourceService
 
 __all__ = [
     "OverviewService",
+    "OverviewBroadcaster",
+    "OverviewDeltaEncoder",
     "MetricsService",
     "ResourceService",
     "AlertService",
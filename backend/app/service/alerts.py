@@ -1,85 +1,162 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
+from collections.abc import Hashable, Iterable
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
 from app.collector.kubernetes import KubernetesCollector
 from app.collector.prometheus import PrometheusCollector
+from app.collector.records import EventRecord
 from app.schemas.alerts import AlertItem, AlertListResponse, AlertSeverity
+from app.service.snapshots import SnapshotStore, snapshot_key
 
 if TYPE_CHECKING:
     from app.db.models import ManagedCluster
 
+AlertOrder = Literal["time", "severity"]
 
-class AlertService:
-    def __init__(
-        self,
-        k8s_collector: KubernetesCollector,
-        prometheus_collector: PrometheusCollector,
-    ) -> None:
-        self.k8s_collector = k8s_collector
-        self.prometheus_collector = prometheus_collector
+_SEVERITY_RANK = {AlertSeverity.p1: 3, AlertSeverity.p2: 2, AlertSeverity.p3: 1}
 
-    async def get_alerts(
-        self,
-        namespace: str | None = None,
-        limit: int = 50,
-        cluster: ManagedCluster | None = None,
-    ) -> AlertListResponse:
-        events = await self.k8s_collector.list_events(namespace=namespace, cluster=cluster)
-        prom_alerts = await self.prometheus_collector.get_firing_alerts(cluster=cluster)
+EventKey = tuple[str, str]
+GroupKey = tuple[str, str, str, str]
 
-        items: list[AlertItem] = []
 
-        for event in events:
-            event_type = event.get("type", "Normal")
-            if event_type == "Normal":
+class AlertStore:
+    def __init__(self) -> None:
+        self._events: dict[EventKey, EventRecord] = {}
+        self._groups: dict[GroupKey, dict[EventKey, EventRecord]] = {}
+        self._prometheus: dict[str, tuple[dict[str, Any], AlertItem]] = {}
+        self._items: dict[Hashable, AlertItem] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def ingest_events(self, records: Iterable[EventRecord], namespace: str | None = None) -> None:
+        seen: set[EventKey] = set()
+        dirty: set[GroupKey] = set()
+        for record in records:
+            if record.type == "Normal":
+                continue
+            key = (record.namespace, record.name)
+            seen.add(key)
+            previous = self._events.get(key)
+            # Informer-backed records are reused until the event changes, so most are skipped here.
+            if previous is record or previous == record:
                 continue
+            if previous is not None:
+                dirty.add(self._leave_group(key, previous))
+            self._events[key] = record
+            group_key = self._group_key(record)
+            self._groups.setdefault(group_key, {})[key] = record
+            dirty.add(group_key)
+
+        gone = [
+            key for key in self._events if key not in seen and (namespace is None or key[0] == namespace)
+        ]
+        for key in gone:
+            dirty.add(self._leave_group(key, self._events.pop(key)))
+        for group_key in dirty:
+            self._rebuild_event_alert(group_key)
+
+    def ingest_prometheus(self, alerts: Iterable[dict[str, Any]], now: datetime | None = None) -> None:
+        now = now or datetime.now(UTC)
+        firing: dict[str, tuple[dict[str, Any], AlertItem]] = {}
+        for alert in alerts:
+            fingerprint = alert["fingerprint"]
+            previous = self._prometheus.get(fingerprint)
+            if previous is not None and previous[0] == alert:
+                firing[fingerprint] = previous
+                continue
+            first_seen = previous[1].start_time if previous is not None else now
+            firing[fingerprint] = (alert, self._prometheus_alert(alert, first_seen))
+
+        for fingerprint in self._prometheus.keys() - firing.keys():
+            self._items.pop(("prometheus", fingerprint), None)
+        for fingerprint, (_, item) in firing.items():
+            self._items[("prometheus", fingerprint)] = item
+        self._prometheus = firing
+
+    def prometheus_alert(self, fingerprint: str) -> AlertItem | None:
+        entry = self._prometheus.get(fingerprint)
+        return entry[1] if entry is not None else None
 
-            reason = event.get("reason", "Unknown")
-            severity = self._severity_from_reason(reason)
-
-            event_ts = event.get("lastTimestamp") or event.get("eventTime")
-            if event_ts:
-                try:
-                    start_time = datetime.fromisoformat(event_ts.replace("Z", "+00:00"))
-                except ValueError:
-                    start_time = datetime.now(UTC)
-            else:
-                start_time = datetime.now(UTC)
-
-            items.append(
-                AlertItem(
-                    id=f"k8s-{event.get('metadata', {}).get('name', 'unknown')}",
-                    severity=severity,
-                    source="k8s-event",
-                    title=reason,
-                    message=event.get("message", "Kubernetes warning event"),
-                    namespace=event.get("metadata", {}).get("namespace"),
-                    start_time=start_time,
-                    recommendation=self._recommendation_for_reason(reason),
-                )
-            )
-
-        for idx, alert in enumerate(prom_alerts, start=1):
-            sev = alert.get("severity", "warning").lower()
-            mapped = AlertSeverity.p2 if sev in {"warning", "medium"} else AlertSeverity.p1
-
-            items.append(
-                AlertItem(
-                    id=f"prom-{idx}",
-                    severity=mapped,
-                    source="prometheus",
-                    title=alert.get("name", "PrometheusAlert"),
-                    message=alert.get("summary", "Prometheus alert is firing"),
-                    namespace=alert.get("namespace"),
-                    start_time=datetime.now(UTC),
-                    recommendation="Review firing alert labels and correlate with recent deployments.",
-                )
-            )
-
-        items.sort(key=lambda item: item.start_time, reverse=True)
-        return AlertListResponse(total=min(len(items), limit), items=items[:limit])
+    def top(
+        self,
+        limit: int,
+        namespace: str | None = None,
+        order: AlertOrder = "time",
+    ) -> list[AlertItem]:
+        # Prometheus alerts have never been scoped by the namespace filter.
+        candidates = (
+            item
+            for item in self._items.values()
+            if namespace is None or item.source == "prometheus" or item.namespace == namespace
+        )
+        if order == "severity":
+            return heapq.nlargest(limit, candidates, key=_severity_order)
+        return heapq.nlargest(limit, candidates, key=_time_order)
+
+    def _leave_group(self, key: EventKey, record: EventRecord) -> GroupKey:
+        group_key = self._group_key(record)
+        members = self._groups.get(group_key)
+        if members is not None:
+            members.pop(key, None)
+        return group_key
+
+    def _rebuild_event_alert(self, group_key: GroupKey) -> None:
+        members = self._groups.get(group_key)
+        if not members:
+            self._groups.pop(group_key, None)
+            self._items.pop(group_key, None)
+            return
+
+        now = datetime.now(UTC)
+        latest = max(members.values(), key=lambda record: record.timestamp)
+        reason = latest.reason
+        self._items[group_key] = AlertItem(
+            id=f"k8s-{_digest(group_key)}",
+            severity=self._severity_from_reason(reason),
+            source="k8s-event",
+            title=reason,
+            message=latest.message or "Kubernetes warning event",
+            namespace=latest.namespace,
+            start_time=min(
+                _parse_timestamp(record.first_timestamp or record.timestamp, now)
+                for record in members.values()
+            ),
+            last_seen=_parse_timestamp(latest.timestamp, now),
+            count=sum(record.count for record in members.values()),
+            recommendation=self._recommendation_for_reason(reason),
+        )
+
+    @staticmethod
+    def _prometheus_alert(alert: dict[str, Any], first_seen: datetime) -> AlertItem:
+        severity = alert.get("severity", "warning").lower()
+        active_at = alert.get("active_at")
+        # Alerts without a `for` clause have no ALERTS_FOR_STATE series; fall back to first seen.
+        start_time = datetime.fromtimestamp(active_at, tz=UTC) if active_at else first_seen
+        return AlertItem(
+            id=f"prom-{alert['fingerprint']}",
+            severity=AlertSeverity.p2 if severity in {"warning", "medium"} else AlertSeverity.p1,
+            source="prometheus",
+            title=alert.get("name", "PrometheusAlert"),
+            message=alert.get("summary", "Prometheus alert is firing"),
+            namespace=alert.get("namespace"),
+            start_time=start_time,
+            last_seen=start_time,
+            recommendation="Review firing alert labels and correlate with recent deployments.",
+        )
+
+    @staticmethod
+    def _group_key(record: EventRecord) -> GroupKey:
+        return (
+            record.involved_namespace or record.namespace,
+            record.reason,
+            record.involved_kind,
+            record.involved_name or record.name,
+        )
 
     @staticmethod
     def _severity_from_reason(reason: str) -> AlertSeverity:
@@ -100,3 +177,78 @@ class AlertService:
         if reason_low == "failedscheduling":
             return "Inspect node allocatable resources and affinity/toleration constraints."
         return "Inspect workload events and recent deployment/config changes."
+
+
+class AlertService:
+    def __init__(
+        self,
+        k8s_collector: KubernetesCollector,
+        prometheus_collector: PrometheusCollector,
+        snapshots: SnapshotStore | None = None,
+    ) -> None:
+        self.k8s_collector = k8s_collector
+        self.prometheus_collector = prometheus_collector
+        self.snapshots = snapshots or SnapshotStore()
+        self._stores: dict[str, AlertStore] = {}
+
+    async def get_alerts(
+        self,
+        namespace: str | None = None,
+        limit: int = 50,
+        cluster: ManagedCluster | None = None,
+        order: AlertOrder = "time",
+    ) -> AlertListResponse:
+        snapshot = self.snapshots.get(cluster, "events")
+        if snapshot is not None:
+            # The scheduled snapshot covers every namespace, so it can refresh the whole store.
+            events, scope = snapshot.value, None
+        else:
+            events = await self.k8s_collector.list_event_records(namespace=namespace, cluster=cluster)
+            scope = namespace
+        prom_alerts = await self.snapshots.read(
+            cluster,
+            "alerts",
+            lambda: self.prometheus_collector.get_firing_alerts(cluster=cluster),
+        )
+
+        store = self._store_for(cluster)
+        store.ingest_events(events, namespace=scope)
+        store.ingest_prometheus(prom_alerts)
+
+        items = store.top(limit, namespace=namespace, order=order)
+        return AlertListResponse(total=len(items), items=items)
+
+    def forget_cluster(self, cluster_id: str) -> None:
+        self._stores.pop(cluster_id, None)
+
+    def _store_for(self, cluster: ManagedCluster | None) -> AlertStore:
+        cluster_key = snapshot_key(cluster)
+        # Connection probes have no cluster_id; give them a throwaway store.
+        if not cluster_key:
+            return AlertStore()
+        store = self._stores.get(cluster_key)
+        if store is None:
+            store = self._stores[cluster_key] = AlertStore()
+        return store
+
+
+def _time_order(item: AlertItem) -> datetime:
+    return item.last_seen or item.start_time
+
+
+def _severity_order(item: AlertItem) -> tuple[int, datetime]:
+    return _SEVERITY_RANK[item.severity], _time_order(item)
+
+
+def _digest(key: Hashable) -> str:
+    return hashlib.sha1(repr(key).encode(), usedforsecurity=False).hexdigest()[:16]
+
+
+def _parse_timestamp(value: str, default: datetime) -> datetime:
+    if not value:
+        return default
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return default
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
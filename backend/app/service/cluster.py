@@ -20,6 +20,10 @@ from app.schemas.cluster import (
     ManagedClusterRead,
     ManagedClusterUpdate,
 )
+from app.service.alerts import AlertService
+from app.service.overview_stream import OverviewBroadcaster
+from app.service.scheduler import CollectionScheduler
+from app.service.snapshots import SnapshotStore
 
 
 @dataclass
@@ -36,11 +40,19 @@ class ClusterService:
         k8s_collector: KubernetesCollector,
         prometheus_collector: PrometheusCollector,
         settings: Settings,
+        alert_service: AlertService,
+        snapshots: SnapshotStore | None = None,
+        scheduler: CollectionScheduler | None = None,
+        broadcaster: OverviewBroadcaster | None = None,
     ) -> None:
         self.repo = repo
         self.k8s_collector = k8s_collector
         self.prometheus_collector = prometheus_collector
         self.settings = settings
+        self.alert_service = alert_service
+        self.snapshots = snapshots or SnapshotStore()
+        self.scheduler = scheduler
+        self.broadcaster = broadcaster
 
     async def list_clusters(self, db: AsyncSession) -> ManagedClusterListResponse:
         rows = await self.repo.list(db)
@@ -85,14 +97,42 @@ class ClusterService:
             if existing_by_name and existing_by_name.id != row.id:
                 raise ValueError(f"name '{payload.name}' already exists")
 
+        previous_cluster_id = row.cluster_id
         row = await self.repo.update(db, row, payload)
+        await self._forget_cluster(previous_cluster_id)
+        if self.scheduler is not None:
+            self.scheduler.track_cluster(row)
+        if self.broadcaster is not None:
+            # Open overview sockets follow an edited connection; a renamed or disabled
+            # cluster ends them, as a fresh subscribe would be refused.
+            if row.is_active and row.cluster_id == previous_cluster_id:
+                self.broadcaster.restart_cluster(row)
+            else:
+                self.broadcaster.close_cluster(previous_cluster_id)
         return self._to_read(row)
 
     async def delete_cluster(self, db: AsyncSession, cluster_pk: int) -> None:
         row = await self.repo.get(db, cluster_pk)
         if not row:
             raise ValueError("Cluster not found")
+        cluster_id = row.cluster_id
         await self.repo.delete(db, row)
+        await self._forget_cluster(cluster_id)
+        if self.broadcaster is not None:
+            self.broadcaster.close_cluster(cluster_id)
+
+    async def _forget_cluster(self, cluster_id: str) -> None:
+        # Stop the scheduled pollers and overview producers first so none of them re-opens a
+        # pool or an informer with the old connection settings after the collectors have
+        # dropped theirs.
+        if self.scheduler is not None:
+            await self.scheduler.forget_cluster(cluster_id)
+        if self.broadcaster is not None:
+            await self.broadcaster.stop_cluster(cluster_id)
+        await self.k8s_collector.forget_cluster(cluster_id)
+        await self.prometheus_collector.forget_cluster(cluster_id)
+        self.alert_service.forget_cluster(cluster_id)
+        self.snapshots.discard_cluster(cluster_id)
 
     async def test_connection_payload(
         self,
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.collector.singleflight import SingleFlight
+from app.repository.cluster import ClusterRepository
+from app.schemas.overview import ClusterSummary, FleetClusterSummary, FleetOverview, FleetTotals
+from app.service.overview import OverviewService
+
+if TYPE_CHECKING:
+    from app.db.models import ManagedCluster
+
+logger = logging.getLogger(__name__)
+
+
+class FleetOverviewService:
+    def __init__(
+        self,
+        overview_service: OverviewService,
+        cluster_repo: ClusterRepository,
+        session_factory: Callable[[], contextlib.AbstractAsyncContextManager[AsyncSession]],
+        refresh_interval_seconds: float = 30,
+        max_concurrency: int = 4,
+        cluster_timeout_seconds: float = 10.0,
+        idle_seconds: float = 600,
+    ) -> None:
+        self.overview_service = overview_service
+        self.cluster_repo = cluster_repo
+        self.session_factory = session_factory
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.max_concurrency = max_concurrency
+        self.cluster_timeout_seconds = cluster_timeout_seconds
+        self.idle_seconds = idle_seconds
+        self._snapshot: FleetOverview | None = None
+        self._last_good: dict[str, ClusterSummary] = {}
+        self._single_flight = SingleFlight()
+        self._task: asyncio.Task[None] | None = None
+        self._last_read = time.monotonic()
+
+    async def get_fleet(self) -> FleetOverview:
+        self._last_read = time.monotonic()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="fleet-overview")
+        if self._snapshot is None:
+            return await self._single_flight.do("fleet", self.refresh)
+        return self._snapshot
+
+    async def refresh(self) -> FleetOverview:
+        async with self.session_factory() as db:
+            clusters = [cluster for cluster in await self.cluster_repo.list(db) if cluster.is_active]
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        entries = await asyncio.gather(*(self._collect(cluster, semaphore) for cluster in clusters))
+        active = {entry.cluster_id for entry in entries}
+        for cluster_id in self._last_good.keys() - active:
+            del self._last_good[cluster_id]
+
+        self._snapshot = FleetOverview(
+            generated_at=datetime.now(UTC),
+            totals=self._totals(entries),
+            clusters=entries,
+        )
+        return self._snapshot
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self) -> None:
+        while time.monotonic() - self._last_read < self.idle_seconds:
+            await asyncio.sleep(self.refresh_interval_seconds)
+            try:
+                await self._single_flight.do("fleet", self.refresh)
+            except Exception:
+                logger.exception("fleet overview refresh failed")
+
+    async def _collect(self, cluster: ManagedCluster, semaphore: asyncio.Semaphore) -> FleetClusterSummary:
+        async with semaphore:
+            try:
+                summary = await asyncio.wait_for(
+                    self.overview_service.get_cluster_summary(cluster=cluster),
+                    timeout=self.cluster_timeout_seconds,
+                )
+            except Exception as exc:  # noqa: BLE001 - one failing cluster must not break the fleet view
+                last_good = self._last_good.get(cluster.cluster_id)
+                return FleetClusterSummary(
+                    cluster_id=cluster.cluster_id,
+                    name=cluster.name,
+                    status="stale" if last_good else "error",
+                    error=self._summarize_exception(exc),
+                    summary=last_good,
+                )
+
+        self._last_good[cluster.cluster_id] = summary
+        return FleetClusterSummary(cluster_id=cluster.cluster_id, name=cluster.name, summary=summary)
+
+    def _summarize_exception(self, exc: Exception) -> str:
+        if isinstance(exc, TimeoutError):
+            return f"timed out after {self.cluster_timeout_seconds:g}s"
+        return str(exc) or exc.__class__.__name__
+
+    @staticmethod
+    def _totals(entries: list[FleetClusterSummary]) -> FleetTotals:
+        totals = FleetTotals(
+            clusters_total=len(entries),
+            clusters_ok=sum(1 for entry in entries if entry.status == "ok"),
+        )
+        for entry in entries:
+            summary = entry.summary
+            if summary is None:
+                continue
+            totals.nodes_total += summary.nodes_total
+            totals.nodes_ready += summary.nodes_ready
+            totals.pods_total += summary.pods_total
+            totals.pods_pending += summary.pods_pending
+            totals.pods_crashloop += summary.pods_crashloop
+            totals.pods_oomkilled += summary.pods_oomkilled
+            totals.cpu_usage_cores += summary.cpu_usage_cores
+            totals.cpu_capacity_cores += summary.cpu_capacity_cores
+            totals.memory_usage_bytes += summary.memory_usage_bytes
+            totals.memory_capacity_bytes += summary.memory_capacity_bytes
+            totals.alerts_count += summary.alerts_count
+            totals.max_risk_score = max(totals.max_risk_score, summary.risk_score)
+        return totals
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import orjson
+
+from app.collector.kubernetes import KubernetesCollector
+from app.collector.logs import batch_lines
+
+if TYPE_CHECKING:
+    from app.db.models import ManagedCluster
+
+
+class LogFollowLimitError(Exception):
+    pass
+
+
+class LogFollowService:
+    def __init__(
+        self,
+        k8s_collector: KubernetesCollector,
+        max_follows_per_user: int = 3,
+        batch_interval_seconds: float = 0.05,
+        batch_max_bytes: int = 64 * 1024,
+    ) -> None:
+        self.k8s_collector = k8s_collector
+        self.max_follows_per_user = max_follows_per_user
+        self.batch_interval_seconds = batch_interval_seconds
+        self.batch_max_bytes = batch_max_bytes
+        self._active: dict[str, int] = {}
+
+    def active_follows(self, username: str) -> int:
+        return self._active.get(username, 0)
+
+    async def follow(
+        self,
+        *,
+        username: str,
+        kind: str,
+        name: str,
+        namespace: str,
+        tail_lines: int = 120,
+        cluster: ManagedCluster | None = None,
+    ) -> AsyncIterator[bytes]:
+        # Resolve the pod before the response starts so a missing workload is still a 404.
+        pod_name = await self.k8s_collector.resolve_log_pod(
+            kind=kind,
+            name=name,
+            namespace=namespace,
+            cluster=cluster,
+        )
+        if self.active_follows(username) >= self.max_follows_per_user:
+            raise LogFollowLimitError(
+                f"At most {self.max_follows_per_user} concurrent log follows are allowed per user"
+            )
+
+        lines = self.k8s_collector.follow_pod_logs(
+            namespace=namespace,
+            pod_name=pod_name,
+            tail_lines=tail_lines,
+            cluster=cluster,
+        )
+        return self._events(username, pod_name, lines)
+
+    async def _events(
+        self,
+        username: str,
+        pod_name: str,
+        lines: AsyncIterator[str],
+    ) -> AsyncIterator[bytes]:
+        # The slot is taken only once the response is actually iterated, so a stream that never
+        # starts (client gone, error before the body) cannot leak it.
+        if self.active_follows(username) >= self.max_follows_per_user:
+            yield _sse("error", {"message": "Too many concurrent log follows"})
+            return
+        self._active[username] = self.active_follows(username) + 1
+        try:
+            yield _sse("open", {"pod": pod_name})
+            # Close the batcher explicitly so a client disconnect also tears down the upstream read.
+            batches = batch_lines(lines, self.batch_interval_seconds, self.batch_max_bytes)
+            async with aclosing(batches):
+                async for batch in batches:
+                    yield _sse("lines", batch)
+            yield _sse("end", {"pod": pod_name})
+        except (httpx.HTTPError, ValueError) as exc:
+            yield _sse("error", {"message": str(exc) or exc.__class__.__name__})
+        finally:
+            remaining = self._active.get(username, 1) - 1
+            if remaining > 0:
+                self._active[username] = remaining
+            else:
+                self._active.pop(username, None)
+
+
+def _sse(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
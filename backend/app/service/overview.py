@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import httpx
 
 from app.collector.kubernetes import KubernetesCollector
 from app.collector.prometheus import PrometheusCollector
-from app.schemas.overview import ClusterSummary, NamespaceUsage
+from app.schemas.alerts import AlertListResponse
+from app.schemas.overview import ClusterSummary, NamespaceUsage, SummarySection
 from app.service.alerts import AlertService
+from app.service.snapshots import SnapshotStore
 
 if TYPE_CHECKING:
     from app.db.models import ManagedCluster
@@ -18,20 +24,86 @@ class OverviewService:
         k8s_collector: KubernetesCollector,
         prometheus_collector: PrometheusCollector,
         alert_service: AlertService,
+        source_timeout_seconds: float = 5.0,
+        snapshots: SnapshotStore | None = None,
     ) -> None:
         self.k8s_collector = k8s_collector
         self.prometheus_collector = prometheus_collector
         self.alert_service = alert_service
+        self.source_timeout_seconds = source_timeout_seconds
+        self.snapshots = snapshots or SnapshotStore()
+        self._last_good: dict[tuple[str, str], tuple[Any, datetime]] = {}
+
+    def forget_cluster(self, cluster_key: str) -> None:
+        for key in [key for key in self._last_good if key[0] == cluster_key]:
+            del self._last_good[key]
 
     async def get_cluster_summary(self, cluster: ManagedCluster | None = None) -> ClusterSummary:
-        nodes = await self.k8s_collector.list_nodes(cluster=cluster)
-        pods = await self.k8s_collector.list_pods(cluster=cluster)
-        alerts = await self.alert_service.get_alerts(limit=100, cluster=cluster)
-        usage = await self.prometheus_collector.get_cluster_usage(cluster=cluster)
-        top_ns = await self.prometheus_collector.get_namespace_usage(limit=5, cluster=cluster)
+        cluster_key = cluster.cluster_id if cluster else "cluster-local"
+        (
+            (nodes, nodes_section),
+            (pods, pods_section),
+            (alerts, alerts_section),
+            (usage, usage_section),
+            (top_ns, namespaces_section),
+        ) = await asyncio.gather(
+            self._collect(
+                cluster_key,
+                "nodes",
+                self.snapshots.read(
+                    cluster,
+                    "nodes",
+                    lambda: self.k8s_collector.list_node_records(cluster=cluster),
+                ),
+                [],
+            ),
+            self._collect(
+                cluster_key,
+                "pods",
+                self.snapshots.read(
+                    cluster,
+                    "pods",
+                    lambda: self.k8s_collector.list_pod_records(cluster=cluster),
+                ),
+                [],
+            ),
+            self._collect(
+                cluster_key,
+                "alerts",
+                self.alert_service.get_alerts(limit=100, cluster=cluster),
+                AlertListResponse(total=0, items=[]),
+            ),
+            self._collect(
+                cluster_key,
+                "usage",
+                self.snapshots.read(
+                    cluster,
+                    "usage",
+                    lambda: self.prometheus_collector.get_cluster_usage(cluster=cluster),
+                ),
+                {},
+            ),
+            self._collect(
+                cluster_key,
+                "namespaces",
+                self.snapshots.read(
+                    cluster,
+                    "namespaces",
+                    lambda: self.prometheus_collector.get_namespace_usage(limit=5, cluster=cluster),
+                ),
+                [],
+            ),
+        )
+        sections = {
+            "nodes": nodes_section,
+            "pods": pods_section,
+            "alerts": alerts_section,
+            "usage": usage_section,
+            "namespaces": namespaces_section,
+        }
 
         nodes_total = len(nodes)
-        nodes_ready = sum(1 for node in nodes if self._is_node_ready(node))
+        nodes_ready = sum(1 for node in nodes if node.ready)
 
         pods_total = len(pods)
         pods_pending = 0
@@ -39,25 +111,12 @@ class OverviewService:
         pods_oomkilled = 0
 
         for pod in pods:
-            phase = pod.get("status", {}).get("phase", "Unknown")
-            if phase == "Pending":
+            if pod.phase == "Pending":
                 pods_pending += 1
-
-            for status in pod.get("status", {}).get("containerStatuses", []):
-                waiting_reason = (
-                    status.get("state", {})
-                    .get("waiting", {})
-                    .get("reason")
-                )
-                last_reason = (
-                    status.get("lastState", {})
-                    .get("terminated", {})
-                    .get("reason")
-                )
-                if waiting_reason == "CrashLoopBackOff":
-                    pods_crashloop += 1
-                if last_reason == "OOMKilled":
-                    pods_oomkilled += 1
+            if pod.is_crashloop:
+                pods_crashloop += 1
+            if pod.is_oomkilled:
+                pods_oomkilled += 1
 
         risk_score = self._risk_score(
             nodes_total=nodes_total,
@@ -70,7 +129,7 @@ class OverviewService:
         )
 
         return ClusterSummary(
-            cluster_id=cluster.cluster_id if cluster else "cluster-local",
+            cluster_id=cluster_key,
             generated_at=datetime.now(UTC),
             nodes_total=nodes_total,
             nodes_ready=nodes_ready,
@@ -93,15 +152,39 @@ class OverviewService:
                 )
                 for item in top_ns
             ],
+            partial=any(section.status != "ok" for section in sections.values()),
+            sections=sections,
         )
 
-    @staticmethod
-    def _is_node_ready(node: dict) -> bool:
-        conditions = node.get("status", {}).get("conditions", [])
-        for cond in conditions:
-            if cond.get("type") == "Ready":
-                return cond.get("status") == "True"
-        return False
+    async def _collect(
+        self,
+        cluster_key: str,
+        source: str,
+        call: Awaitable[Any],
+        default: Any,
+    ) -> tuple[Any, SummarySection]:
+        try:
+            value = await asyncio.wait_for(call, timeout=self.source_timeout_seconds)
+        except Exception as exc:  # noqa: BLE001 - one failing source must not break the summary
+            error = self._summarize_exception(exc)
+            last_good = self._last_good.get((cluster_key, source))
+            if last_good is None:
+                return default, SummarySection(status="error", error=error)
+            value, updated_at = last_good
+            return value, SummarySection(status="stale", error=error, updated_at=updated_at)
+
+        updated_at = datetime.now(UTC)
+        self._last_good[(cluster_key, source)] = (value, updated_at)
+        return value, SummarySection(status="ok", updated_at=updated_at)
+
+    def _summarize_exception(self, exc: Exception) -> str:
+        if isinstance(exc, TimeoutError):
+            return f"timed out after {self.source_timeout_seconds:g}s"
+        if isinstance(exc, httpx.HTTPStatusError):
+            return f"HTTP {exc.response.status_code}"
+        if isinstance(exc, httpx.RequestError):
+            return exc.__class__.__name__
+        return str(exc) or exc.__class__.__name__
 
     @staticmethod
     def _risk_score(
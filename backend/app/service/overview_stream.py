@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
+
+from app.service.overview import OverviewService
+
+if TYPE_CHECKING:
+    from app.db.models import ManagedCluster
+
+logger = logging.getLogger(__name__)
+
+
+class OverviewSubscription:
+    def __init__(self) -> None:
+        self._frame: dict[str, Any] = {}
+        self._ready = asyncio.Event()
+        self.dropped_frames = 0
+        self.closed = False
+
+    def offer(self, frame: dict[str, Any]) -> None:
+        # Slow consumers only ever see the latest frame; unsent ones are replaced.
+        if self._ready.is_set():
+            self.dropped_frames += 1
+        self._frame = frame
+        self._ready.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    async def next_frame(self) -> dict[str, Any] | None:
+        await self._ready.wait()
+        if self.closed:
+            return None
+        self._ready.clear()
+        return self._frame
+
+
+class OverviewDeltaEncoder:
+    def __init__(self) -> None:
+        self.seq = 0
+        self.current: dict[str, Any] | None = None
+        self._resync = True
+
+    def request_resync(self) -> None:
+        self._resync = True
+
+    def encode(self, frame: dict[str, Any]) -> dict[str, Any] | None:
+        previous, self.current = self.current, frame
+        if self._resync or previous is None:
+            self._resync = False
+            self.seq += 1
+            return {"type": "snapshot", "seq": self.seq, "data": frame}
+
+        ops = diff_json(previous, frame)
+        if not ops:
+            return None
+        self.seq += 1
+        return {"type": "patch", "seq": self.seq, "ops": ops}
+
+
+def diff_json(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = []
+        for key, value in new.items():
+            child = f"{path}/{_escape_pointer(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff_json(old[key], value, child))
+        for key in old.keys() - new.keys():
+            ops.append({"op": "remove", "path": f"{path}/{_escape_pointer(key)}"})
+        return ops
+
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _escape_pointer(key: str) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+class _OverviewChannel:
+    def __init__(self, cluster: ManagedCluster | None) -> None:
+        self.cluster = cluster
+        self.subscribers: set[OverviewSubscription] = set()
+        self.latest: dict[str, Any] | None = None
+        self.task: asyncio.Task[None] | None = None
+
+
+class OverviewBroadcaster:
+    def __init__(self, overview_service: OverviewService, interval_seconds: float) -> None:
+        self.overview_service = overview_service
+        self.interval_seconds = interval_seconds
+        self._channels: dict[str, _OverviewChannel] = {}
+
+    def subscriber_count(self, cluster_key: str) -> int:
+        channel = self._channels.get(cluster_key)
+        return len(channel.subscribers) if channel else 0
+
+    @contextlib.asynccontextmanager
+    async def subscribe(
+        self,
+        cluster: ManagedCluster | None = None,
+    ) -> AsyncIterator[OverviewSubscription]:
+        cluster_key = cluster.cluster_id if cluster else "cluster-local"
+        channel = self._channels.get(cluster_key)
+        if channel is None:
+            channel = _OverviewChannel(cluster)
+            self._channels[cluster_key] = channel
+
+        subscription = OverviewSubscription()
+        channel.subscribers.add(subscription)
+        if channel.latest is not None:
+            subscription.offer(channel.latest)
+        if channel.task is None:
+            self._start(cluster_key, channel)
+
+        try:
+            yield subscription
+        finally:
+            channel.subscribers.discard(subscription)
+            if not channel.subscribers and self._channels.get(cluster_key) is channel:
+                del self._channels[cluster_key]
+                await self._stop(channel)
+
+    async def stop_cluster(self, cluster_key: str) -> None:
+        self.overview_service.forget_cluster(cluster_key)
+        channel = self._channels.get(cluster_key)
+        if channel is not None:
+            await self._stop(channel)
+
+    def restart_cluster(self, cluster: ManagedCluster) -> None:
+        channel = self._channels.get(cluster.cluster_id)
+        if channel is None:
+            return
+        channel.cluster = cluster
+        channel.latest = None
+        if channel.task is None:
+            self._start(cluster.cluster_id, channel)
+
+    def close_cluster(self, cluster_key: str) -> None:
+        channel = self._channels.pop(cluster_key, None)
+        if channel is None:
+            return
+        for subscription in channel.subscribers:
+            subscription.close()
+
+    async def close(self) -> None:
+        channels = list(self._channels.values())
+        self._channels.clear()
+        for channel in channels:
+            await self._stop(channel)
+
+    async def _produce(self, channel: _OverviewChannel) -> None:
+        while True:
+            try:
+                summary = await self.overview_service.get_cluster_summary(cluster=channel.cluster)
+            except Exception:
+                # Keep streaming to the remaining subscribers.
+                logger.exception("overview broadcast tick failed")
+            else:
+                channel.latest = summary.model_dump(mode="json")
+                for subscription in channel.subscribers:
+                    subscription.offer(channel.latest)
+            await asyncio.sleep(self.interval_seconds)
+
+    def _start(self, cluster_key: str, channel: _OverviewChannel) -> None:
+        channel.task = asyncio.create_task(
+            self._produce(channel),
+            name=f"overview-broadcast:{cluster_key}",
+        )
+
+    @staticmethod
+    async def _stop(channel: _OverviewChannel) -> None:
+        task, channel.task = channel.task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
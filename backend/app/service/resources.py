@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
@@ -8,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.collector.kubernetes import KubernetesCollector
 from app.collector.prometheus import PrometheusCollector
+from app.collector.records import EventRecord, WorkloadRecord
 from app.db.models import User
 from app.repository.audit import AuditRepository
 from app.schemas.resource import (
@@ -21,21 +23,35 @@ from app.schemas.resource import (
     WorkloadItem,
     WorkloadListResponse,
 )
+from app.service.snapshots import SnapshotStore
 
 if TYPE_CHECKING:
     from app.db.models import ManagedCluster
 
 
 class ResourceService:
+    # Lightest list representation that still fills every WorkloadItem field for each kind.
+    # Pods stay on projected objects: the Table Status column is not the phase that the
+    # status filter and the status.phase fieldSelector compare against.
+    list_representations = {
+        "deployment": "table",
+        "statefulset": "table",
+        "daemonset": "metadata",
+        "service": "metadata",
+        "ingress": "metadata",
+    }
+
     def __init__(
         self,
         k8s_collector: KubernetesCollector,
         prometheus_collector: PrometheusCollector,
         audit_repo: AuditRepository,
+        snapshots: SnapshotStore | None = None,
     ) -> None:
         self.k8s_collector = k8s_collector
         self.prometheus_collector = prometheus_collector
         self.audit_repo = audit_repo
+        self.snapshots = snapshots or SnapshotStore()
 
     async def list_resources(
         self,
@@ -43,20 +59,76 @@ class ResourceService:
         namespace: str | None,
         label_selector: str | None,
         status: str | None,
+        node: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
         cluster: ManagedCluster | None = None,
     ) -> WorkloadListResponse:
-        items = await self.k8s_collector.list_resources(
+        plan = self.k8s_collector.plan_list_query(
             kind=kind,
-            namespace=namespace,
             label_selector=label_selector,
-            cluster=cluster,
+            status=status,
+            node_name=node,
         )
-        workloads = [self._to_workload_item(kind, item) for item in items]
+        server_filters = (["namespace"] if namespace else []) + plan.server_filters
+
+        if limit is None:
+            items = await self.k8s_collector.list_resources(
+                kind=kind,
+                namespace=namespace,
+                label_selector=plan.label_selector,
+                field_selector=plan.field_selector,
+                cluster=cluster,
+                representation=self.list_representations.get(kind, "object"),
+            )
+            workloads = self._filter_by_status(
+                [self._to_workload_item(WorkloadRecord.from_object(kind, item)) for item in items],
+                plan.local_status,
+            )
+            return WorkloadListResponse(
+                kind=kind,
+                total=len(workloads),
+                items=workloads,
+                total_estimate=len(workloads),
+                server_side_filters=server_filters,
+                local_filters=plan.local_filters,
+            )
 
-        if status:
-            workloads = [item for item in workloads if item.status.lower() == status.lower()]
+        workloads: list[WorkloadItem] = []
+        next_cursor = cursor
+        total_estimate: int | None = None
+        # Local filters can drop items, so keep pulling pages until this one is full.
+        while True:
+            page = await self.k8s_collector.list_resources_page(
+                kind=kind,
+                namespace=namespace,
+                label_selector=plan.label_selector,
+                field_selector=plan.field_selector,
+                limit=limit - len(workloads),
+                cursor=next_cursor,
+                cluster=cluster,
+                representation=self.list_representations.get(kind, "object"),
+            )
+            workloads.extend(
+                self._filter_by_status(
+                    [self._to_workload_item(WorkloadRecord.from_object(kind, item)) for item in page.items],
+                    plan.local_status,
+                )
+            )
+            next_cursor = page.cursor
+            total_estimate = page.total_estimate
+            if next_cursor is None or len(workloads) >= limit:
+                break
 
-        return WorkloadListResponse(kind=kind, total=len(workloads), items=workloads)
+        return WorkloadListResponse(
+            kind=kind,
+            total=len(workloads),
+            items=workloads,
+            next_cursor=next_cursor,
+            total_estimate=total_estimate,
+            server_side_filters=server_filters,
+            local_filters=plan.local_filters,
+        )
 
     async def get_resource_detail(
         self,
@@ -68,44 +140,65 @@ class ResourceService:
         step_seconds: int = 30,
         cluster: ManagedCluster | None = None,
     ) -> ResourceDetailResponse:
-        resource = await self.k8s_collector.get_resource(
-            kind=kind,
-            name=name,
-            namespace=namespace,
-            cluster=cluster,
+        resource, related, metric_series = await asyncio.gather(
+            self.k8s_collector.get_resource(
+                kind=kind,
+                name=name,
+                namespace=namespace,
+                cluster=cluster,
+            ),
+            self._load_related_events(
+                kind=kind,
+                name=name,
+                namespace=namespace,
+                cluster=cluster,
+            ),
+            self._query_profile_series(
+                kind=kind,
+                name=name,
+                namespace=namespace,
+                range_minutes=range_minutes,
+                step_seconds=step_seconds,
+                cluster=cluster,
+            ),
+            return_exceptions=True,
         )
-        workload = self._to_workload_item(kind, resource)
+        if isinstance(resource, BaseException):
+            raise resource
+        for result in (related, metric_series):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
+        if isinstance(related, Exception):
+            events_raw, events_error = [], self._summarize_exception(related)
+        else:
+            events_raw, events_error = related
+        if isinstance(metric_series, Exception):
+            metric_series = []
 
-        events_raw = await self.k8s_collector.get_related_events(
-            kind=kind,
-            name=name,
-            namespace=namespace,
-            cluster=cluster,
-        )
+        workload = self._to_workload_item(WorkloadRecord.from_object(kind, resource))
         events = [
             ResourceEvent(
-                type=event.get("type", "Normal"),
-                reason=event.get("reason", "Unknown"),
-                message=event.get("message", ""),
-                timestamp=self._normalize_event_timestamp(event),
+                type=event.type,
+                reason=event.reason,
+                message=event.message,
+                timestamp=event.timestamp,
             )
             for event in events_raw
         ]
-
-        metrics = await self._build_detail_metrics(
+        metrics = self._build_detail_metrics(
             kind=kind,
-            name=name,
-            namespace=namespace,
             workload=workload,
+            series=metric_series,
             range_minutes=range_minutes,
             step_seconds=step_seconds,
-            cluster=cluster,
         )
 
         return ResourceDetailResponse(
             item=workload,
             manifest=resource,
             events=events,
+            events_error=events_error,
             metrics=metrics,
         )
 
@@ -117,6 +210,7 @@ class ResourceService:
         namespace: str,
         log_lines: int = 120,
         cluster: ManagedCluster | None = None,
+        all_pods: bool = False,
     ) -> ResourceLogsResponse:
         try:
             logs = await self.k8s_collector.get_resource_logs(
@@ -125,6 +219,7 @@ class ResourceService:
                 namespace=namespace,
                 tail_lines=log_lines,
                 cluster=cluster,
+                all_pods=all_pods,
             )
         except Exception as exc:  # noqa: BLE001 - logs failure should not break detail page
             logs = [f"Unable to load logs: {self._summarize_exception(exc)}."]
@@ -198,24 +293,23 @@ class ResourceService:
         return log.id
 
     @staticmethod
-    def _to_workload_item(kind: str, item: dict) -> WorkloadItem:
-        metadata = item.get("metadata", {})
-        spec = item.get("spec", {})
-        item_status = item.get("status", {})
+    def _filter_by_status(workloads: list[WorkloadItem], status: str | None) -> list[WorkloadItem]:
+        if not status:
+            return workloads
+        return [item for item in workloads if item.status.lower() == status.lower()]
 
-        replicas = spec.get("replicas")
-        available = item_status.get("readyReplicas")
+    @staticmethod
+    def _to_workload_item(record: WorkloadRecord) -> WorkloadItem:
+        kind = record.kind
+        replicas = record.replicas
+        available = record.ready_replicas
 
         ready_ratio = None
         if replicas is not None and replicas > 0:
             ready_ratio = round((available or 0) / replicas, 2)
 
-        restarts = 0
-        for container in item_status.get("containerStatuses", []):
-            restarts += int(container.get("restartCount", 0))
-
         if kind == "pod":
-            status = item_status.get("phase", "Unknown")
+            status = record.phase
         elif kind in {"service", "ingress"}:
             status = "Active"
         else:
@@ -224,24 +318,15 @@ class ResourceService:
             status = "Healthy" if desired == ready else "Degraded"
 
         return WorkloadItem(
-            name=metadata.get("name", "unknown"),
-            namespace=metadata.get("namespace", "default"),
+            name=record.name,
+            namespace=record.namespace,
             kind=kind,
             status=status,
             replicas=replicas,
             available_replicas=available,
             ready_ratio=ready_ratio,
-            restarts=restarts,
-            labels=metadata.get("labels") or {},
-        )
-
-    @staticmethod
-    def _normalize_event_timestamp(event: dict) -> str:
-        return (
-            event.get("lastTimestamp")
-            or event.get("eventTime")
-            or event.get("firstTimestamp")
-            or ""
+            restarts=record.restarts,
+            labels=record.labels,
         )
 
     @staticmethod
@@ -252,42 +337,94 @@ class ResourceService:
             return exc.__class__.__name__
         return str(exc) or exc.__class__.__name__
 
-    async def _build_detail_metrics(
+    async def _load_related_events(
+        self,
+        *,
+        kind: str,
+        name: str,
+        namespace: str,
+        cluster: ManagedCluster | None = None,
+    ) -> tuple[list[EventRecord], str | None]:
+        index = self.snapshots.derive(cluster, "events", "involved", _index_events)
+        if index is not None:
+            key = self.k8s_collector.related_event_key(kind=kind, name=name, namespace=namespace)
+            return index.get(key, []), None
+        try:
+            events = await self.k8s_collector.get_related_events(
+                kind=kind,
+                name=name,
+                namespace=namespace,
+                cluster=cluster,
+            )
+        except Exception as exc:  # noqa: BLE001 - events failure should not break detail page
+            return [], self._summarize_exception(exc)
+        return events, None
+
+    async def _query_profile_series(
         self,
         *,
         kind: str,
         name: str,
         namespace: str,
-        workload: WorkloadItem,
         range_minutes: int,
         step_seconds: int,
         cluster: ManagedCluster | None = None,
-    ) -> ResourceMetricsPanel:
+    ) -> list[ResourceMetricSeries]:
         profile = self._metric_profile(kind=kind)
         workload_filter = (
             self._workload_hint_from_name(name)
             if kind in {"service", "ingress"}
             else name
         )
-        series: list[ResourceMetricSeries] = []
+        results = await asyncio.gather(
+            *(
+                self._query_metric_series(
+                    metric_key=metric_key,
+                    namespace=namespace,
+                    workload=workload_filter,
+                    range_minutes=range_minutes,
+                    step_seconds=step_seconds,
+                    cluster=cluster,
+                )
+                for metric_key, _, _ in profile
+            ),
+            return_exceptions=True,
+        )
 
-        for metric_key, metric_label, unit in profile:
-            points = await self._query_metric_series(
-                metric_key=metric_key,
-                namespace=namespace,
-                workload=workload_filter,
-                range_minutes=range_minutes,
-                step_seconds=step_seconds,
-                cluster=cluster,
-            )
+        series: list[ResourceMetricSeries] = []
+        for (metric_key, metric_label, unit), result in zip(profile, results, strict=True):
+            if isinstance(result, Exception):
+                series.append(
+                    ResourceMetricSeries(
+                        key=metric_key,
+                        label=metric_label,
+                        unit=unit,
+                        error=self._summarize_exception(result),
+                    )
+                )
+                continue
+            if isinstance(result, BaseException):
+                raise result
             series.append(
                 ResourceMetricSeries(
                     key=metric_key,
                     label=metric_label,
                     unit=unit,
-                    points=points,
+                    points=result,
                 )
             )
+        return series
+
+    def _build_detail_metrics(
+        self,
+        *,
+        kind: str,
+        workload: WorkloadItem,
+        series: list[ResourceMetricSeries],
+        range_minutes: int,
+        step_seconds: int,
+    ) -> ResourceMetricsPanel:
+        series = list(series)
 
         if kind in {"deployment", "statefulset", "daemonset"}:
             desired = float(workload.replicas or 0)
@@ -404,3 +541,11 @@ class ResourceService:
             if resource_name.endswith(suffix):
                 return resource_name[: -len(suffix)] or resource_name
         return resource_name
+
+
+def _index_events(records: list[EventRecord]) -> dict[tuple[str, str, str], list[EventRecord]]:
+    index: dict[tuple[str, str, str], list[EventRecord]] = {}
+    for record in sorted(records, key=lambda record: (record.namespace, record.name)):
+        for key in record.object_keys:
+            index.setdefault(key, []).append(record)
+    return index
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.collector.kubernetes import KubernetesCollector
+from app.collector.prometheus import PrometheusCollector
+from app.collector.ttl_cache import cache_bypass
+from app.repository.cluster import ClusterRepository
+from app.service.snapshots import SnapshotStore
+
+if TYPE_CHECKING:
+    from app.db.models import ManagedCluster
+
+logger = logging.getLogger(__name__)
+
+SourceFn = Callable[["ManagedCluster | None"], Awaitable[Any]]
+
+# Failures keep counting through long outages; the doubling stops well before floats overflow.
+_MAX_BACKOFF_EXPONENT = 16
+
+
+class CollectionScheduler:
+    def __init__(
+        self,
+        k8s_collector: KubernetesCollector,
+        prometheus_collector: PrometheusCollector,
+        snapshots: SnapshotStore,
+        cluster_repo: ClusterRepository,
+        session_factory: Callable[[], contextlib.AbstractAsyncContextManager[AsyncSession]],
+        intervals: dict[str, float],
+        include_default: bool = True,
+        jitter_ratio: float = 0.2,
+        max_backoff_seconds: float = 300,
+        staleness_factor: float = 3,
+        cluster_refresh_seconds: float = 60,
+    ) -> None:
+        self.k8s_collector = k8s_collector
+        self.prometheus_collector = prometheus_collector
+        self.snapshots = snapshots
+        self.cluster_repo = cluster_repo
+        self.session_factory = session_factory
+        self.include_default = include_default
+        self.jitter_ratio = jitter_ratio
+        self.max_backoff_seconds = max_backoff_seconds
+        self.staleness_factor = staleness_factor
+        self.cluster_refresh_seconds = cluster_refresh_seconds
+        sources: dict[str, SourceFn] = {
+            "nodes": lambda cluster: k8s_collector.list_node_records(cluster=cluster),
+            "pods": lambda cluster: k8s_collector.list_pod_records(cluster=cluster),
+            "events": lambda cluster: k8s_collector.list_event_records(cluster=cluster),
+            "usage": lambda cluster: prometheus_collector.get_cluster_usage(cluster=cluster),
+            "namespaces": lambda cluster: prometheus_collector.get_namespace_usage(
+                limit=5, cluster=cluster
+            ),
+            "alerts": lambda cluster: prometheus_collector.get_firing_alerts(cluster=cluster),
+        }
+        self.sources = {name: fn for name, fn in sources.items() if intervals.get(name, 0) > 0}
+        self.intervals = intervals
+        self._clusters: dict[str, ManagedCluster | None] = {}
+        self._tasks: dict[tuple[str, str], asyncio.Task[None]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name="collection-scheduler")
+
+    async def close(self) -> None:
+        tasks = [task for task in (self._task, *self._tasks.values()) if task is not None]
+        self._task = None
+        self._tasks.clear()
+        self._clusters.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def sync_clusters(self) -> None:
+        async with self.session_factory() as db:
+            rows = await self.cluster_repo.list(db)
+        desired: dict[str, ManagedCluster | None] = {}
+        if self.include_default:
+            desired["default"] = None
+        desired.update({row.cluster_id: row for row in rows if row.is_active})
+
+        for cluster_key in self._clusters.keys() - desired.keys():
+            await self.forget_cluster(cluster_key)
+            if cluster_key != "default":
+                await self.k8s_collector.forget_cluster(cluster_key)
+                await self.prometheus_collector.forget_cluster(cluster_key)
+
+        # Pollers look the cluster up on every tick, so edited connection settings apply
+        # without restarting them.
+        self._clusters = desired
+        self._start_pollers()
+
+    def track_cluster(self, cluster: ManagedCluster) -> None:
+        if not self.running or not cluster.is_active:
+            return
+        self._clusters[cluster.cluster_id] = cluster
+        self._start_pollers()
+
+    async def forget_cluster(self, cluster_key: str) -> None:
+        self._clusters.pop(cluster_key, None)
+        tasks = [
+            task
+            for source in self.sources
+            if (task := self._tasks.pop((cluster_key, source), None)) is not None
+        ]
+        for task in tasks:
+            task.cancel()
+        # Wait for in-flight reads so none of them lands in the snapshot or rebuilds an
+        # informer after the caller has discarded the cluster.
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self.snapshots.discard_cluster(cluster_key)
+
+    def _start_pollers(self) -> None:
+        for cluster_key in self._clusters:
+            for source in self.sources:
+                if (cluster_key, source) not in self._tasks:
+                    self._tasks[(cluster_key, source)] = asyncio.create_task(
+                        self._poll(cluster_key, source),
+                        name=f"collect:{cluster_key}:{source}",
+                    )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sync_clusters()
+            except Exception:
+                logger.exception("collection scheduler could not load clusters")
+            await asyncio.sleep(self.cluster_refresh_seconds)
+
+    async def _poll(self, cluster_key: str, source: str) -> None:
+        # Scheduled reads exist to refresh the snapshot, so they skip the collectors' TTL caches.
+        cache_bypass.set(True)
+        interval = self.intervals[source]
+        # Spread the first tick over a whole interval so clusters do not refresh in lockstep.
+        await asyncio.sleep(random.uniform(0, interval))
+        while cluster_key in self._clusters:
+            try:
+                value = await self.sources[source](self._clusters[cluster_key])
+            except Exception as exc:  # noqa: BLE001 - recorded on the source status and retried
+                failures = self.snapshots.record_failure(cluster_key, source, self._describe(exc))
+                backoff = 2 ** min(failures, _MAX_BACKOFF_EXPONENT)
+                delay = min(interval * backoff, self.max_backoff_seconds)
+            else:
+                max_age = interval * self.staleness_factor
+                self.snapshots.put(cluster_key, source, value, max_age=max_age)
+                delay = interval
+            jitter = random.uniform(1 - self.jitter_ratio, 1 + self.jitter_ratio)
+            await asyncio.sleep(delay * jitter)
+
+    @staticmethod
+    def _describe(exc: Exception) -> str:
+        if isinstance(exc, httpx.HTTPStatusError):
+            return f"HTTP {exc.response.status_code}"
+        if isinstance(exc, httpx.RequestError):
+            return exc.__class__.__name__
+        return str(exc) or exc.__class__.__name__
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from app.collector.ttl_cache import cache_bypass
+
+if TYPE_CHECKING:
+    from app.db.models import ManagedCluster
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    value: Any
+    version: int
+    updated_at: datetime
+    expires_at: float
+
+
+@dataclass(slots=True)
+class SourceStatus:
+    last_success: datetime | None = None
+    last_error: str | None = None
+    last_error_at: datetime | None = None
+    consecutive_failures: int = 0
+
+
+def snapshot_key(cluster: ManagedCluster | None) -> str | None:
+    # Connection probes carry no cluster_id and are never snapshotted.
+    return "default" if cluster is None else getattr(cluster, "cluster_id", None)
+
+
+class SnapshotStore:
+    def __init__(self) -> None:
+        self._snapshots: dict[tuple[str, str], Snapshot] = {}
+        self._status: dict[tuple[str, str], SourceStatus] = {}
+        self._derived: dict[tuple[str, str, str], tuple[int, Any]] = {}
+        self.version = 0
+
+    def get(self, cluster: ManagedCluster | None, source: str) -> Snapshot | None:
+        cluster_key = snapshot_key(cluster)
+        if not cluster_key or cache_bypass.get():
+            return None
+        snapshot = self._snapshots.get((cluster_key, source))
+        if snapshot is None or time.monotonic() >= snapshot.expires_at:
+            return None
+        return snapshot
+
+    async def read(
+        self,
+        cluster: ManagedCluster | None,
+        source: str,
+        load: Callable[[], Awaitable[T]],
+    ) -> T:
+        snapshot = self.get(cluster, source)
+        if snapshot is not None:
+            return snapshot.value
+        return await load()
+
+    def derive(
+        self,
+        cluster: ManagedCluster | None,
+        source: str,
+        name: str,
+        build: Callable[[Any], T],
+    ) -> T | None:
+        snapshot = self.get(cluster, source)
+        if snapshot is None:
+            return None
+        key = (snapshot_key(cluster) or "", source, name)
+        derived = self._derived.get(key)
+        if derived is not None and derived[0] == snapshot.version:
+            return derived[1]
+        value = build(snapshot.value)
+        self._derived[key] = (snapshot.version, value)
+        return value
+
+    def put(self, cluster_key: str, source: str, value: Any, max_age: float) -> Snapshot:
+        self.version += 1
+        now = datetime.now(UTC)
+        snapshot = Snapshot(
+            value=value,
+            version=self.version,
+            updated_at=now,
+            expires_at=time.monotonic() + max_age,
+        )
+        self._snapshots[(cluster_key, source)] = snapshot
+        status = self._status.setdefault((cluster_key, source), SourceStatus())
+        status.last_success = now
+        status.consecutive_failures = 0
+        return snapshot
+
+    def record_failure(self, cluster_key: str, source: str, error: str) -> int:
+        status = self._status.setdefault((cluster_key, source), SourceStatus())
+        status.last_error = error
+        status.last_error_at = datetime.now(UTC)
+        status.consecutive_failures += 1
+        return status.consecutive_failures
+
+    def discard_cluster(self, cluster_key: str) -> None:
+        for store in (self._snapshots, self._status):
+            for key in [key for key in store if key[0] == cluster_key]:
+                del store[key]
+        for key in [key for key in self._derived if key[0] == cluster_key]:
+            del self._derived[key]
+
+    def stats(self) -> dict[str, dict[str, dict[str, Any]]]:
+        now = time.monotonic()
+        output: dict[str, dict[str, dict[str, Any]]] = {}
+        for (cluster_key, source), status in self._status.items():
+            snapshot = self._snapshots.get((cluster_key, source))
+            output.setdefault(cluster_key, {})[source] = {
+                "version": snapshot.version if snapshot else None,
+                "fresh": snapshot is not None and now < snapshot.expires_at,
+                "last_success": status.last_success.isoformat() if status.last_success else None,
+                "last_error": status.last_error,
+                "last_error_at": status.last_error_at.isoformat() if status.last_error_at else None,
+                "consecutive_failures": status.consecutive_failures,
+            }
+        return output
@@ -0,0 +1,60 @@
+from datetime import UTC, datetime
+
+from app.collector.records import EventRecord
+from app.schemas.alerts import AlertSeverity
+from app.service.alerts import AlertStore
+
+
+def _event(name: str, reason: str, pod: str, timestamp: str, count: int = 1) -> EventRecord:
+    return EventRecord(
+        name=name,
+        namespace="prod",
+        type="Warning",
+        reason=reason,
+        message=f"{reason} on {pod}",
+        timestamp=timestamp,
+        involved_kind="Pod",
+        involved_name=pod,
+        involved_namespace="prod",
+        count=count,
+        first_timestamp="2024-01-01T00:00:00Z",
+    )
+
+
+def test_alert_store_dedupes_events_and_updates_incrementally() -> None:
+    store = AlertStore()
+    backoff = _event("web-1.a", "BackOff", "web-1", "2024-01-01T00:05:00Z", count=4)
+    repeat = _event("web-1.b", "BackOff", "web-1", "2024-01-01T00:09:00Z", count=2)
+    oom = _event("api-1.a", "OOMKilled", "api-1", "2024-01-01T00:07:00Z")
+    store.ingest_events([backoff, repeat, oom])
+
+    newest, oldest = store.top(10)
+    assert (newest.title, newest.count) == ("BackOff", 6)
+    assert newest.start_time == datetime(2024, 1, 1, tzinfo=UTC)
+    assert newest.last_seen == datetime(2024, 1, 1, 0, 9, tzinfo=UTC)
+    assert oldest.title == "OOMKilled"
+    assert [item.severity for item in store.top(10, order="severity")] == [AlertSeverity.p1, AlertSeverity.p2]
+
+    store.ingest_events([backoff, repeat, oom])
+    assert store.top(1)[0] is newest
+
+    store.ingest_events([backoff])
+    assert [(item.title, item.count) for item in store.top(10)] == [("BackOff", 4)]
+
+
+def test_alert_store_tracks_prometheus_alerts_by_fingerprint() -> None:
+    store = AlertStore()
+    alert = {"name": "NodeMemoryPressure", "severity": "warning", "fingerprint": "0123456789abcdef"}
+    first_seen = datetime(2024, 1, 1, tzinfo=UTC)
+
+    store.ingest_prometheus([alert], now=first_seen)
+    store.ingest_prometheus([{**alert, "summary": "memory above 85%"}], now=datetime(2024, 1, 2, tzinfo=UTC))
+    item = store.top(10)[0]
+    assert (item.id, item.message, item.start_time) == ("prom-0123456789abcdef", "memory above 85%", first_seen)
+    assert store.prometheus_alert("0123456789abcdef") is item
+
+    store.ingest_prometheus([{**alert, "active_at": 1704153600.0}])
+    assert store.top(10)[0].start_time == datetime(2024, 1, 2, tzinfo=UTC)
+
+    store.ingest_prometheus([])
+    assert len(store) == 0
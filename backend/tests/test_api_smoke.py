@@ -60,3 +60,75 @@ def test_resources_and_ai_flow() -> None:
         task_resp = client.get(f"/api/v1/ai/tasks/{task_id}", headers=headers)
         assert task_resp.status_code == 200
         assert task_resp.json()["status"] in {"running", "completed", "pending"}
+
+
+def test_resources_pagination_with_cursor() -> None:
+    with TestClient(app) as client:
+        token = _login(client)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        first = client.get("/api/v1/resources/deployment", params={"limit": 2}, headers=headers)
+        assert first.status_code == 200
+        first_payload = first.json()
+        assert first_payload["total"] == 2
+        assert first_payload["total_estimate"] == 3
+        assert first_payload["next_cursor"]
+
+        second = client.get(
+            "/api/v1/resources/deployment",
+            params={"limit": 2, "cursor": first_payload["next_cursor"]},
+            headers=headers,
+        )
+        assert second.status_code == 200
+        second_payload = second.json()
+        assert second_payload["total"] == 1
+        assert second_payload["next_cursor"] is None
+        names = {item["name"] for item in first_payload["items"] + second_payload["items"]}
+        assert names == {"web", "api", "billing"}
+
+        invalid = client.get(
+            "/api/v1/resources/deployment",
+            params={"limit": 2, "cursor": "not-a-cursor"},
+            headers=headers,
+        )
+        assert invalid.status_code == 400
+
+
+def test_upstream_health_requires_login() -> None:
+    with TestClient(app) as client:
+        assert client.get("/healthz/upstream").status_code == 401
+
+        token = _login(client)
+        response = client.get("/healthz/upstream", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert set(response.json()) == {"kubernetes", "prometheus", "snapshots"}
+
+
+def test_log_follow_takes_query_token_and_releases_the_db_session() -> None:
+    from app.api.deps import get_log_follow_service
+    from app.db.session import engine
+
+    checked_out: list[int] = []
+
+    class FakeFollowService:
+        async def follow(self, **_):
+            async def events():
+                checked_out.append(engine.pool.checkedout())
+                yield b"event: open\ndata: {}\n\n"
+
+            return events()
+
+    app.dependency_overrides[get_log_follow_service] = FakeFollowService
+    try:
+        with TestClient(app) as client:
+            token = _login(client)
+            url = "/api/v1/resources/pod/web-1/logs/follow"
+            assert client.get(url, params={"namespace": "prod"}).status_code == 401
+            response = client.get(url, params={"namespace": "prod", "token": token})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.text.startswith("event: open")
+    assert checked_out == [0]
@@ -0,0 +1,113 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.collector.circuit_breaker import BreakerConfig, CircuitBreaker, CircuitOpenError
+from app.collector.kubernetes import KubernetesCollector
+from app.collector.ttl_cache import stale_reads
+from app.core.config import Settings
+
+
+def test_breaker_opens_on_failure_rate_and_probes_with_backoff() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(
+        "prod:https://prod:6443",
+        BreakerConfig(failure_rate_threshold=0.5, minimum_calls=4, open_seconds=5, max_open_seconds=12),
+        clock=lambda: now[0],
+    )
+
+    for failed in (False, True, False, True):
+        breaker.before_call()
+        if failed:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    now[0] = 5
+    assert breaker.before_call() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert (breaker.state, breaker.retry_in) == ("open", 10)
+
+    now[0] = 15
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.retry_in == 12
+
+    now[0] = 27
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.stats()["state"] == "closed"
+    assert breaker.trips == 0
+
+
+def test_breaker_backoff_stays_capped_through_long_outages() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(
+        "prod:https://prod:6443",
+        BreakerConfig(minimum_calls=1, open_seconds=5.0, max_open_seconds=300.0),
+        clock=lambda: now[0],
+    )
+    breaker.before_call()
+    breaker.record_failure()
+    for _ in range(1100):
+        now[0] += breaker.retry_in
+        assert breaker.before_call() is True
+        breaker.record_failure()
+    assert breaker.trips == 1101
+    assert (breaker.state, breaker.retry_in) == ("open", 300.0)
+
+
+async def test_open_breaker_fails_fast_and_serves_cached_data_flagged_stale() -> None:
+    hits: list[str] = []
+    down = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url.path)
+        if down:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"items": [{"metadata": {"name": "worker-1"}}]})
+
+    collector = KubernetesCollector(
+        Settings(
+            use_mock_data=False,
+            k8s_informer_enabled=False,
+            collector_cache_stale_seconds=0,
+            collector_cache_ttls={"nodes": 0.01},
+        )
+    )
+    collector._pools.transport = httpx.MockTransport(handler)
+    prod = SimpleNamespace(cluster_id="prod", k8s_api_url="https://prod:6443", k8s_bearer_token=None)
+    probe = SimpleNamespace(k8s_api_url="https://probe:6443", k8s_bearer_token=None)
+
+    nodes = await collector.list_nodes(cluster=prod)
+    down = True
+    for _ in range(4):
+        with pytest.raises(httpx.ConnectError):
+            await collector._request("GET", "/api/v1/namespaces", cluster=prod)
+    with pytest.raises(CircuitOpenError):
+        await collector._request("GET", "/api/v1/namespaces", cluster=prod)
+    assert len(hits) == 5
+    assert collector.stats()["breakers"]["prod:https://prod:6443"]["state"] == "open"
+
+    await asyncio.sleep(0.02)
+    reads: list[float] = []
+    token = stale_reads.set(reads)
+    try:
+        assert await collector.list_nodes(cluster=prod) == nodes
+    finally:
+        stale_reads.reset(token)
+    assert len(hits) == 5
+    assert len(reads) == 1
+
+    # Probes share the default pool but talk to another origin, so they are not blocked.
+    with pytest.raises(httpx.ConnectError):
+        await collector._request("GET", "/version", cluster=probe)
+    assert len(hits) == 6
+    await collector.close()
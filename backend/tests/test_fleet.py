@@ -0,0 +1,83 @@
+import asyncio
+import contextlib
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from app.schemas.overview import ClusterSummary
+from app.service.fleet import FleetOverviewService
+
+
+def _summary(cluster_id: str, nodes: int) -> ClusterSummary:
+    return ClusterSummary(
+        cluster_id=cluster_id,
+        generated_at=datetime.now(UTC),
+        nodes_total=nodes,
+        nodes_ready=nodes,
+        pods_total=nodes * 10,
+        pods_pending=1,
+        pods_crashloop=0,
+        pods_oomkilled=0,
+        cpu_usage_cores=1.5,
+        cpu_capacity_cores=4,
+        memory_usage_bytes=0,
+        memory_capacity_bytes=0,
+        alerts_count=2,
+        risk_score=nodes * 10,
+        top_namespaces=[],
+    )
+
+
+class FakeOverviewService:
+    def __init__(self) -> None:
+        self.slow: set[str] = set()
+        self.running = 0
+        self.peak = 0
+
+    async def get_cluster_summary(self, cluster=None) -> ClusterSummary:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(1 if cluster.cluster_id in self.slow else 0.01)
+            return _summary(cluster.cluster_id, int(cluster.cluster_id[-1]))
+        finally:
+            self.running -= 1
+
+
+class FakeClusterRepository:
+    def __init__(self, clusters: list) -> None:
+        self.clusters = clusters
+
+    async def list(self, db) -> list:
+        return self.clusters
+
+
+async def test_fleet_collects_active_clusters_concurrently_and_serves_stale_on_timeout() -> None:
+    clusters = [
+        SimpleNamespace(cluster_id=f"cluster-{index}", name=f"c{index}", is_active=index != 4)
+        for index in range(1, 5)
+    ]
+    overview = FakeOverviewService()
+    service = FleetOverviewService(
+        overview,
+        FakeClusterRepository(clusters),
+        contextlib.nullcontext,
+        refresh_interval_seconds=3600,
+        max_concurrency=2,
+        cluster_timeout_seconds=0.2,
+    )
+
+    fleet = await service.get_fleet()
+    assert [entry.cluster_id for entry in fleet.clusters] == ["cluster-1", "cluster-2", "cluster-3"]
+    assert fleet.totals.clusters_ok == 3
+    assert fleet.totals.nodes_total == 6
+    assert fleet.totals.max_risk_score == 30
+    assert overview.peak == 2
+    assert await service.get_fleet() is fleet
+
+    overview.slow.add("cluster-2")
+    fleet = await service.refresh()
+    entry = fleet.clusters[1]
+    assert (entry.status, entry.error) == ("stale", "timed out after 0.2s")
+    assert entry.summary.nodes_total == 2
+    assert fleet.totals.clusters_ok == 2
+    await service.close()
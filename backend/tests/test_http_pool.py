@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+import httpx
+
+from app.collector.http_pool import HttpClientPool, PoolConfig
+from app.collector.kubernetes import KubernetesCollector
+from app.core.config import Settings
+
+
+async def test_pool_registry_isolates_clusters_and_reaps_idle_pools() -> None:
+    pools = HttpClientPool(
+        PoolConfig(max_connections=20),
+        overrides={"prod": {"max_connections": 50, "verify": False}},
+        idle_seconds=60,
+    )
+
+    prod = await pools.get("prod")
+    dev = await pools.get("dev")
+    assert prod is not dev
+    assert await pools.get("prod") is prod
+    assert pools.config_for("prod").max_connections == 50
+    assert pools.config_for("prod").verify is False
+    assert pools.config_for("dev").max_connections == 20
+
+    pools._pools["dev"].last_used -= 120
+    assert await pools.reap_idle() == 1
+    assert dev.is_closed
+    assert len(pools) == 1
+
+    await pools.close("prod")
+    assert prod.is_closed
+    assert await pools.get("prod") is not prod
+    await pools.close_all()
+
+
+class _LogStream(httpx.AsyncByteStream):
+    async def __aiter__(self):
+        yield b"line\n"
+
+
+async def test_reaper_keeps_pools_with_open_streams() -> None:
+    pools = HttpClientPool(
+        PoolConfig(),
+        idle_seconds=60,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=_LogStream())),
+    )
+    client = await pools.get("prod")
+    async with client.stream("GET", "https://prod:6443/api/v1/namespaces/a/pods/b/log") as response:
+        pools._pools["prod"].last_used -= 120
+        assert await pools.reap_idle() == 0
+        assert [line async for line in response.aiter_lines()] == ["line"]
+    assert not client.is_closed
+
+    await client.get("https://prod:6443/version")
+    pools._pools["prod"].last_used -= 120
+    assert await pools.reap_idle() == 1
+    assert client.is_closed
+
+
+async def test_forget_cluster_tears_down_its_pool() -> None:
+    collector = KubernetesCollector(Settings(use_mock_data=False, k8s_informer_enabled=False))
+    collector._pools.transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    cluster = SimpleNamespace(cluster_id="prod", k8s_api_url="https://prod:6443", k8s_bearer_token=None)
+
+    await collector._request("GET", "/api/v1/nodes", cluster=cluster)
+    client = await collector._get_client(cluster)
+    await collector.forget_cluster("prod")
+
+    assert client.is_closed
+    assert await collector._get_client(cluster) is not client
+    await collector.close()
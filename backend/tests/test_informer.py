@@ -0,0 +1,125 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+
+from app.collector.informer import Informer, ResourceStore
+from app.collector.kubernetes import KubernetesCollector
+from app.core.config import Settings
+
+
+def _pod(name: str, namespace: str, resource_version: str) -> dict:
+    return {"metadata": {"name": name, "namespace": namespace, "resourceVersion": resource_version}}
+
+
+async def test_informer_applies_watch_events_and_relists_on_gone() -> None:
+    list_calls: list[int] = []
+    watch_versions: list[str] = []
+    watch_done = asyncio.Event()
+
+    async def lister(metadata: dict):
+        list_calls.append(1)
+        version = str(len(list_calls) * 100)
+        yield _pod("web", "default", version)
+        yield _pod("api", "prod", version)
+        metadata["resourceVersion"] = version
+
+    async def watcher(resource_version: str):
+        watch_versions.append(resource_version)
+        if len(watch_versions) == 1:
+            yield {"type": "ADDED", "object": _pod("worker", "prod", "101")}
+            yield {"type": "DELETED", "object": _pod("api", "prod", "102")}
+            yield {"type": "ERROR", "object": {"code": 410, "message": "too old resource version"}}
+        watch_done.set()
+        await asyncio.sleep(3600)
+        yield {}
+
+    informer = Informer(name="test:pods", lister=lister, watcher=watcher)
+    assert await informer.wait_synced(timeout=1)
+    await asyncio.wait_for(watch_done.wait(), timeout=1)
+
+    assert len(list_calls) == 2
+    assert watch_versions == ["100", "200"]
+    assert {item["metadata"]["name"] for item in informer.store.list()} == {"web", "api"}
+    assert [item["metadata"]["name"] for item in informer.store.list("prod")] == ["api"]
+    assert informer.is_fresh(max_staleness_seconds=0)
+
+    await informer.stop()
+    assert not informer.running
+
+
+async def test_informer_relist_streams_into_staged_store() -> None:
+    first_item = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def lister(metadata: dict):
+        yield _pod("web", "default", "200")
+        first_item.set()
+        await finish.wait()
+        yield _pod("api", "prod", "200")
+        metadata["resourceVersion"] = "200"
+
+    async def watcher(resource_version: str):
+        await asyncio.sleep(3600)
+        yield {}
+
+    informer = Informer(name="test:pods", lister=lister, watcher=watcher)
+    informer.store.replace([_pod("old", "default", "100")], "100")
+    task = asyncio.create_task(informer._list())
+    await asyncio.wait_for(first_item.wait(), timeout=1)
+
+    assert [item["metadata"]["name"] for item in informer.store.list()] == ["old"]
+    finish.set()
+    await task
+    assert {item["metadata"]["name"] for item in informer.store.list()} == {"web", "api"}
+    assert informer.store.resource_version == "200"
+
+
+def test_resource_store_maintains_secondary_indexes() -> None:
+    def by_node(item: dict) -> list[str]:
+        node = item.get("spec", {}).get("nodeName")
+        return [node] if node else []
+
+    store = ResourceStore(indexers={"node": by_node})
+    store.replace(
+        [
+            {"metadata": {"name": "web", "namespace": "prod"}, "spec": {"nodeName": "worker-1"}},
+            {"metadata": {"name": "api", "namespace": "prod"}, "spec": {"nodeName": "worker-1"}},
+        ],
+        "1",
+    )
+    assert [item["metadata"]["name"] for item in store.by_index("node", "worker-1")] == ["api", "web"]
+
+    store.upsert({"metadata": {"name": "web", "namespace": "prod"}, "spec": {"nodeName": "worker-2"}})
+    store.delete({"metadata": {"name": "api", "namespace": "prod"}})
+
+    assert store.by_index("node", "worker-1") == []
+    assert [item["metadata"]["name"] for item in store.by_index("node", "worker-2")] == ["web"]
+
+
+async def test_collector_rebuilds_informer_when_cluster_connection_changes() -> None:
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("watch"):
+            await release.wait()
+            return httpx.Response(200, content=b"")
+        return httpx.Response(
+            200,
+            json={
+                "metadata": {"resourceVersion": "1"},
+                "items": [{"metadata": {"name": f"n-{request.url.host}"}}],
+            },
+        )
+
+    collector = KubernetesCollector(Settings(use_mock_data=False, collector_cache_enabled=False))
+    collector._pools.transport = httpx.MockTransport(handler)
+    old = SimpleNamespace(cluster_id="prod", k8s_api_url="https://old.example", k8s_bearer_token="a")
+    new = SimpleNamespace(cluster_id="prod", k8s_api_url="https://new.example", k8s_bearer_token="b")
+
+    old_nodes = await collector.list_node_records(cluster=old)
+    new_nodes = await collector.list_node_records(cluster=new)
+    assert [node.name for node in old_nodes] == ["n-old.example"]
+    assert [node.name for node in new_nodes] == ["n-new.example"]
+    release.set()
+    await collector.close()
@@ -0,0 +1,164 @@
+import httpx
+import pytest
+
+from app.collector.kubernetes import KubernetesCollector
+from app.core.config import Settings
+
+
+def _collector(handler) -> KubernetesCollector:
+    collector = KubernetesCollector(
+        Settings(
+            use_mock_data=False,
+            k8s_api_url="https://k8s.example.com:6443",
+            k8s_informer_enabled=False,
+        )
+    )
+    collector._pools.transport = httpx.MockTransport(handler)
+    return collector
+
+
+async def test_list_resources_page_uses_upstream_continue_tokens() -> None:
+    seen: list[dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        seen.append(params)
+        if "continue" not in params:
+            return httpx.Response(
+                200,
+                json={
+                    "metadata": {"continue": "abc", "remainingItemCount": 3},
+                    "items": [{"metadata": {"name": "a"}}, {"metadata": {"name": "b"}}],
+                },
+            )
+        if params["continue"] == "expired":
+            return httpx.Response(410, json={"reason": "Expired"})
+        return httpx.Response(200, json={"metadata": {}, "items": [{"metadata": {"name": "c"}}]})
+
+    collector = _collector(handler)
+    first = await collector.list_resources_page("pod", limit=2)
+    assert seen[0] == {"limit": "2"}
+    assert first.total_estimate == 5
+    assert first.cursor
+
+    second = await collector.list_resources_page("pod", limit=2, cursor=first.cursor)
+    assert seen[1] == {"limit": "2", "continue": "abc"}
+    assert [item["metadata"]["name"] for item in second.items] == ["c"]
+    assert second.cursor is None
+
+    expired = collector._encode_cursor({"continue": "expired", "offset": 2})
+    with pytest.raises(ValueError, match="expired"):
+        await collector.list_resources_page("pod", limit=2, cursor=expired)
+    await collector.close()
+
+
+async def test_list_resources_page_resumes_after_last_key_when_items_are_deleted() -> None:
+    collector = KubernetesCollector(Settings(use_mock_data=True))
+    collector._mock_state["deployment"] = [
+        {"metadata": {"name": name, "namespace": "prod"}} for name in ["f", "a", "c", "b", "e", "d"]
+    ]
+
+    first = await collector.list_resources_page("deployment", limit=3)
+    assert [item["metadata"]["name"] for item in first.items] == ["a", "b", "c"]
+
+    del collector._mock_state["deployment"][1]
+    second = await collector.list_resources_page("deployment", limit=3, cursor=first.cursor)
+    assert [item["metadata"]["name"] for item in second.items] == ["d", "e", "f"]
+    assert second.cursor is None
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        await collector.list_resources_page(
+            "deployment", cursor=collector._encode_cursor({"after": "prod"})
+        )
+    await collector.close()
+
+
+def test_plan_list_query_pushes_pod_filters_to_field_selectors() -> None:
+    collector = KubernetesCollector(Settings(use_mock_data=True))
+
+    pod_plan = collector.plan_list_query("pod", label_selector="app=web", status="pending", node_name="n1")
+    assert pod_plan.field_selector == "spec.nodeName=n1,status.phase=Pending"
+    assert pod_plan.server_filters == ["label_selector", "node", "status"]
+    assert pod_plan.local_filters == []
+
+    deployment_plan = collector.plan_list_query("deployment", status="Degraded")
+    assert deployment_plan.field_selector is None
+    assert deployment_plan.local_status == "Degraded"
+    assert deployment_plan.local_filters == ["status"]
+
+    with pytest.raises(ValueError):
+        collector.plan_list_query("deployment", node_name="n1")
+
+
+async def test_list_resources_sends_field_selector_upstream() -> None:
+    seen: list[dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(dict(request.url.params))
+        return httpx.Response(200, json={"metadata": {}, "items": []})
+
+    collector = _collector(handler)
+    await collector.list_resources("pod", field_selector="status.phase=Pending")
+    assert seen == [{"fieldSelector": "status.phase=Pending"}]
+    await collector.close()
+
+
+async def test_list_resources_requests_table_rows_for_summaries() -> None:
+    accepts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        accepts.append(request.headers["Accept"])
+        assert request.url.params["includeObject"] == "Metadata"
+        return httpx.Response(
+            200,
+            json={
+                "kind": "Table",
+                "metadata": {"resourceVersion": "7"},
+                "columnDefinitions": [
+                    {"name": name} for name in ("Name", "Ready", "Status", "Restarts", "Node")
+                ],
+                "rows": [
+                    {
+                        "cells": ["web-1", "1/1", "Running", "3 (2m ago)", "worker-1"],
+                        "object": {"metadata": {"name": "web-1", "namespace": "prod", "managedFields": []}},
+                    },
+                    {
+                        "cells": ["job-1", "0/1", "Completed", 0, "<none>"],
+                        "object": {"metadata": {"name": "job-1", "namespace": "prod"}},
+                    },
+                ],
+            },
+        )
+
+    collector = _collector(handler)
+    items = await collector.list_resources("pod", representation="table")
+
+    assert accepts == [collector.accept_headers["table"]]
+    assert items[0] == {
+        "metadata": {"name": "web-1", "namespace": "prod"},
+        "status": {"reason": "Running", "containerStatuses": [{"restartCount": 3}]},
+        "spec": {"nodeName": "worker-1"},
+    }
+    assert items[1]["status"]["reason"] == "Completed"
+    assert "phase" not in items[1]["status"]
+    assert "spec" not in items[1]
+    await collector.close()
+
+
+async def test_get_related_events_matches_involved_and_related_objects() -> None:
+    collector = KubernetesCollector(Settings(use_mock_data=True))
+    collector._mock_state["events"].append(
+        {
+            "metadata": {"name": "event-4", "namespace": "prod"},
+            "involvedObject": {"kind": "Pod", "name": "billing-7f9c", "namespace": "prod"},
+            "related": {"kind": "Deployment", "name": "billing"},
+            "reason": "Unhealthy",
+            "message": "Readiness probe failed",
+        }
+    )
+
+    events = await collector.get_related_events("deployment", "billing", "prod")
+
+    assert [event.name for event in events] == ["event-1", "event-4"]
+    assert await collector.get_related_events("deployment", "billing", "default") == []
+    await collector.close()
@@ -0,0 +1,71 @@
+import orjson
+import pytest
+
+from app.collector.list_stream import iter_list_items, project_item
+
+
+def _body(count: int) -> bytes:
+    return orjson.dumps(
+        {
+            "kind": "PodList",
+            "metadata": {"resourceVersion": "42", "continue": "next", "remainingItemCount": 7},
+            "items": [
+                {
+                    "metadata": {
+                        "name": f"web-{index}",
+                        "namespace": "prod",
+                        "labels": {"app": "web"},
+                        "managedFields": [{"manager": "kubectl"}],
+                    },
+                    "spec": {"nodeName": "worker-1", "containers": [{"name": "web"}]},
+                    "status": {"phase": "Running", "cpu": 0.5},
+                }
+                for index in range(count)
+            ],
+        }
+    )
+
+
+async def _chunks(body: bytes, size: int = 13):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+async def test_iter_list_items_streams_projected_items_and_list_metadata() -> None:
+    metadata: dict = {}
+    items = [item async for item in iter_list_items(_chunks(_body(25)), metadata, project_item)]
+
+    assert [item["metadata"]["name"] for item in items] == [f"web-{index}" for index in range(25)]
+    assert items[0] == {
+        "metadata": {"name": "web-0", "namespace": "prod", "labels": {"app": "web"}},
+        "spec": {"nodeName": "worker-1"},
+        "status": {"phase": "Running", "cpu": 0.5},
+    }
+    assert metadata == {"resourceVersion": "42", "continue": "next", "remainingItemCount": 7}
+
+
+async def test_iter_list_items_rejects_truncated_bodies() -> None:
+    with pytest.raises(ValueError):
+        [item async for item in iter_list_items(_chunks(_body(3)[:-20]))]
+
+
+async def test_iter_list_items_handles_values_split_across_chunks() -> None:
+    body = orjson.dumps(
+        {
+            "kind": "Table",
+            "columnDefinitions": [{"name": "Name"}, {"name": "Status"}],
+            "rows": [
+                {"cells": ["café-0", "Running"], "object": {"metadata": {"name": "café-0"}}},
+                {"cells": ["web-1", "Pending"], "object": {"metadata": {"name": "web-1"}}},
+            ],
+            "metadata": {"resourceVersion": "7"},
+        }
+    )
+    metadata: dict = {}
+    items = [item async for item in iter_list_items(_chunks(body, 1), metadata)]
+
+    assert items == [
+        {"metadata": {"name": "café-0"}, "cells": {"name": "café-0", "status": "Running"}},
+        {"metadata": {"name": "web-1"}, "cells": {"name": "web-1", "status": "Pending"}},
+    ]
+    assert metadata == {"resourceVersion": "7"}
@@ -0,0 +1,93 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.collector.kubernetes import KubernetesCollector
+from app.collector.logs import batch_lines
+from app.core.config import Settings
+from app.service.log_follow import LogFollowLimitError, LogFollowService
+
+
+async def test_batch_lines_groups_by_interval_and_size() -> None:
+    async def lines():
+        for index in range(5):
+            yield f"line-{index}"
+        await asyncio.sleep(0.05)
+        yield "late"
+
+    batches = [batch async for batch in batch_lines(lines(), interval_seconds=0.01, max_bytes=12)]
+
+    assert batches == [["line-0", "line-1"], ["line-2", "line-3"], ["line-4"], ["late"]]
+
+
+async def test_follow_streams_sse_batches_and_caps_concurrent_follows() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["follow"] == "true"
+        return httpx.Response(200, text="2024-01-01T00:00:00Z started\n2024-01-01T00:00:01Z ready\n")
+
+    collector = KubernetesCollector(
+        Settings(use_mock_data=False, k8s_api_url="https://k8s.example.com:6443", k8s_informer_enabled=False)
+    )
+    collector._pools.transport = httpx.MockTransport(handler)
+    service = LogFollowService(collector, max_follows_per_user=1)
+
+    events = await service.follow(username="alice", kind="pod", name="web-1", namespace="prod")
+    first = await anext(events)
+    with pytest.raises(LogFollowLimitError):
+        await service.follow(username="alice", kind="pod", name="web-1", namespace="prod")
+
+    body = first + b"".join([chunk async for chunk in events])
+
+    assert body == (
+        b'event: open\ndata: {"pod":"web-1"}\n\n'
+        b'event: lines\ndata: ["2024-01-01T00:00:00Z started","2024-01-01T00:00:01Z ready"]\n\n'
+        b'event: end\ndata: {"pod":"web-1"}\n\n'
+    )
+    assert service.active_follows("alice") == 0
+    await collector.close()
+
+
+async def test_follow_releases_slot_when_client_disconnects() -> None:
+    upstream_closed = asyncio.Event()
+
+    class HangingCollector:
+        async def resolve_log_pod(self, **_) -> str:
+            return "web-1"
+
+        async def follow_pod_logs(self, **_):
+            try:
+                yield "first"
+                await asyncio.sleep(3600)
+            finally:
+                upstream_closed.set()
+
+    service = LogFollowService(HangingCollector(), max_follows_per_user=1)
+    events = await service.follow(username="alice", kind="deployment", name="web", namespace="prod")
+    assert await anext(events) == b'event: open\ndata: {"pod":"web-1"}\n\n'
+    assert await anext(events) == b'event: lines\ndata: ["first"]\n\n'
+
+    await events.aclose()
+
+    assert upstream_closed.is_set()
+    assert service.active_follows("alice") == 0
+
+
+async def test_follow_never_iterated_does_not_hold_a_slot() -> None:
+    class IdleCollector:
+        async def resolve_log_pod(self, **_) -> str:
+            return "web-1"
+
+        async def follow_pod_logs(self, **_):
+            yield "first"
+
+    service = LogFollowService(IdleCollector(), max_follows_per_user=1)
+    abandoned = await service.follow(username="alice", kind="pod", name="web-1", namespace="prod")
+    assert service.active_follows("alice") == 0
+    del abandoned
+
+    events = await service.follow(username="alice", kind="pod", name="web-1", namespace="prod")
+    assert await anext(events) == b'event: open\ndata: {"pod":"web-1"}\n\n'
+    assert service.active_follows("alice") == 1
+    await events.aclose()
+    assert service.active_follows("alice") == 0
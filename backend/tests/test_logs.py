@@ -0,0 +1,72 @@
+import httpx
+
+from app.collector.kubernetes import KubernetesCollector
+from app.collector.logs import cap_log_bytes, merge_log_streams
+from app.core.config import Settings
+
+
+def test_merge_log_streams_orders_lines_by_timestamp() -> None:
+    merged = merge_log_streams(
+        [
+            ("web-1/app", ["2024-01-01T00:00:01.5Z started", "2024-01-01T00:00:03Z ready"]),
+            ("web-2/app", ["Unable to fetch pod logs (HTTP 500).", "2024-01-01T00:00:01.25Z started"]),
+        ],
+        max_bytes=1024,
+    )
+
+    assert merged == [
+        "[web-2/app] Unable to fetch pod logs (HTTP 500).",
+        "2024-01-01T00:00:01.25Z [web-2/app] started",
+        "2024-01-01T00:00:01.5Z [web-1/app] started",
+        "2024-01-01T00:00:03Z [web-1/app] ready",
+    ]
+
+
+def test_cap_log_bytes_keeps_the_newest_lines() -> None:
+    capped = cap_log_bytes(["a" * 10, "b" * 10, "c" * 10], max_bytes=22)
+
+    assert capped[1:] == ["b" * 10, "c" * 10]
+    assert capped[0].startswith("... 1 earlier lines omitted")
+
+
+async def test_get_resource_logs_fans_out_over_workload_pods() -> None:
+    requested: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/deployments/web"):
+            return httpx.Response(200, json={"spec": {"selector": {"matchLabels": {"app": "web"}}}})
+        if request.url.path.endswith("/pods"):
+            pods = [
+                {
+                    "metadata": {"name": f"web-{index}", "namespace": "prod"},
+                    "status": {"containerStatuses": [{"name": "app"}, {"name": "proxy"}]},
+                }
+                for index in range(3)
+            ]
+            return httpx.Response(200, json={"metadata": {}, "items": pods})
+        pod = request.url.path.split("/")[-2]
+        container = request.url.params["container"]
+        assert request.url.params["timestamps"] == "true"
+        requested.append((pod, container))
+        second = int(pod[-1]) * 2 + (container == "proxy")
+        return httpx.Response(200, text=f"2024-01-01T00:00:0{second}Z hello\n")
+
+    collector = KubernetesCollector(
+        Settings(
+            use_mock_data=False,
+            k8s_api_url="https://k8s.example.com:6443",
+            k8s_informer_enabled=False,
+            k8s_log_fanout_max_pods=2,
+        )
+    )
+    collector._pools.transport = httpx.MockTransport(handler)
+    lines = await collector.get_resource_logs("deployment", "web", "prod", all_pods=True)
+
+    assert sorted(requested) == [("web-0", "app"), ("web-0", "proxy"), ("web-1", "app"), ("web-1", "proxy")]
+    assert lines == [
+        "2024-01-01T00:00:00Z [web-0/app] hello",
+        "2024-01-01T00:00:01Z [web-0/proxy] hello",
+        "2024-01-01T00:00:02Z [web-1/app] hello",
+        "2024-01-01T00:00:03Z [web-1/proxy] hello",
+    ]
+    await collector.close()
@@ -0,0 +1,42 @@
+import asyncio
+
+from app.collector.kubernetes import KubernetesCollector
+from app.collector.prometheus import PrometheusCollector
+from app.core.config import Settings
+from app.service.alerts import AlertService
+from app.service.overview import OverviewService
+
+
+class SlowPrometheusCollector(PrometheusCollector):
+    async def get_cluster_usage(self, cluster=None) -> dict[str, float]:
+        await asyncio.sleep(5)
+        return {}
+
+
+class BrokenKubernetesCollector(KubernetesCollector):
+    async def list_pods(self, namespace=None, cluster=None) -> list[dict]:
+        raise RuntimeError("api server unavailable")
+
+
+async def test_cluster_summary_returns_partial_data_when_sources_fail() -> None:
+    settings = Settings(use_mock_data=True)
+    k8s_collector = BrokenKubernetesCollector(settings)
+    prometheus_collector = SlowPrometheusCollector(settings)
+    service = OverviewService(
+        k8s_collector,
+        prometheus_collector,
+        AlertService(k8s_collector, prometheus_collector),
+        source_timeout_seconds=0.05,
+    )
+
+    summary = await service.get_cluster_summary()
+
+    assert summary.partial is True
+    assert summary.nodes_total == 3
+    assert summary.sections["nodes"].status == "ok"
+    assert summary.sections["pods"].status == "error"
+    assert summary.sections["pods"].error == "api server unavailable"
+    assert summary.sections["usage"].status == "error"
+    assert summary.sections["usage"].error.startswith("timed out")
+    assert summary.cpu_capacity_cores == 0
+    assert len(summary.top_namespaces) == 5
@@ -0,0 +1,90 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.service.overview_stream import OverviewBroadcaster, OverviewDeltaEncoder
+
+
+class _Summary:
+    def __init__(self, tick: int) -> None:
+        self.tick = tick
+
+    def model_dump(self, mode: str) -> dict:
+        return {"tick": self.tick}
+
+
+class CountingOverviewService:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.clusters: list = []
+        self.forgotten: list[str] = []
+
+    def forget_cluster(self, cluster_key: str) -> None:
+        self.forgotten.append(cluster_key)
+
+    async def get_cluster_summary(self, cluster=None) -> _Summary:
+        self.calls += 1
+        self.clusters.append(cluster)
+        return _Summary(self.calls)
+
+
+async def test_broadcaster_shares_one_producer_per_cluster() -> None:
+    service = CountingOverviewService()
+    broadcaster = OverviewBroadcaster(service, interval_seconds=0.01)
+
+    async with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+        assert broadcaster.subscriber_count("cluster-local") == 2
+        first_frame = await asyncio.wait_for(first.next_frame(), timeout=1)
+        second_frame = await asyncio.wait_for(second.next_frame(), timeout=1)
+        assert first_frame == second_frame
+
+        await asyncio.sleep(0.1)
+        frame = await first.next_frame()
+        assert frame["tick"] == service.calls
+        assert first.dropped_frames > 0
+
+    assert broadcaster.subscriber_count("cluster-local") == 0
+    calls_after_leave = service.calls
+    await asyncio.sleep(0.05)
+    assert service.calls == calls_after_leave
+
+
+def test_delta_encoder_sends_snapshot_then_patches() -> None:
+    encoder = OverviewDeltaEncoder()
+    first = {"generated_at": "t1", "nodes_ready": 3, "sections": {"pods": {"status": "ok"}}}
+    second = {"generated_at": "t2", "nodes_ready": 3, "sections": {"pods": {"status": "error"}}}
+
+    assert encoder.encode(first) == {"type": "snapshot", "seq": 1, "data": first}
+    assert encoder.encode(second) == {
+        "type": "patch",
+        "seq": 2,
+        "ops": [
+            {"op": "replace", "path": "/generated_at", "value": "t2"},
+            {"op": "replace", "path": "/sections/pods/status", "value": "error"},
+        ],
+    }
+    assert encoder.encode(second) is None
+
+    encoder.request_resync()
+    assert encoder.encode(second) == {"type": "snapshot", "seq": 3, "data": second}
+
+
+async def test_broadcaster_follows_cluster_edits_and_removal() -> None:
+    service = CountingOverviewService()
+    broadcaster = OverviewBroadcaster(service, interval_seconds=0.01)
+    old = SimpleNamespace(cluster_id="prod", k8s_api_url="https://old")
+    new = SimpleNamespace(cluster_id="prod", k8s_api_url="https://new")
+
+    async with broadcaster.subscribe(old) as subscription:
+        await asyncio.wait_for(subscription.next_frame(), timeout=1)
+        await broadcaster.stop_cluster("prod")
+        assert service.forgotten == ["prod"]
+
+        broadcaster.restart_cluster(new)
+        service.clusters.clear()
+        await asyncio.wait_for(subscription.next_frame(), timeout=1)
+        assert {cluster.k8s_api_url for cluster in service.clusters} == {"https://new"}
+
+        broadcaster.close_cluster("prod")
+        assert await asyncio.wait_for(subscription.next_frame(), timeout=1) is None
+        assert broadcaster.subscriber_count("prod") == 0
+    await broadcaster.close()
@@ -0,0 +1,118 @@
+import httpx
+
+from app.collector.prometheus import PrometheusCollector, alert_fingerprint
+from app.core.config import Settings
+
+
+def _collector(handler) -> PrometheusCollector:
+    collector = PrometheusCollector(
+        Settings(use_mock_data=False, prometheus_url="http://prometheus:9090")
+    )
+    collector._pools.transport = httpx.MockTransport(handler)
+    return collector
+
+
+async def test_query_instant_batch_merges_queries_into_one_request() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.params["query"])
+        return httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "data": {
+                    "result": [
+                        {"metric": {"kubeaico_query": "cpu"}, "value": [0, "4"]},
+                        {"metric": {"kubeaico_query": "mem", "namespace": "prod"}, "value": [0, "7"]},
+                    ]
+                },
+            },
+        )
+
+    collector = _collector(handler)
+    results = await collector.query_instant_batch(
+        {"cpu": "sum(machine_cpu_cores)", "mem": "sum(x) by (namespace)"}
+    )
+
+    assert len(seen) == 1
+    assert seen[0] == (
+        'label_replace(sum(machine_cpu_cores), "kubeaico_query", "cpu", "", "")'
+        ' or label_replace(sum(x) by (namespace), "kubeaico_query", "mem", "", "")'
+    )
+    assert results["cpu"] == [{"metric": {}, "value": [0, "4"]}]
+    assert results["mem"] == [{"metric": {"namespace": "prod"}, "value": [0, "7"]}]
+    await collector.close()
+
+
+async def test_query_instant_batch_falls_back_to_parallel_queries() -> None:
+    values = {
+        'sum(rate(container_cpu_usage_seconds_total{container!=""}[5m]))': "3.5",
+        "sum(machine_cpu_cores)": "16",
+        'sum(container_memory_working_set_bytes{container!=""})': "1024",
+        "sum(machine_memory_bytes)": "4096",
+    }
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["query"]
+        seen.append(query)
+        if query not in values:
+            return httpx.Response(400, json={"status": "error", "error": "parse error"})
+        return httpx.Response(
+            200,
+            json={"status": "success", "data": {"result": [{"metric": {}, "value": [0, values[query]]}]}},
+        )
+
+    collector = _collector(handler)
+    usage = await collector.get_cluster_usage()
+
+    assert len(seen) == 5
+    assert usage == {
+        "cpu_usage_cores": 3.5,
+        "cpu_capacity_cores": 16.0,
+        "memory_usage_bytes": 1024.0,
+        "memory_capacity_bytes": 4096.0,
+    }
+    await collector.close()
+
+
+async def test_get_firing_alerts_adds_fingerprints_and_active_since() -> None:
+    labels = {"alertname": "KubePodCrashLooping", "namespace": "prod", "severity": "critical"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert "ALERTS_FOR_STATE" in request.url.params["query"]
+        return httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "data": {
+                    "result": [
+                        {
+                            "metric": {"alertstate": "firing", "kubeaico_query": "firing", **labels},
+                            "value": [1704070000, "1"],
+                        },
+                        {
+                            "metric": {"kubeaico_query": "active_at", **labels},
+                            "value": [1704070000, "1704067200"],
+                        },
+                    ]
+                },
+            },
+        )
+
+    collector = _collector(handler)
+    alerts = await collector.get_firing_alerts()
+
+    assert alerts == [
+        {
+            "name": "KubePodCrashLooping",
+            "severity": "critical",
+            "summary": "Prometheus firing alert",
+            "namespace": "prod",
+            "fingerprint": alert_fingerprint(labels),
+            "active_at": 1704067200.0,
+        }
+    ]
+    assert alert_fingerprint({}) == "cbf29ce484222325"
+    await collector.close()
@@ -0,0 +1,136 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.collector import protobuf
+from app.collector.kubernetes import KubernetesCollector
+from app.core.config import Settings
+
+
+def _varint(value: int) -> bytes:
+    output = bytearray()
+    while value > 0x7F:
+        output.append(value & 0x7F | 0x80)
+        value >>= 7
+    output.append(value)
+    return bytes(output)
+
+
+def _field(number: int, value: int | str | bytes) -> bytes:
+    if isinstance(value, int):
+        return _varint(number << 3) + _varint(value)
+    if isinstance(value, str):
+        value = value.encode()
+    return _varint(number << 3 | 2) + _varint(len(value)) + value
+
+
+def _pod_list() -> bytes:
+    metadata = (
+        _field(1, "web-1")
+        + _field(3, "prod")
+        + _field(8, _field(1, 1704067200))
+        + _field(11, _field(1, "app") + _field(2, "web"))
+        # managedFields (17) is not projected and must be skipped.
+        + _field(17, _field(1, "kubectl"))
+    )
+    spec = _field(1, _field(1, "web")) + _field(10, "worker-1")
+    container = _field(1, "web") + _field(2, _field(1, _field(1, "CrashLoopBackOff"))) + _field(5, 4)
+    status = _field(1, "Running") + _field(2, _field(1, "Ready") + _field(2, "False")) + _field(8, container)
+    pod = _field(1, metadata) + _field(2, spec) + _field(3, status)
+    pod_list = _field(1, _field(2, "99")) + _field(2, pod)
+    unknown = _field(1, _field(1, "v1") + _field(2, "PodList")) + _field(2, pod_list)
+    return protobuf.MAGIC + unknown
+
+
+def test_decode_list_keeps_projected_fields() -> None:
+    decoded = protobuf.decode_list(_pod_list(), "pods")
+
+    assert decoded["metadata"] == {"resourceVersion": "99"}
+    assert decoded["items"] == [
+        {
+            "metadata": {
+                "name": "web-1",
+                "namespace": "prod",
+                "creationTimestamp": "2024-01-01T00:00:00Z",
+                "labels": {"app": "web"},
+            },
+            "spec": {"nodeName": "worker-1"},
+            "status": {
+                "phase": "Running",
+                "conditions": [{"type": "Ready", "status": "False"}],
+                "containerStatuses": [
+                    {"name": "web", "state": {"waiting": {"reason": "CrashLoopBackOff"}}, "restartCount": 4}
+                ],
+            },
+        }
+    ]
+
+
+@pytest.mark.parametrize("body", [b'{"items": []}', _pod_list()[:-5]])
+def test_decode_list_rejects_malformed_bodies(body: bytes) -> None:
+    with pytest.raises(ValueError):
+        protobuf.decode_list(body, "pods")
+
+
+@pytest.mark.parametrize("clusters", [[], ["default"]])
+async def test_list_resources_negotiates_protobuf_for_opted_in_clusters(clusters: list[str]) -> None:
+    accepts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        accepts.append(request.headers["Accept"])
+        if request.headers["Accept"].startswith(protobuf.CONTENT_TYPE):
+            return httpx.Response(200, content=_pod_list(), headers={"Content-Type": protobuf.CONTENT_TYPE})
+        return httpx.Response(200, json={"metadata": {}, "items": [{"metadata": {"name": "web-1"}}]})
+
+    collector = KubernetesCollector(
+        Settings(
+            use_mock_data=False,
+            k8s_api_url="https://k8s.example.com:6443",
+            k8s_informer_enabled=False,
+            k8s_protobuf_clusters=clusters,
+        )
+    )
+    collector._pools.transport = httpx.MockTransport(handler)
+    items = await collector.list_resources("pod")
+
+    assert items[0]["metadata"]["name"] == "web-1"
+    assert accepts[0].startswith(protobuf.CONTENT_TYPE) == bool(clusters)
+    if clusters:
+        assert items[0]["spec"] == {"nodeName": "worker-1"}
+    await collector.close()
+
+
+async def test_record_only_informers_relist_over_protobuf() -> None:
+    accepts: dict[str, str] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("watch"):
+            await asyncio.sleep(3600)
+        accepts[request.url.path] = request.headers["Accept"]
+        if request.url.path == "/api/v1/nodes":
+            ready = _field(1, "Ready") + _field(2, "True")
+            node = _field(1, _field(1, "worker-1")) + _field(3, _field(4, ready))
+            node_list = _field(1, _field(2, "5")) + _field(2, node)
+            body = protobuf.MAGIC + _field(1, _field(2, "NodeList")) + _field(2, node_list)
+            headers = {"Content-Type": protobuf.CONTENT_TYPE}
+            return httpx.Response(200, content=body, headers=headers)
+        return httpx.Response(200, json={"metadata": {"resourceVersion": "5"}, "items": []})
+
+    collector = KubernetesCollector(
+        Settings(
+            use_mock_data=False,
+            k8s_api_url="https://k8s.example.com:6443",
+            k8s_protobuf_enabled=True,
+        )
+    )
+    collector._pools.transport = httpx.MockTransport(handler)
+
+    nodes = await collector.list_node_records()
+    await collector.list_pods()
+
+    assert [(node.name, node.ready) for node in nodes] == [("worker-1", True)]
+    assert accepts["/api/v1/nodes"].startswith(protobuf.CONTENT_TYPE)
+    # The pod store serves manifests, so its relist keeps the full JSON objects.
+    assert accepts["/api/v1/pods"] == "application/json"
+    await collector.close()
@@ -0,0 +1,45 @@
+from app.collector.range_cache import RangeQueryCache
+
+
+def _fetcher(calls: list[tuple[int, int]], step: int):
+    async def fetch(start: int, end: int) -> list[dict]:
+        calls.append((start, end))
+        return [
+            {
+                "metric": {"pod": "web"},
+                "values": [[ts, str(ts)] for ts in range(start, end + 1, step)],
+            }
+        ]
+
+    return fetch
+
+
+async def test_range_cache_fetches_only_the_missing_tail() -> None:
+    cache = RangeQueryCache(overlap_steps=2)
+    calls: list[tuple[int, int]] = []
+    fetch = _fetcher(calls, step=60)
+
+    first = await cache.query("cpu", 1_000, 4_630, 60, fetch)
+    assert calls == [(960, 4_620)]
+    assert first[0]["values"][0] == [960, "960"]
+    assert first[0]["values"][-1] == [4_620, "4620"]
+
+    second = await cache.query("cpu", 1_130, 4_760, 60, fetch)
+    assert calls[-1] == (4_500, 4_740)
+    values = second[0]["values"]
+    assert values[0][0] == 1_080
+    assert values[-1][0] == 4_740
+    assert len(values) == (4_740 - 1_080) // 60 + 1
+
+
+async def test_range_cache_evicts_least_recently_used_entries() -> None:
+    cache = RangeQueryCache(max_points=100)
+    calls: list[tuple[int, int]] = []
+    fetch = _fetcher(calls, step=60)
+
+    await cache.query("a", 0, 60 * 60, 60, fetch)
+    await cache.query("b", 0, 60 * 60, 60, fetch)
+
+    assert cache.total_points == 61
+    await cache.query("a", 0, 60 * 60, 60, fetch)
+    assert calls[-1] == (0, 3_600)
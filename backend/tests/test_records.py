@@ -0,0 +1,75 @@
+from app.collector.informer import ResourceStore
+from app.collector.records import EventRecord, NodeRecord, PodRecord, WorkloadRecord
+
+
+def _pod(name: str, waiting: str | None = None, last: str | None = None) -> dict:
+    container = {"restartCount": 2, "state": {}, "lastState": {}}
+    if waiting:
+        container["state"] = {"waiting": {"reason": waiting}}
+    if last:
+        container["lastState"] = {"terminated": {"reason": last}}
+    return {
+        "metadata": {"name": name, "namespace": "prod", "labels": {"app": "web"}},
+        "spec": {"nodeName": "worker-1"},
+        "status": {
+            "phase": "Running",
+            "conditions": [{"type": "Ready", "status": "True"}],
+            "containerStatuses": [container, dict(container)],
+        },
+    }
+
+
+def test_pod_record_precomputes_flags_and_interns_strings() -> None:
+    first = PodRecord.from_object(_pod("web-1", waiting="CrashLoopBackOff"))
+    second = PodRecord.from_object(_pod("web-2", last="OOMKilled"))
+
+    assert first.is_crashloop and not first.is_oomkilled
+    assert second.is_oomkilled and not second.is_crashloop
+    assert first.ready and first.restarts == 4
+    assert first.namespace is second.namespace
+    assert next(iter(first.labels.values())) is next(iter(second.labels.values()))
+    assert not hasattr(first, "__dict__")
+
+
+def test_node_workload_and_event_records() -> None:
+    node = NodeRecord.from_object({"metadata": {"name": "worker-1"}, "status": {"conditions": []}})
+    workload = WorkloadRecord.from_object(
+        "deployment",
+        {"metadata": {"name": "web"}, "spec": {"replicas": 3}, "status": {"readyReplicas": 2}},
+    )
+    event = EventRecord.from_object(
+        {
+            "metadata": {"name": "web.1", "namespace": "prod"},
+            "involvedObject": {"kind": "Pod", "name": "web-1", "namespace": "prod"},
+            "type": "Warning",
+            "reason": "BackOff",
+            "eventTime": "2024-01-01T00:00:00Z",
+        }
+    )
+
+    assert node.ready is False
+    assert (workload.namespace, workload.replicas, workload.ready_replicas) == ("default", 3, 2)
+    assert (event.involved_kind, event.involved_name, event.timestamp) == (
+        "Pod",
+        "web-1",
+        "2024-01-01T00:00:00Z",
+    )
+
+
+def test_resource_store_maintains_records_through_updates() -> None:
+    store = ResourceStore(PodRecord.from_object)
+    store.replace([_pod("web-1"), _pod("web-2")], "1")
+    store.upsert(_pod("web-1", waiting="CrashLoopBackOff"))
+    store.delete({"metadata": {"name": "web-2", "namespace": "prod"}})
+
+    records = store.records("prod")
+    assert [record.name for record in records] == ["web-1"]
+    assert records[0].is_crashloop
+    assert store.records("dev") == []
+    assert store.get("prod", "web-1")["metadata"]["name"] == "web-1"
+
+    compact = ResourceStore(PodRecord.from_object, keep_objects=False)
+    crashing = _pod("web-2", waiting="CrashLoopBackOff")
+    compact.replace([_pod("web-1"), crashing], "1")
+    assert compact.get("prod", "web-2") == PodRecord.from_object(crashing)
+    assert [record.name for record in compact.records("prod")] == ["web-1", "web-2"]
@@ -66,3 +66,58 @@ def test_resource_detail_and_audit_logs_flow() -> None:
         audit_payload = audit_resp.json()
         assert audit_payload["total"] >= 1
         assert any(item["action"] == "scale" for item in audit_payload["items"])
+
+
+def test_resource_detail_survives_broken_metrics_query(monkeypatch) -> None:
+    from app.api.deps import get_prometheus_collector
+
+    collector = get_prometheus_collector()
+    original = collector.get_timeseries
+
+    async def broken_timeseries(**kwargs):
+        if kwargs["metric"] == "memory_usage":
+            raise RuntimeError("prometheus exploded")
+        return await original(**kwargs)
+
+    monkeypatch.setattr(collector, "get_timeseries", broken_timeseries)
+    with TestClient(app) as client:
+        token = _login(client)
+        detail_resp = client.get(
+            "/api/v1/resources/deployment/web/detail",
+            params={"namespace": "default"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert detail_resp.status_code == 200
+    series = {item["key"]: item for item in detail_resp.json()["metrics"]["series"]}
+    assert series["memory_usage"]["points"] == []
+    assert series["memory_usage"]["error"] == "prometheus exploded"
+    assert series["cpu_usage"]["error"] is None
+    assert len(series["cpu_usage"]["points"]) > 0
+
+
+def test_resource_detail_survives_failing_event_and_metric_helpers(monkeypatch) -> None:
+    from app.service.resources import ResourceService
+
+    async def broken(*args, **kwargs):
+        raise RuntimeError("helper exploded")
+
+    monkeypatch.setattr(ResourceService, "_load_related_events", broken)
+    monkeypatch.setattr(ResourceService, "_query_profile_series", broken)
+    with TestClient(app) as client:
+        token = _login(client)
+        detail_resp = client.get(
+            "/api/v1/resources/deployment/web/detail",
+            params={"namespace": "default"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert detail_resp.status_code == 200
+    payload = detail_resp.json()
+    assert payload["item"]["name"] == "web"
+    assert payload["events"] == []
+    assert payload["events_error"] == "helper exploded"
+    assert {item["key"] for item in payload["metrics"]["series"]} == {
+        "desired_replicas",
+        "available_replicas",
+    }
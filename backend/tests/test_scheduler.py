@@ -0,0 +1,217 @@
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
+from app.collector.records import EventRecord, PodRecord
+from app.core.config import Settings
+from app.service.alerts import AlertService
+from app.service.cluster import ClusterService
+from app.service.scheduler import CollectionScheduler
+from app.service.snapshots import SnapshotStore
+
+
+class FakeK8sCollector:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+        self.failing: set[str] = set()
+        self.forgotten: list[str] = []
+
+    async def forget_cluster(self, cluster_id: str) -> None:
+        self.forgotten.append(cluster_id)
+
+    async def list_pod_records(self, cluster=None) -> list[PodRecord]:
+        self.calls.append(("pods", cluster.cluster_id))
+        if cluster.cluster_id in self.failing:
+            raise ValueError("apiserver unavailable")
+        return [PodRecord(name="api-0", namespace="default", phase="Running", node_name="n1")]
+
+    async def list_event_records(self, namespace=None, cluster=None) -> list[EventRecord]:
+        self.calls.append(("events", cluster.cluster_id))
+        return [
+            EventRecord(
+                name="api-0.1",
+                namespace="shop",
+                type="Warning",
+                reason="BackOff",
+                message="restarting",
+                timestamp="2026-01-01T00:00:00Z",
+            )
+        ]
+
+
+class FakePrometheusCollector:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.forgotten: list[str] = []
+
+    async def forget_cluster(self, cluster_id: str) -> None:
+        self.forgotten.append(cluster_id)
+
+    async def get_firing_alerts(self, cluster=None) -> list[dict]:
+        self.calls += 1
+        return []
+
+
+class FakeClusterRepository:
+    def __init__(self, clusters: list) -> None:
+        self.clusters = clusters
+
+    async def list(self, db) -> list:
+        return self.clusters
+
+    async def get(self, db, cluster_pk: int):
+        return next((cluster for cluster in self.clusters if cluster.id == cluster_pk), None)
+
+    async def update(self, db, row, payload):
+        changes = {key: value for key, value in vars(payload).items() if value is not None}
+        updated = SimpleNamespace(**{**vars(row), **changes})
+        self.clusters = [updated if cluster is row else cluster for cluster in self.clusters]
+        return updated
+
+    async def delete(self, db, row) -> None:
+        self.clusters.remove(row)
+
+
+async def test_scheduler_refreshes_snapshots_and_backs_off_failing_clusters() -> None:
+    healthy = SimpleNamespace(cluster_id="healthy", is_active=True)
+    broken = SimpleNamespace(cluster_id="broken", is_active=True)
+    disabled = SimpleNamespace(cluster_id="off", is_active=False)
+    repo = FakeClusterRepository([healthy, broken, disabled])
+    k8s = FakeK8sCollector()
+    k8s.failing.add("broken")
+    store = SnapshotStore()
+    scheduler = CollectionScheduler(
+        k8s,
+        FakePrometheusCollector(),
+        store,
+        repo,
+        contextlib.nullcontext,
+        intervals={"pods": 0.02},
+        include_default=False,
+        jitter_ratio=0,
+        max_backoff_seconds=10,
+    )
+
+    await scheduler.sync_clusters()
+    await asyncio.sleep(0.2)
+
+    assert store.get(healthy, "pods").value[0].name == "api-0"
+    assert store.get(healthy, "pods").version > 1
+    assert store.get(broken, "pods") is None
+    status = store.stats()
+    assert status["healthy"]["pods"]["consecutive_failures"] == 0
+    assert status["broken"]["pods"]["last_error"] == "apiserver unavailable"
+    # Backoff doubles the delay after each failure, so the broken cluster is polled far less often.
+    assert k8s.calls.count(("pods", "broken")) <= 3 < k8s.calls.count(("pods", "healthy"))
+    assert "off" not in status
+
+    repo.clusters = [healthy]
+    await scheduler.sync_clusters()
+    assert "broken" not in store.stats()
+    assert k8s.forgotten == ["broken"]
+    await scheduler.close()
+
+
+async def test_scheduler_keeps_polling_through_long_outages() -> None:
+    broken = SimpleNamespace(cluster_id="broken", is_active=True)
+    k8s = FakeK8sCollector()
+    k8s.failing.add("broken")
+    store = SnapshotStore()
+    for _ in range(1100):
+        store.record_failure("broken", "pods", "apiserver unavailable")
+    scheduler = CollectionScheduler(
+        k8s,
+        FakePrometheusCollector(),
+        store,
+        FakeClusterRepository([broken]),
+        contextlib.nullcontext,
+        intervals={"pods": 0.01},
+        include_default=False,
+        jitter_ratio=0,
+        max_backoff_seconds=0.01,
+    )
+
+    await scheduler.sync_clusters()
+    await asyncio.sleep(0.1)
+
+    assert k8s.calls.count(("pods", "broken")) >= 3
+    assert not scheduler._tasks[("broken", "pods")].done()
+    assert store.stats()["broken"]["pods"]["consecutive_failures"] > 1100
+    await scheduler.close()
+
+
+async def test_cluster_edits_reach_the_scheduler_before_the_collectors() -> None:
+    repo = FakeClusterRepository(
+        [SimpleNamespace(id=1, cluster_id="prod", is_active=True, url="https://old")]
+    )
+    k8s = FakeK8sCollector()
+    prometheus = FakePrometheusCollector()
+    store = SnapshotStore()
+    scheduler = CollectionScheduler(
+        k8s,
+        prometheus,
+        store,
+        repo,
+        contextlib.nullcontext,
+        intervals={"pods": 0.01},
+        include_default=False,
+        cluster_refresh_seconds=3600,
+    )
+    seen: list[str] = []
+
+    async def list_pod_records(cluster=None) -> list[PodRecord]:
+        seen.append(cluster.url)
+        await asyncio.sleep(0)
+        return []
+
+    k8s.list_pod_records = list_pod_records
+    scheduler.start()
+    await asyncio.sleep(0.05)
+    assert seen and set(seen) == {"https://old"}
+
+    async def forget(cluster_id: str) -> None:
+        # Pollers for the cluster are already gone when the collectors drop their state.
+        assert ("prod", "pods") not in scheduler._tasks
+        k8s.forgotten.append(cluster_id)
+
+    k8s.forget_cluster = forget
+    service = ClusterService(
+        repo,
+        k8s,
+        prometheus,
+        Settings(),
+        SimpleNamespace(forget_cluster=lambda cluster_id: None),
+        store,
+        scheduler,
+    )
+    service._to_read = lambda row: row
+
+    payload = SimpleNamespace(cluster_id=None, name=None, url="https://new")
+    await service.update_cluster(None, 1, payload)
+    seen.clear()
+    await asyncio.sleep(0.05)
+    assert seen and set(seen) == {"https://new"}
+
+    await service.delete_cluster(None, 1)
+    assert "prod" not in store.stats()
+    assert not scheduler._tasks
+    assert k8s.forgotten == ["prod", "prod"]
+    await scheduler.close()
+
+
+async def test_alert_service_reads_events_and_alerts_from_snapshots() -> None:
+    cluster = SimpleNamespace(cluster_id="prod")
+    k8s = FakeK8sCollector()
+    prometheus = FakePrometheusCollector()
+    store = SnapshotStore()
+    service = AlertService(k8s, prometheus, store)
+
+    live = await service.get_alerts(cluster=cluster)
+    assert live.total == 1
+    assert (k8s.calls, prometheus.calls) == ([("events", "prod")], 1)
+
+    store.put("prod", "events", [], max_age=60)
+    store.put("prod", "alerts", [], max_age=60)
+    cached = await service.get_alerts(cluster=cluster)
+    assert cached.total == 0
+    assert (len(k8s.calls), prometheus.calls) == (1, 1)
@@ -0,0 +1,60 @@
+import pytest
+
+from app.collector.informer import ResourceStore
+from app.collector.selectors import LabelIndex, parse_label_selector
+
+
+def test_parse_label_selector_supports_set_based_terms() -> None:
+    selector = parse_label_selector("app in (web, api),tier!=cache,!canary,release,replicas>2")
+
+    assert selector.matches({"app": "web", "tier": "frontend", "release": "1", "replicas": "3"})
+    assert not selector.matches({"app": "web", "tier": "cache", "release": "1", "replicas": "3"})
+    assert not selector.matches({"app": "api", "release": "1", "canary": "true", "replicas": "3"})
+    assert not selector.matches({"app": "api", "replicas": "3"})
+    assert not selector.matches({"app": "api", "release": "1", "replicas": "2"})
+    assert parse_label_selector("app=").matches({"app": ""})
+    assert parse_label_selector("").empty
+
+
+@pytest.mark.parametrize("selector", ["app in (web", "=web", "app==web,", "replicas>two"])
+def test_parse_label_selector_rejects_invalid_input(selector: str) -> None:
+    with pytest.raises(ValueError):
+        parse_label_selector(selector)
+
+
+def test_label_index_matches_linear_scan() -> None:
+    labels = {
+        1: {"app": "web", "tier": "frontend"},
+        2: {"app": "api", "tier": "backend"},
+        3: {"app": "web", "tier": "backend", "canary": "true"},
+        4: {},
+    }
+    index = LabelIndex()
+    for key, value in labels.items():
+        index.add(key, value)
+    index.add(2, {"app": "api", "tier": "backend", "release": "stable"})
+    labels[2] = {"app": "api", "tier": "backend", "release": "stable"}
+
+    for raw in ["app=web", "tier notin (frontend)", "!canary", "app,release", "app!=web,tier=backend", ""]:
+        selector = parse_label_selector(raw)
+        assert index.select(selector) == {key for key, value in labels.items() if selector.matches(value)}
+
+    index.remove(3)
+    assert index.select(parse_label_selector("app=web")) == {1}
+
+
+def test_resource_store_select_filters_by_namespace() -> None:
+    store = ResourceStore()
+    store.replace(
+        [
+            {"metadata": {"namespace": "prod", "name": "web", "labels": {"app": "web"}}},
+            {"metadata": {"namespace": "dev", "name": "web", "labels": {"app": "web"}}},
+            {"metadata": {"namespace": "prod", "name": "db", "labels": {"app": "db"}}},
+        ],
+        "1",
+    )
+    store.delete({"metadata": {"namespace": "dev", "name": "web"}})
+
+    selected = store.select(parse_label_selector("app in (web,db)"), namespace="prod")
+    assert [item["metadata"]["name"] for item in selected] == ["db", "web"]
+    assert store.select(parse_label_selector("app=web")) == [store.get("prod", "web")]
@@ -0,0 +1,57 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.collector.kubernetes import KubernetesCollector
+from app.collector.singleflight import SingleFlight
+from app.core.config import Settings
+
+
+async def test_single_flight_shares_one_call_and_its_error() -> None:
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch() -> dict:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"calls": calls}
+
+    waiters = [asyncio.create_task(flight.do("key", fetch)) for _ in range(10)]
+    await asyncio.sleep(0)
+    waiters[0].cancel()
+    release.set()
+    results = await asyncio.gather(*waiters[1:])
+
+    assert calls == 1
+    assert all(result == {"calls": 1} for result in results)
+    assert flight.stats() == {"hits": 9, "misses": 1, "in_flight": 0}
+
+    async def broken() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await asyncio.gather(flight.do("broken", broken), flight.do("broken", broken))
+    assert flight.misses == 2
+
+
+async def test_collector_coalesces_concurrent_identical_gets() -> None:
+    requests: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"metadata": {"resourceVersion": "1"}, "items": []})
+
+    collector = KubernetesCollector(
+        Settings(use_mock_data=False, k8s_api_url="https://k8s:6443", k8s_informer_enabled=False)
+    )
+    collector._pools.transport = httpx.MockTransport(handler)
+
+    await asyncio.gather(*(collector.list_events() for _ in range(20)), collector.list_pods())
+
+    assert len(requests) == 2
+    assert collector.stats()["single_flight"]["hits"] == 19
+    await collector.close()
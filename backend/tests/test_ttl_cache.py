@@ -0,0 +1,94 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import orjson
+
+from app.collector.kubernetes import KubernetesCollector
+from app.collector.ttl_cache import TTLCache, approximate_size, cache_bypass
+from app.core.config import Settings
+
+
+async def test_cache_serves_stale_value_while_one_refresh_runs() -> None:
+    cache = TTLCache(stale_seconds=60)
+    calls = 0
+    release = asyncio.Event()
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            await release.wait()
+        return calls
+
+    assert await cache.get_or_load("key", 30, load) == 1
+    assert await cache.get_or_load("key", 30, load) == 1
+    cache._entries["key"].expires_at -= 31
+
+    assert await cache.get_or_load("key", 30, load) == 1
+    assert await cache.get_or_load("key", 30, load) == 1
+    release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert calls == 2
+    assert await cache.get_or_load("key", 30, load) == 2
+    assert cache.stats()["stale_hits"] == 2
+
+
+async def test_cache_evicts_least_recently_used_by_size_and_honours_bypass() -> None:
+    cache = TTLCache(max_bytes=30)
+    cache.set("a", "x" * 10, ttl=30)
+    cache.set("b", "y" * 10, ttl=30)
+    assert await cache.get_or_load("a", 30, lambda: asyncio.sleep(0, "unused")) == "x" * 10
+    cache.set("c", "z" * 10, ttl=30)
+
+    assert set(cache._entries) == {"a", "c"}
+    assert cache.size_bytes <= 30
+
+    token = cache_bypass.set(True)
+    try:
+        assert await cache.get_or_load("a", 30, lambda: asyncio.sleep(0, "fresh")) == "fresh"
+    finally:
+        cache_bypass.reset(token)
+    assert await cache.get_or_load("a", 30, lambda: asyncio.sleep(0, "unused")) == "fresh"
+
+
+async def test_collector_reads_are_cached_per_cluster_and_invalidated_by_writes() -> None:
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(f"{request.method} {request.url.host}")
+        return httpx.Response(200, json={"items": []})
+
+    collector = KubernetesCollector(Settings(use_mock_data=False, k8s_informer_enabled=False))
+    collector._pools.transport = httpx.MockTransport(handler)
+    prod = SimpleNamespace(cluster_id="prod", k8s_api_url="https://prod:6443", k8s_bearer_token=None)
+    dev = SimpleNamespace(cluster_id="dev", k8s_api_url="https://dev:6443", k8s_bearer_token=None)
+    probe = SimpleNamespace(k8s_api_url="https://probe:6443", k8s_bearer_token=None)
+
+    for _ in range(3):
+        await collector.list_nodes(cluster=prod)
+        await collector.list_nodes(cluster=dev)
+        await collector.list_nodes(cluster=probe)
+    assert requests.count("GET prod") == 1
+    assert requests.count("GET dev") == 1
+    assert requests.count("GET probe") == 3
+
+    await collector.scale_workload("deployment", "web", "default", 2, cluster=prod)
+    await collector.list_nodes(cluster=prod)
+    await collector.list_nodes(cluster=dev)
+    assert requests.count("GET prod") == 2
+    assert requests.count("GET dev") == 1
+    await collector.close()
+
+
+def test_approximate_size_extrapolates_long_lists_from_a_sample() -> None:
+    pods = [
+        {"metadata": {"name": f"pod-{index:05d}", "namespace": "shop"}, "status": {"phase": "Running"}}
+        for index in range(10_000)
+    ]
+    exact = len(orjson.dumps(pods))
+
+    assert abs(approximate_size(pods) - exact) / exact < 0.05
+    assert approximate_size("x" * 10) == len(orjson.dumps("x" * 10))
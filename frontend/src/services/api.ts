@@ -6,6 +6,7 @@ import type {
   AlertListResponse,
   ClusterSummary,
   ClusterConnectionTestResponse,
+  JsonPatchOp,
   LoginResponse,
   ManagedCluster,
   ManagedClusterListResponse,
@@ -95,6 +96,9 @@ export async function getResources(params: {
   namespace?: string
   label_selector?: string
   status?: string
+  node?: string
+  limit?: number
+  cursor?: string
   cluster_id?: string
 }): Promise<WorkloadListResponse> {
   const { kind, ...query } = params
@@ -231,7 +235,7 @@ export async function getAnalyzeTask(taskId: number): Promise<AIAnalyzeTaskRead>
   return data
 }
 
-export function getWsOverviewUrl(token: string, clusterId?: string): string {
+export function getWsOverviewUrl(token: string, clusterId?: string, mode?: 'full' | 'delta'): string {
   const base =
     import.meta.env.VITE_OVERVIEW_WS_URL ??
     'ws://localhost:8000/ws/overview'
@@ -239,5 +243,32 @@ export function getWsOverviewUrl(token: string, clusterId?: string): string {
   if (clusterId) {
     params.set('cluster_id', clusterId)
   }
+  if (mode) {
+    params.set('mode', mode)
+  }
   return `${base}?${params.toString()}`
 }
+
+export function applyJsonPatch<T>(target: T, ops: JsonPatchOp[]): T {
+  const root = JSON.parse(JSON.stringify(target)) as Record<string, unknown>
+  for (const op of ops) {
+    const keys = op.path
+      .split('/')
+      .slice(1)
+      .map((key) => key.replace(/~1/g, '/').replace(/~0/g, '~'))
+    const last = keys.pop()
+    if (last === undefined) {
+      continue
+    }
+    let parent = root
+    for (const key of keys) {
+      parent = parent[key] as Record<string, unknown>
+    }
+    if (op.op === 'remove') {
+      delete parent[last]
+    } else {
+      parent[last] = op.value
+    }
+  }
+  return root as T
+}
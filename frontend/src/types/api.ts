@@ -25,6 +25,12 @@ export interface NamespaceUsage {
   pod_count: number
 }
 
+export interface SummarySection {
+  status: 'ok' | 'stale' | 'error'
+  error?: string
+  updated_at?: string
+}
+
 export interface ClusterSummary {
   cluster_id: string
   generated_at: string
@@ -41,8 +47,20 @@ export interface ClusterSummary {
   alerts_count: number
   risk_score: number
   top_namespaces: NamespaceUsage[]
+  partial: boolean
+  sections: Record<string, SummarySection>
 }
 
+export interface JsonPatchOp {
+  op: 'add' | 'remove' | 'replace'
+  path: string
+  value?: unknown
+}
+
+export type OverviewStreamMessage =
+  | { type: 'snapshot'; seq: number; data: ClusterSummary }
+  | { type: 'patch'; seq: number; ops: JsonPatchOp[] }
+
 export interface TimeseriesPoint {
   ts: number
   value: number
@@ -76,6 +94,10 @@ export interface WorkloadListResponse {
   kind: ResourceKind
   total: number
   items: WorkloadItem[]
+  next_cursor?: string
+  total_estimate?: number
+  server_side_filters: string[]
+  local_filters: string[]
 }
 
 export interface ResourceEvent {
@@ -95,6 +117,7 @@ export interface ResourceMetricSeries {
   label: string
   unit: string
   points: ResourceMetricPoint[]
+  error?: string
 }
 
 export interface ResourceMetricsPanel {
@@ -107,6 +130,7 @@ export interface ResourceDetailResponse {
   item: WorkloadItem
   manifest: Record<string, unknown>
   events: ResourceEvent[]
+  events_error?: string
   metrics?: ResourceMetricsPanel
 }
 